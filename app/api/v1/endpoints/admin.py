@@ -5,9 +5,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from datetime import datetime, timedelta
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db, get_pool_stats
+from app.db.query_stats import route_query_totals
 from app.db.models import Appointment, ContactMessage, User, Doctor, Department, Service
 from app.core.dependencies import get_current_admin_user
+from app.core.hashing import password_hasher
+from app.core.principal_cache import principal_cache
+from app.core.slot_cache import slot_cache
+from app.core.token_cache import token_cache
+from app.core.revocation import token_revocations
+from app.core.rate_limit import rate_limiter
+from app.crud.user import user as crud_user
 from app.core.constants import AppointmentStatus
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -16,7 +24,7 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 @router.get("/dashboard")
 async def get_dashboard_stats(
     current_user = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get dashboard statistics (admin only)"""
     
@@ -113,7 +121,7 @@ async def get_dashboard_stats(
 async def get_appointment_stats(
     days: int = Query(30, ge=1, le=365),
     current_user = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get appointment statistics (admin only)"""
     
@@ -158,7 +166,7 @@ async def get_appointment_stats(
 @router.get("/users/stats")
 async def get_user_stats(
     current_user = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get user statistics (admin only)"""
     
@@ -209,7 +217,7 @@ async def get_user_stats(
 @router.get("/messages/stats")
 async def get_message_stats(
     current_user = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get contact message statistics (admin only)"""
     
@@ -251,5 +259,34 @@ async def get_system_health(
     return {
         "api_status": "operational",
         "database_status": db_status,
+        "password_hashing": password_hasher.stats(),
+        "principal_cache": principal_cache.stats(),
+        "slot_cache": slot_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "token_revocations": token_revocations.stats(),
+        "rate_limiter": rate_limiter.stats(),
+        "phone_filter": {"loaded": crud_user.phone_filter_loaded, **crud_user.phone_filter.stats()},
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+@router.get("/system/db-pool")
+async def get_db_pool_stats(
+    current_user = Depends(get_current_admin_user)
+):
+    """Get database connection pool statistics for this worker (admin only)"""
+    return {
+        **get_pool_stats(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+@router.get("/system/queries")
+async def get_query_stats(
+    current_user = Depends(get_current_admin_user)
+):
+    """Get SQL statements per request by route for this worker (admin only)"""
+    return {
+        "routes": route_query_totals.snapshot(),
         "timestamp": datetime.utcnow().isoformat()
     }
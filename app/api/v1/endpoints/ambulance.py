@@ -1,50 +1,103 @@
 """Ambulance Service endpoints"""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.schemas.ambulance import (
     AmbulanceServiceCreate,
     AmbulanceServiceUpdate,
+    AmbulanceServiceBatchUpdate,
     AmbulanceServiceResponse,
 )
+from app.schemas.batch import BatchDelete, BatchDeleteResponse
 from app.crud.ambulance import ambulance_service as crud_ambulance
 from app.core.dependencies import get_current_admin_user
 from app.core.exceptions import NotFoundException, ConflictException
-from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MAX_BATCH_SIZE
+from app.core.pagination import with_next_cursor
 
 router = APIRouter(prefix="/ambulance-services", tags=["ambulance-services"])
 
 
 @router.get("", response_model=list[AmbulanceServiceResponse])
 async def list_ambulance_services(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     active_only: bool = Query(True),
     available_24_7: bool = Query(False),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List all ambulance services
     
     - **skip**: Number of records to skip
     - **limit**: Number of records to return
+    - **cursor**: next_cursor from the previous page (instead of skip)
     - **active_only**: Return only active services
     - **available_24_7**: Return only 24/7 available services
     """
     if available_24_7:
-        services, _ = await crud_ambulance.get_available_24_7(db, skip=skip, limit=limit)
+        page = await crud_ambulance.get_available_24_7(db, skip=skip, limit=limit, include_total=False, cursor=cursor, response_model=AmbulanceServiceResponse)
     else:
         filters = {"is_active": True} if active_only else None
-        services, _ = await crud_ambulance.get_all(db, skip=skip, limit=limit, filters=filters)
-    return services
+        page = await crud_ambulance.get_page(db, skip=skip, limit=limit, filters=filters, include_total=False, cursor=cursor, response_model=AmbulanceServiceResponse)
+    return with_next_cursor(response, page)
+
+
+@router.post("/batch", response_model=list[AmbulanceServiceResponse], status_code=201)
+async def create_ambulance_services_batch(
+    services_in: list[AmbulanceServiceCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many ambulance services in one transaction (admin only)
+    
+    If any item fails, nothing is created and the 422 response lists the
+    failing items by index.
+    """
+    return await crud_ambulance.bulk_create(db, services_in)
+
+
+@router.put("/batch", response_model=list[AmbulanceServiceResponse])
+async def update_ambulance_services_batch(
+    services_in: list[AmbulanceServiceBatchUpdate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Update many ambulance services in one transaction (admin only)
+    
+    Each item carries the id and the fields to change. If any item fails,
+    nothing is updated and the 422 response lists the failing items.
+    """
+    return await crud_ambulance.bulk_update(db, [(item.id, item) for item in services_in])
+
+
+@router.post("/batch/delete", response_model=BatchDeleteResponse)
+async def delete_ambulance_services_batch(
+    batch: BatchDelete,
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Delete many ambulance services in one transaction (admin only)
+    
+    If any id does not exist, nothing is deleted and the 422 response lists
+    the missing ids.
+    """
+    deleted = await crud_ambulance.bulk_delete(db, batch.ids)
+    return {"deleted": deleted}
 
 
 @router.get("/{service_id}", response_model=AmbulanceServiceResponse)
 async def get_ambulance_service(
     service_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get ambulance service details"""
     service = await crud_ambulance.get(db, service_id)
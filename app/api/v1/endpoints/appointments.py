@@ -1,8 +1,9 @@
 """Appointment endpoints"""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
+from typing import Optional
 
 from app.db.session import get_db
 from app.schemas.appointment import (
@@ -13,11 +14,10 @@ from app.schemas.appointment import (
     AppointmentListResponse,
 )
 from app.crud.appointment import appointment as crud_appointment
-from app.crud.department import department as crud_department
-from app.crud.doctor import doctor as crud_doctor
 from app.core.dependencies import get_current_user, get_current_admin_user
-from app.core.exceptions import NotFoundException, ValidationException, ConflictException
+from app.core.exceptions import NotFoundException, ValidationException
 from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, AppointmentStatus
+from app.core.pagination import with_next_cursor
 
 router = APIRouter(prefix="/appointments", tags=["appointments"])
 
@@ -28,28 +28,13 @@ async def create_appointment(
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Create new appointment"""
-    # Verify department exists
-    department = await crud_department.get(db, appointment_in.department_id)
-    if not department:
-        raise NotFoundException(detail="Department not found")
-    
-    # Verify doctor if provided
-    if appointment_in.doctor_id:
-        doctor = await crud_doctor.get(db, appointment_in.doctor_id)
-        if not doctor:
-            raise NotFoundException(detail="Doctor not found")
-        
-        # Check availability
-        is_available = await crud_appointment.check_availability(
-            db,
-            appointment_in.doctor_id,
-            appointment_in.appointment_date,
-            appointment_in.appointment_time
-        )
-        if not is_available:
-            raise ConflictException(detail="Doctor is not available at this time")
+    """
+    Create new appointment
     
+    The department must exist and be active, the doctor must exist and the
+    doctor's slot must be free (409 otherwise); the booking is a single statement, so two requests
+    cannot take the same slot.
+    """
     # Create appointment with patient_id from current user
     appointment = await crud_appointment.create(
         db,
@@ -63,33 +48,38 @@ async def create_appointment(
 @router.get("/patient/{patient_id}", response_model=list[AppointmentResponse])
 async def get_patient_appointments(
     patient_id: int,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     current_user = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get appointments for a patient (admin only)"""
-    appointments = await crud_appointment.get_by_patient(db, patient_id, skip, limit)
-    return appointments
+    page = await crud_appointment.get_by_patient(db, patient_id, skip, limit, cursor=cursor, response_model=AppointmentResponse)
+    return with_next_cursor(response, page)
 
 
 @router.get("/doctor/{doctor_id}", response_model=list[AppointmentResponse])
 async def get_doctor_appointments(
     doctor_id: int,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     current_user = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get appointments for a doctor (admin only)"""
-    appointments = await crud_appointment.get_by_doctor(db, doctor_id, skip, limit)
-    return appointments
+    page = await crud_appointment.get_by_doctor(db, doctor_id, skip, limit, cursor=cursor, response_model=AppointmentResponse)
+    return with_next_cursor(response, page)
 
 
 @router.get("", response_model=AppointmentListResponse)
 async def list_appointments(
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     status: str = Query(None),
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -99,6 +89,7 @@ async def list_appointments(
     
     - **skip**: Number of records to skip
     - **limit**: Number of records to return
+    - **cursor**: next_cursor from the previous page (instead of skip)
     - **status**: Filter by status
     
     Regular users see only their appointments, admins see all
@@ -112,13 +103,14 @@ async def list_appointments(
     if status:
         filters["status"] = status
     
-    appointments, total = await crud_appointment.get_all(db, skip, limit, filters)
+    page = await crud_appointment.get_page(db, skip, limit, filters, estimated_total=True, cursor=cursor, response_model=AppointmentResponse)
     
     return AppointmentListResponse(
-        total=total,
+        total=page.total,
         page=skip // limit + 1,
         page_size=limit,
-        items=appointments
+        items=page.items,
+        next_cursor=page.next_cursor
     )
 
 
@@ -129,7 +121,7 @@ async def get_appointment(
     db: AsyncSession = Depends(get_db)
 ):
     """Get appointment details"""
-    appointment = await crud_appointment.get(db, appointment_id)
+    appointment = await crud_appointment.get(db, appointment_id, load=("patient", "doctor.user", "department"))
     if not appointment:
         raise NotFoundException(detail="Appointment not found")
     
@@ -137,7 +129,7 @@ async def get_appointment(
     if not current_user.is_admin and appointment.patient_id != current_user.id:
         raise NotFoundException(detail="Appointment not found")
     
-    # Get related info
+    # Related info, loaded with the appointment
     patient = appointment.patient
     doctor = appointment.doctor
     dept = appointment.department
@@ -2,6 +2,8 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from typing import Optional
 
 from app.db.session import get_db
 from app.schemas.user import (
@@ -17,19 +19,22 @@ from app.crud.user import user as crud_user
 from app.core.security import (
     SecurityUtils,
     TokenUtils,
+    oauth2_scheme,
 )
 from app.core.dependencies import get_current_user
+from app.core.rate_limit import rate_limit
 from app.core.exceptions import (
     ValidationException,
     AuthenticationException,
     ConflictException,
+    ServiceUnavailableException,
 )
 from app.core.constants import ErrorMessages, SuccessMessages
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/register", response_model=TokenResponse, status_code=201)
+@router.post("/register", response_model=TokenResponse, status_code=201, dependencies=[Depends(rate_limit("register", by_phone=True))])
 async def register(
     user_in: UserCreate,
     db: AsyncSession = Depends(get_db)
@@ -66,16 +71,23 @@ async def register(
         if not is_valid:
             raise ValidationException(detail=message)
         
-        # Check if user already exists
-        existing_user = await crud_user.get_by_phone(db, user_in.phone)
-        if existing_user:
-            raise ConflictException(detail=ErrorMessages.USER_ALREADY_EXISTS)
+        # Fail fast (before hashing) only when the phone may already be
+        # registered; new numbers go straight to the insert
+        if crud_user.phone_may_exist(user_in.phone):
+            existing_user = await crud_user.get_by_phone(db, user_in.phone)
+            if existing_user:
+                raise ConflictException(detail=ErrorMessages.USER_ALREADY_EXISTS)
         
-        # Create user
-        user = await crud_user.create(db, user_in)
+        # Create user; the unique indexes on phone/email catch duplicates
+        try:
+            user = await crud_user.create(db, user_in)
+        except IntegrityError as e:
+            if "email" in str(e.orig).lower():
+                raise ConflictException(detail=ErrorMessages.EMAIL_ALREADY_EXISTS)
+            raise ConflictException(detail=ErrorMessages.USER_ALREADY_EXISTS)
         
         # Create tokens
-        tokens = TokenUtils.create_tokens(user.id, user.phone)
+        tokens = TokenUtils.create_tokens(user.id, user.phone, TokenUtils.role_claims(user))
         
         return TokenResponse(
             access_token=tokens["access_token"],
@@ -83,13 +95,13 @@ async def register(
             token_type=tokens["token_type"],
             user=UserResponse.from_orm(user),
         )
-    except (ValidationException, ConflictException, AuthenticationException):
+    except (ValidationException, ConflictException, AuthenticationException, ServiceUnavailableException):
         raise
     except Exception as e:
         raise ValidationException(detail=f"Registration failed: {str(e)}")
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post("/login", response_model=TokenResponse, dependencies=[Depends(rate_limit("login", by_phone=True))])
 async def login(
     credentials: UserLogin,
     db: AsyncSession = Depends(get_db)
@@ -114,7 +126,7 @@ async def login(
         raise AuthenticationException(detail="User account is inactive")
     
     # Create tokens
-    tokens = TokenUtils.create_tokens(user.id, user.phone)
+    tokens = TokenUtils.create_tokens(user.id, user.phone, TokenUtils.role_claims(user))
     
     return TokenResponse(
         access_token=tokens["access_token"],
@@ -124,7 +136,7 @@ async def login(
     )
 
 
-@router.post("/refresh", response_model=TokenRefreshResponse)
+@router.post("/refresh", response_model=TokenRefreshResponse, dependencies=[Depends(rate_limit("refresh"))])
 async def refresh_token(
     request: RefreshTokenRequest,
     db: AsyncSession = Depends(get_db)
@@ -141,6 +153,9 @@ async def refresh_token(
         if token_type != "refresh":
             raise AuthenticationException(detail="Invalid token type")
         
+        if TokenUtils.is_revoked(payload):
+            raise AuthenticationException(detail=ErrorMessages.TOKEN_REVOKED)
+        
         user_id = int(payload.get("sub"))
         user = await crud_user.get(db, user_id)
         
@@ -149,13 +164,15 @@ async def refresh_token(
         
         # Create new access token
         access_token = TokenUtils.create_access_token(
-            data={"sub": str(user.id), "phone": user.phone}
+            data={"sub": str(user.id), "phone": user.phone, **TokenUtils.role_claims(user)}
         )
         
         return TokenRefreshResponse(
             access_token=access_token,
             token_type="bearer",
         )
+    except AuthenticationException:
+        raise
     except Exception as e:
         raise AuthenticationException(detail=str(e))
 
@@ -168,7 +185,7 @@ async def get_current_user_info(
     return UserResponse.from_orm(current_user)
 
 
-@router.post("/change-password")
+@router.post("/change-password", dependencies=[Depends(rate_limit("change_password"))])
 async def change_password(
     password_change: PasswordChange,
     current_user = Depends(get_current_user),
@@ -190,10 +207,15 @@ async def change_password(
     if not is_valid:
         raise ValidationException(detail=message)
     
+    # current_user is a cached snapshot, so load the row being modified
+    user = await crud_user.get(db, current_user.id)
+    if not user:
+        raise AuthenticationException(detail=ErrorMessages.USER_NOT_FOUND)
+    
     # Change password
     success = await crud_user.change_password(
         db,
-        current_user,
+        user,
         password_change.old_password,
         password_change.new_password
     )
@@ -205,6 +227,18 @@ async def change_password(
 
 
 @router.post("/logout")
-async def logout(current_user = Depends(get_current_user)):
-    """Logout user (client should discard tokens)"""
+async def logout(
+    request: Optional[RefreshTokenRequest] = None,
+    token: Optional[str] = Depends(oauth2_scheme),
+    current_user = Depends(get_current_user)
+):
+    """
+    Logout user and revoke the presented tokens
+    
+    - **refresh_token**: Optional refresh token to revoke as well
+    """
+    await TokenUtils.revoke_token(token)
+    if request and request.refresh_token:
+        await TokenUtils.revoke_token(request.refresh_token)
+    
     return {"message": SuccessMessages.LOGOUT_SUCCESS}
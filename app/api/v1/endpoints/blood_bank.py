@@ -1,54 +1,107 @@
 """Blood Bank endpoints"""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.schemas.blood_bank import (
     BloodBankCreate,
     BloodBankUpdate,
+    BloodBankBatchUpdate,
     BloodBankResponse,
 )
+from app.schemas.batch import BatchDelete, BatchDeleteResponse
 from app.crud.blood_bank import blood_bank as crud_blood_bank
 from app.core.dependencies import get_current_admin_user
 from app.core.exceptions import NotFoundException, ConflictException
-from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MAX_BATCH_SIZE
+from app.core.pagination import with_next_cursor
 
 router = APIRouter(prefix="/blood-banks", tags=["blood-banks"])
 
 
 @router.get("", response_model=list[BloodBankResponse])
 async def list_blood_banks(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     active_only: bool = Query(True),
     available_24_7: bool = Query(False),
     blood_group: str = Query(None),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List all blood banks
     
     - **skip**: Number of records to skip
     - **limit**: Number of records to return
+    - **cursor**: next_cursor from the previous page (instead of skip)
     - **active_only**: Return only active blood banks
     - **available_24_7**: Return only 24/7 available blood banks
     - **blood_group**: Filter by available blood group (e.g., O+, A-, B+, AB-)
     """
     if blood_group:
-        banks, _ = await crud_blood_bank.get_by_blood_group(db, blood_group, skip=skip, limit=limit)
+        page = await crud_blood_bank.get_by_blood_group(db, blood_group, skip=skip, limit=limit, include_total=False, cursor=cursor)
     elif available_24_7:
-        banks, _ = await crud_blood_bank.get_available_24_7(db, skip=skip, limit=limit)
+        page = await crud_blood_bank.get_available_24_7(db, skip=skip, limit=limit, include_total=False, cursor=cursor)
     else:
         filters = {"is_active": True} if active_only else None
-        banks, _ = await crud_blood_bank.get_all(db, skip=skip, limit=limit, filters=filters)
-    return banks
+        page = await crud_blood_bank.get_page(db, skip=skip, limit=limit, filters=filters, include_total=False, cursor=cursor)
+    return with_next_cursor(response, page)
+
+
+@router.post("/batch", response_model=list[BloodBankResponse], status_code=201)
+async def create_blood_banks_batch(
+    banks_in: list[BloodBankCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many blood banks in one transaction (admin only)
+    
+    If any item fails, nothing is created and the 422 response lists the
+    failing items by index.
+    """
+    return await crud_blood_bank.bulk_create(db, banks_in)
+
+
+@router.put("/batch", response_model=list[BloodBankResponse])
+async def update_blood_banks_batch(
+    banks_in: list[BloodBankBatchUpdate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Update many blood banks in one transaction (admin only)
+    
+    Each item carries the id and the fields to change. If any item fails,
+    nothing is updated and the 422 response lists the failing items.
+    """
+    return await crud_blood_bank.bulk_update(db, [(item.id, item) for item in banks_in])
+
+
+@router.post("/batch/delete", response_model=BatchDeleteResponse)
+async def delete_blood_banks_batch(
+    batch: BatchDelete,
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Delete many blood banks in one transaction (admin only)
+    
+    If any id does not exist, nothing is deleted and the 422 response lists
+    the missing ids.
+    """
+    deleted = await crud_blood_bank.bulk_delete(db, batch.ids)
+    return {"deleted": deleted}
 
 
 @router.get("/{bank_id}", response_model=BloodBankResponse)
 async def get_blood_bank(
     bank_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get blood bank details"""
     bank = await crud_blood_bank.get(db, bank_id)
@@ -1,7 +1,8 @@
 """Contact message endpoints"""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
 from app.db.session import get_db
 from app.schemas.contact import (
@@ -14,6 +15,7 @@ from app.crud.contact import contact_message as crud_contact
 from app.core.dependencies import get_current_admin_user
 from app.core.exceptions import NotFoundException
 from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ContactMessageStatus
+from app.core.pagination import with_next_cursor
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
@@ -22,6 +24,7 @@ router = APIRouter(prefix="/contacts", tags=["contacts"])
 async def list_contact_messages(
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     status: str = Query(None),
     current_user = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
@@ -31,19 +34,21 @@ async def list_contact_messages(
     
     - **skip**: Number of records to skip
     - **limit**: Number of records to return
+    - **cursor**: next_cursor from the previous page (instead of skip)
     - **status**: Filter by status (new, read, resolved)
     """
     filters = {}
     if status:
         filters["status"] = status
     
-    messages, total = await crud_contact.get_all(db, skip, limit, filters)
+    page = await crud_contact.get_page(db, skip, limit, filters, cursor=cursor, response_model=ContactMessageResponse)
     
     return ContactMessageListResponse(
-        total=total,
+        total=page.total,
         page=skip // limit + 1,
         page_size=limit,
-        items=messages
+        items=page.items,
+        next_cursor=page.next_cursor
     )
 
 
@@ -102,11 +107,13 @@ async def delete_contact_message(
 @router.get("/email/{email}", response_model=list[ContactMessageResponse])
 async def get_messages_by_email(
     email: str,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     current_user = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get messages by email (admin only)"""
-    messages = await crud_contact.get_by_email(db, email, skip, limit)
-    return messages
+    page = await crud_contact.get_by_email(db, email, skip, limit, cursor=cursor, response_model=ContactMessageResponse)
+    return with_next_cursor(response, page)
@@ -1,55 +1,107 @@
 """Department endpoints"""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.schemas.department import (
     DepartmentCreate,
     DepartmentUpdate,
+    DepartmentBatchUpdate,
     DepartmentResponse,
     DepartmentDetailResponse,
 )
+from app.schemas.batch import BatchDelete, BatchDeleteResponse
 from app.crud.department import department as crud_department
 from app.core.dependencies import get_current_admin_user
 from app.core.exceptions import NotFoundException, ConflictException
-from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MAX_BATCH_SIZE
+from app.core.pagination import with_next_cursor
 
 router = APIRouter(prefix="/departments", tags=["departments"])
 
 
 @router.get("", response_model=list[DepartmentResponse])
 async def list_departments(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     active_only: bool = Query(True),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List all departments
     
     - **skip**: Number of records to skip
     - **limit**: Number of records to return
+    - **cursor**: next_cursor from the previous page (instead of skip)
     - **active_only**: Return only active departments
     """
     filters = {"is_active": True} if active_only else None
-    departments, _ = await crud_department.get_all(db, skip=skip, limit=limit, filters=filters)
-    return departments
+    page = await crud_department.get_page(db, skip=skip, limit=limit, filters=filters, include_total=False, cursor=cursor, response_model=DepartmentResponse)
+    return with_next_cursor(response, page)
+
+
+@router.post("/batch", response_model=list[DepartmentResponse], status_code=201)
+async def create_departments_batch(
+    departments_in: list[DepartmentCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many departments in one transaction (admin only)
+    
+    If any item fails (e.g. a name already taken or repeated in the batch),
+    nothing is created and the 422 response lists the failing items by index.
+    """
+    return await crud_department.bulk_create(db, departments_in)
+
+
+@router.put("/batch", response_model=list[DepartmentResponse])
+async def update_departments_batch(
+    departments_in: list[DepartmentBatchUpdate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Update many departments in one transaction (admin only)
+    
+    Each item carries the id and the fields to change. If any item fails,
+    nothing is updated and the 422 response lists the failing items.
+    """
+    return await crud_department.bulk_update(db, [(item.id, item) for item in departments_in])
+
+
+@router.post("/batch/delete", response_model=BatchDeleteResponse)
+async def delete_departments_batch(
+    batch: BatchDelete,
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Delete many departments in one transaction (admin only)
+    
+    Their doctors and appointments are deleted along with them by the
+    database. If any id does not exist, nothing is deleted and the 422
+    response lists the missing ids.
+    """
+    deleted = await crud_department.bulk_delete(db, batch.ids)
+    return {"deleted": deleted}
 
 
 @router.get("/{department_id}", response_model=DepartmentDetailResponse)
 async def get_department(
     department_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get department details"""
-    department = await crud_department.get(db, department_id)
-    if not department:
+    detail = await crud_department.get_detail(db, department_id)
+    if not detail:
         raise NotFoundException(detail="Department not found")
     
-    # Get doctors count
-    doctors_count = len(department.doctors) if department.doctors else 0
-    
+    department, doctors_count = detail
     return {
         **DepartmentResponse.from_orm(department).dict(),
         "doctors_count": doctors_count
@@ -97,10 +149,22 @@ async def update_department(
 @router.delete("/{department_id}", status_code=204)
 async def delete_department(
     department_id: int,
+    archive: bool = Query(False),
     current_user = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Delete department (admin only)"""
-    success = await crud_department.delete(db, department_id)
+    """
+    Delete department (admin only)
+    
+    Its doctors and appointments are deleted along with it by the database.
+    
+    - **archive**: Deactivate the department instead, keeping its doctors and appointments;
+      it leaves the department listing and takes no new bookings, and its doctors show no
+      free slots, but they stay in the doctor listings
+    """
+    if archive:
+        success = await crud_department.archive(db, department_id)
+    else:
+        success = await crud_department.delete(db, department_id)
     if not success:
         raise NotFoundException(detail="Department not found")
@@ -1,72 +1,77 @@
 """Doctor endpoints"""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy import select
+from datetime import date
+from typing import Optional
 
-from app.db.session import get_db
-from app.db.models import Doctor
+from app.db.session import get_db, get_read_db
 from app.schemas.doctor import (
     DoctorCreate,
     DoctorUpdate,
     DoctorResponse,
     DoctorDetailResponse,
 )
+from app.schemas.schedule import (
+    DoctorScheduleCreate,
+    DoctorScheduleResponse,
+    ScheduleExceptionCreate,
+    ScheduleExceptionResponse,
+    DaySlots,
+)
 from app.crud.doctor import doctor as crud_doctor
+from app.crud.schedule import schedule as crud_schedule, schedule_exception as crud_schedule_exception
 from app.crud.user import user as crud_user
 from app.crud.department import department as crud_department
 from app.core.dependencies import get_current_admin_user
 from app.core.exceptions import NotFoundException, ValidationException
-from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MAX_SLOT_RANGE_DAYS
+from app.core.pagination import with_next_cursor
+from app.core.slot_cache import slot_cache
 
 router = APIRouter(prefix="/doctors", tags=["doctors"])
 
 
 @router.get("", response_model=list[DoctorResponse])
 async def list_doctors(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     department_id: int = Query(None),
     available_only: bool = Query(True),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List all doctors
     
     - **skip**: Number of records to skip
     - **limit**: Number of records to return
+    - **cursor**: next_cursor from the previous page (instead of skip)
     - **department_id**: Filter by department
     - **available_only**: Return only available doctors
     """
     if department_id:
-        doctors = await crud_doctor.get_by_department(db, department_id, skip, limit)
+        page = await crud_doctor.get_by_department(db, department_id, skip, limit, cursor=cursor, response_model=DoctorResponse)
     elif available_only:
-        doctors = await crud_doctor.get_available(db, skip, limit)
+        page = await crud_doctor.get_available(db, skip, limit, cursor=cursor, response_model=DoctorResponse)
     else:
-        doctors, _ = await crud_doctor.get_all(db, skip, limit)
+        page = await crud_doctor.get_page(db, skip, limit, include_total=False, cursor=cursor, response_model=DoctorResponse)
     
-    return doctors
+    return with_next_cursor(response, page)
 
 
 @router.get("/{doctor_id}", response_model=DoctorDetailResponse)
 async def get_doctor(
     doctor_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get doctor details"""
-    # Eagerly load user and department relationships
-    result = await db.execute(
-        select(Doctor)
-        .where(Doctor.id == doctor_id)
-        .options(selectinload(Doctor.user), selectinload(Doctor.department))
-    )
-    doctor = result.scalars().first()
-    
-    if not doctor:
+    detail = await crud_doctor.get_detail(db, doctor_id)
+    if not detail:
         raise NotFoundException(detail="Doctor not found")
     
-    # Get user info
+    doctor, appointments_count = detail
     user = doctor.user
     department = doctor.department
     
@@ -76,16 +81,18 @@ async def get_doctor(
         "user_phone": user.phone if user else None,
         "user_email": user.email if user else None,
         "department_name": department.name if department else None,
-        "appointments_count": len(doctor.appointments) if doctor.appointments else 0,
+        "appointments_count": appointments_count,
     }
 
 
 @router.get("/department/{department_id}", response_model=list[DoctorResponse])
 async def get_doctors_by_department(
     department_id: int,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get doctors by department"""
     # Verify department exists
@@ -93,8 +100,8 @@ async def get_doctors_by_department(
     if not department:
         raise NotFoundException(detail="Department not found")
     
-    doctors = await crud_doctor.get_by_department(db, department_id, skip, limit)
-    return doctors
+    page = await crud_doctor.get_by_department(db, department_id, skip, limit, cursor=cursor, response_model=DoctorResponse)
+    return with_next_cursor(response, page)
 
 
 @router.post("", response_model=DoctorResponse, status_code=201)
@@ -119,16 +126,13 @@ async def create_doctor(
     if existing_doctor:
         raise ValidationException(detail="User is already a doctor")
     
-    doctor = await crud_doctor.create(db, doctor_in)
+    doctor = await crud_doctor.create(db, doctor_in, load=("user",))
     
     # Update user to mark as doctor
     user.is_doctor = True
     db.add(user)
     await db.commit()
     
-    # Refresh to load relationships
-    await db.refresh(doctor)
-    
     return doctor
 
 
@@ -140,7 +144,7 @@ async def update_doctor(
     db: AsyncSession = Depends(get_db)
 ):
     """Update doctor (admin only)"""
-    doctor = await crud_doctor.get(db, doctor_id)
+    doctor = await crud_doctor.get(db, doctor_id, load=("user",))
     if not doctor:
         raise NotFoundException(detail="Doctor not found")
     
@@ -151,10 +155,7 @@ async def update_doctor(
             raise NotFoundException(detail="Department not found")
     
     doctor = await crud_doctor.update(db, doctor, doctor_in)
-    
-    # Refresh to load relationships
-    await db.refresh(doctor)
-    
+    slot_cache.invalidate_doctor(doctor_id)
     return doctor
 
 
@@ -165,7 +166,7 @@ async def delete_doctor(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete doctor (admin only)"""
-    doctor = await crud_doctor.get(db, doctor_id)
+    doctor = await crud_doctor.get(db, doctor_id, load=("user",))
     if not doctor:
         raise NotFoundException(detail="Doctor not found")
     
@@ -179,3 +180,108 @@ async def delete_doctor(
         raise NotFoundException(detail="Doctor not found")
     
     await db.commit()
+    slot_cache.invalidate_doctor(doctor_id)
+
+
+@router.get("/{doctor_id}/slots", response_model=list[DaySlots])
+async def get_doctor_slots(
+    doctor_id: int,
+    from_date: date = Query(..., alias="from"),
+    to_date: date = Query(..., alias="to"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Free appointment slots of a doctor, per date
+    
+    Slots come from the weekly schedule, or the date's exceptions, minus
+    confirmed and pending appointments. Days are cached per worker, so this
+    reads the primary: a lagging replica could re-cache a day just booked.
+    
+    - **from**: First date
+    - **to**: Last date, at most MAX_SLOT_RANGE_DAYS days from the first
+    """
+    if to_date < from_date or (to_date - from_date).days >= MAX_SLOT_RANGE_DAYS:
+        raise ValidationException(detail=f"to must be on or after from, and within {MAX_SLOT_RANGE_DAYS} days of it")
+    
+    days = await crud_schedule.get_free_slots(db, doctor_id, from_date, to_date)
+    if days is None:
+        raise NotFoundException(detail="Doctor not found")
+    
+    return [{"date": day, "slots": slots} for day, slots in days]
+
+
+@router.get("/{doctor_id}/schedule", response_model=list[DoctorScheduleResponse])
+async def get_doctor_schedule(
+    doctor_id: int,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get a doctor's weekly working hours"""
+    if not await crud_doctor.exists(db, id=doctor_id):
+        raise NotFoundException(detail="Doctor not found")
+    
+    return await crud_schedule.get_by_doctor(db, doctor_id)
+
+
+@router.put("/{doctor_id}/schedule", response_model=list[DoctorScheduleResponse])
+async def replace_doctor_schedule(
+    doctor_id: int,
+    schedule_in: list[DoctorScheduleCreate],
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Replace a doctor's weekly working hours (admin only)"""
+    if not await crud_doctor.exists(db, id=doctor_id):
+        raise NotFoundException(detail="Doctor not found")
+    
+    return await crud_schedule.replace(db, doctor_id, schedule_in)
+
+
+@router.get("/{doctor_id}/schedule/exceptions", response_model=list[ScheduleExceptionResponse])
+async def list_schedule_exceptions(
+    doctor_id: int,
+    from_date: Optional[date] = Query(None, alias="from"),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    List a doctor's schedule exceptions (admin only)
+    
+    - **from**: First date (defaults to today)
+    """
+    if not await crud_doctor.exists(db, id=doctor_id):
+        raise NotFoundException(detail="Doctor not found")
+    
+    return await crud_schedule_exception.get_by_doctor(db, doctor_id, from_date or date.today())
+
+
+@router.post("/{doctor_id}/schedule/exceptions", response_model=ScheduleExceptionResponse, status_code=201)
+async def create_schedule_exception(
+    doctor_id: int,
+    exception_in: ScheduleExceptionCreate,
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Replace a doctor's working hours on one date (admin only)
+    
+    Without start_time and end_time the doctor is off for the date.
+    """
+    if not await crud_doctor.exists(db, id=doctor_id):
+        raise NotFoundException(detail="Doctor not found")
+    
+    return await crud_schedule_exception.create(db, exception_in, doctor_id=doctor_id)
+
+
+@router.delete("/{doctor_id}/schedule/exceptions/{exception_id}", status_code=204)
+async def delete_schedule_exception(
+    doctor_id: int,
+    exception_id: int,
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Delete a schedule exception (admin only)"""
+    exception = await crud_schedule_exception.get(db, exception_id)
+    if not exception or exception.doctor_id != doctor_id:
+        raise NotFoundException(detail="Schedule exception not found")
+    
+    await crud_schedule_exception.delete(db, exception_id)
@@ -1,56 +1,109 @@
 """Eye Product endpoints"""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.schemas.eye_product import (
     EyeProductCreate,
     EyeProductUpdate,
+    EyeProductBatchUpdate,
     EyeProductResponse,
 )
+from app.schemas.batch import BatchDelete, BatchDeleteResponse
 from app.crud.eye_product import eye_product as crud_eye_product
 from app.core.dependencies import get_current_admin_user
 from app.core.exceptions import NotFoundException
-from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MAX_BATCH_SIZE
+from app.core.pagination import with_next_cursor
 
 router = APIRouter(prefix="/eye-products", tags=["eye-products"])
 
 
 @router.get("", response_model=list[EyeProductResponse])
 async def list_eye_products(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     category: str = Query(None),
     brand: str = Query(None),
     available_only: bool = Query(True),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List all eye products
     
     - **skip**: Number of records to skip
     - **limit**: Number of records to return
+    - **cursor**: next_cursor from the previous page (instead of skip)
     - **category**: Filter by category (Sunglasses, Contact Lenses, Eye Drops, Frames, etc.)
     - **brand**: Filter by brand
     - **available_only**: Return only available products
     """
     if category:
-        products, _ = await crud_eye_product.get_by_category(db, category, skip=skip, limit=limit)
+        page = await crud_eye_product.get_by_category(db, category, skip=skip, limit=limit, include_total=False, cursor=cursor, response_model=EyeProductResponse)
     elif brand:
-        products, _ = await crud_eye_product.get_by_brand(db, brand, skip=skip, limit=limit)
+        page = await crud_eye_product.get_by_brand(db, brand, skip=skip, limit=limit, include_total=False, cursor=cursor, response_model=EyeProductResponse)
     elif available_only:
-        products, _ = await crud_eye_product.get_available(db, skip=skip, limit=limit)
+        page = await crud_eye_product.get_available(db, skip=skip, limit=limit, include_total=False, cursor=cursor, response_model=EyeProductResponse)
     else:
-        products, _ = await crud_eye_product.get_active(db, skip=skip, limit=limit)
+        page = await crud_eye_product.get_active(db, skip=skip, limit=limit, include_total=False, cursor=cursor, response_model=EyeProductResponse)
+    
+    return with_next_cursor(response, page)
+
+
+@router.post("/batch", response_model=list[EyeProductResponse], status_code=201)
+async def create_eye_products_batch(
+    products_in: list[EyeProductCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many eye products in one transaction (admin only)
+    
+    If any item fails, nothing is created and the 422 response lists the
+    failing items by index.
+    """
+    return await crud_eye_product.bulk_create(db, products_in)
+
+
+@router.put("/batch", response_model=list[EyeProductResponse])
+async def update_eye_products_batch(
+    products_in: list[EyeProductBatchUpdate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Update many eye products in one transaction (admin only)
     
-    return products
+    Each item carries the id and the fields to change. If any item fails,
+    nothing is updated and the 422 response lists the failing items.
+    """
+    return await crud_eye_product.bulk_update(db, [(item.id, item) for item in products_in])
+
+
+@router.post("/batch/delete", response_model=BatchDeleteResponse)
+async def delete_eye_products_batch(
+    batch: BatchDelete,
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Delete many eye products in one transaction (admin only)
+    
+    If any id does not exist, nothing is deleted and the 422 response lists
+    the missing ids.
+    """
+    deleted = await crud_eye_product.bulk_delete(db, batch.ids)
+    return {"deleted": deleted}
 
 
 @router.get("/{product_id}", response_model=EyeProductResponse)
 async def get_eye_product(
     product_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get eye product details"""
     product = await crud_eye_product.get(db, product_id)
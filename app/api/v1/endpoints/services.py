@@ -1,45 +1,98 @@
 """Service endpoints"""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.schemas.service import (
     ServiceCreate,
     ServiceUpdate,
+    ServiceBatchUpdate,
     ServiceResponse,
 )
+from app.schemas.batch import BatchDelete, BatchDeleteResponse
 from app.crud.service import service as crud_service
 from app.core.dependencies import get_current_admin_user
 from app.core.exceptions import NotFoundException, ConflictException
-from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MAX_BATCH_SIZE
+from app.core.pagination import with_next_cursor
 
 router = APIRouter(prefix="/services", tags=["services"])
 
 
 @router.get("", response_model=list[ServiceResponse])
 async def list_services(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     active_only: bool = Query(True),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List all services
     
     - **skip**: Number of records to skip
     - **limit**: Number of records to return
+    - **cursor**: next_cursor from the previous page (instead of skip)
     - **active_only**: Return only active services
     """
     filters = {"is_active": True} if active_only else None
-    services, _ = await crud_service.get_all(db, skip=skip, limit=limit, filters=filters)
-    return services
+    page = await crud_service.get_page(db, skip=skip, limit=limit, filters=filters, include_total=False, cursor=cursor, response_model=ServiceResponse)
+    return with_next_cursor(response, page)
+
+
+@router.post("/batch", response_model=list[ServiceResponse], status_code=201)
+async def create_services_batch(
+    services_in: list[ServiceCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many services in one transaction (admin only)
+    
+    If any item fails, nothing is created and the 422 response lists the
+    failing items by index.
+    """
+    return await crud_service.bulk_create(db, services_in)
+
+
+@router.put("/batch", response_model=list[ServiceResponse])
+async def update_services_batch(
+    services_in: list[ServiceBatchUpdate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Update many services in one transaction (admin only)
+    
+    Each item carries the id and the fields to change. If any item fails,
+    nothing is updated and the 422 response lists the failing items.
+    """
+    return await crud_service.bulk_update(db, [(item.id, item) for item in services_in])
+
+
+@router.post("/batch/delete", response_model=BatchDeleteResponse)
+async def delete_services_batch(
+    batch: BatchDelete,
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Delete many services in one transaction (admin only)
+    
+    If any id does not exist, nothing is deleted and the 422 response lists
+    the missing ids.
+    """
+    deleted = await crud_service.bulk_delete(db, batch.ids)
+    return {"deleted": deleted}
 
 
 @router.get("/{service_id}", response_model=ServiceResponse)
 async def get_service(
     service_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get service details"""
     service = await crud_service.get(db, service_id)
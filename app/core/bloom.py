@@ -0,0 +1,59 @@
+"""Bloom filter for fast negative membership checks"""
+
+import hashlib
+import math
+from typing import Any, Dict, Iterable
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a BLAKE2b digest
+
+    ``might_contain`` never returns False for an added item, and returns True
+    for an item that was never added with roughly ``error_rate`` probability
+    while the filter holds no more than ``capacity`` items.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        """Bit positions for an item"""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        """Add an item"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """Add many items"""
+        for item in items:
+            self.add(item)
+
+    def might_contain(self, item: str) -> bool:
+        """False means definitely absent; True means possibly present"""
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def clear(self) -> None:
+        """Remove every item"""
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of filter size and fill"""
+        return {
+            "items": self.count,
+            "capacity": self.capacity,
+            "bits": self.size,
+            "hashes": self.hash_count,
+        }
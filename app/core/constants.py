@@ -9,6 +9,8 @@ class AppointmentStatus:
     PENDING = "pending"
     
     ALL = [CONFIRMED, CANCELLED, COMPLETED, NO_SHOW, PENDING]
+    # Statuses that hold their time slot
+    ACTIVE = [CONFIRMED, PENDING]
 
 
 # Contact Message Status
@@ -30,11 +32,37 @@ class UserRole:
     ALL = [ADMIN, DOCTOR, PATIENT, STAFF]
 
 
+# Blood Groups, with the BloodBank schema field holding each group's units
+class BloodGroup:
+    O_POSITIVE = "O+"
+    O_NEGATIVE = "O-"
+    A_POSITIVE = "A+"
+    A_NEGATIVE = "A-"
+    B_POSITIVE = "B+"
+    B_NEGATIVE = "B-"
+    AB_POSITIVE = "AB+"
+    AB_NEGATIVE = "AB-"
+    
+    ALL = [O_POSITIVE, O_NEGATIVE, A_POSITIVE, A_NEGATIVE, B_POSITIVE, B_NEGATIVE, AB_POSITIVE, AB_NEGATIVE]
+    
+    FIELDS = {
+        O_POSITIVE: "blood_group_o_positive",
+        O_NEGATIVE: "blood_group_o_negative",
+        A_POSITIVE: "blood_group_a_positive",
+        A_NEGATIVE: "blood_group_a_negative",
+        B_POSITIVE: "blood_group_b_positive",
+        B_NEGATIVE: "blood_group_b_negative",
+        AB_POSITIVE: "blood_group_ab_positive",
+        AB_NEGATIVE: "blood_group_ab_negative",
+    }
+
+
 # Error Messages
 class ErrorMessages:
     INVALID_CREDENTIALS = "Invalid phone number or password"
     USER_NOT_FOUND = "User not found"
     USER_ALREADY_EXISTS = "User with this phone number already exists"
+    EMAIL_ALREADY_EXISTS = "User with this email already exists"
     INVALID_PHONE = "Invalid phone number format"
     INVALID_PASSWORD = "Invalid password"
     WEAK_PASSWORD = "Password does not meet security requirements"
@@ -45,8 +73,10 @@ class ErrorMessages:
     INTERNAL_ERROR = "Internal server error"
     INVALID_TOKEN = "Invalid or expired token"
     TOKEN_EXPIRED = "Token has expired"
+    TOKEN_REVOKED = "Token has been revoked"
     APPOINTMENT_CONFLICT = "Appointment time slot is not available"
     DOCTOR_NOT_AVAILABLE = "Doctor is not available at this time"
+    INVALID_CURSOR = "Invalid pagination cursor"
 
 
 # Success Messages
@@ -67,6 +97,13 @@ DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
 MIN_PAGE_SIZE = 1
 
+# Items per batch create/update/delete request
+MAX_BATCH_SIZE = 500
+
+# Doctor schedules
+DEFAULT_SLOT_MINUTES = 30
+MAX_SLOT_RANGE_DAYS = 31  # Longest from/to window of a free-slot query
+
 
 # Cache TTL (in seconds)
 CACHE_TTL_SHORT = 300  # 5 minutes
@@ -5,11 +5,13 @@ from fastapi import Depends, HTTPException, status
 from jose import JWTError
 
 from app.core.security import TokenUtils, oauth2_scheme
+from app.core.constants import ErrorMessages
+from app.core.principal_cache import Principal, principal_cache
 from app.db.session import get_db
 
 
-async def get_current_user(token: Optional[str] = Depends(oauth2_scheme), db = Depends(get_db)):
-    """Get current authenticated user from token"""
+def _decode_access_token(token: Optional[str]) -> tuple[int, dict]:
+    """Validate an access token and return the user id and its claims"""
     if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -27,34 +29,101 @@ async def get_current_user(token: Optional[str] = Depends(oauth2_scheme), db = D
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token type",
             )
-    except (ValueError, JWTError):
+    except (ValueError, TypeError, JWTError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Import here to avoid circular import
-    from app.crud.user import user as crud_user
-    
-    user = await crud_user.get(db, user_id)
-    if not user:
+    # Reject revoked tokens from the in-memory revocation list
+    if TokenUtils.is_revoked(payload):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail=ErrorMessages.TOKEN_REVOKED,
+            headers={"WWW-Authenticate": "Bearer"},
         )
     
+    return user_id, payload
+
+
+async def _load_principal(db, user_id: int) -> Principal:
+    """Get the principal for a user from the cache, loading it on a miss"""
+    user = principal_cache.get(user_id)
+    if user is None:
+        # Import here to avoid circular import
+        from app.crud.user import user as crud_user
+        
+        db_user = await crud_user.get(db, user_id)
+        if not db_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+            )
+        
+        user = Principal.from_user(db_user)
+        principal_cache.set(user)
+    
+    return user
+
+
+def _ensure_active(user) -> None:
+    """Reject inactive users"""
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User is inactive",
         )
+
+
+async def get_current_user(token: Optional[str] = Depends(oauth2_scheme), db = Depends(get_db)):
+    """Get current authenticated user from token
+    
+    Returns a cached, detached Principal snapshot rather than an ORM object;
+    load the User row explicitly when it needs to be modified.
+    """
+    user_id, _ = _decode_access_token(token)
+    user = await _load_principal(db, user_id)
+    _ensure_active(user)
+    return user
+
+
+async def get_current_principal(token: Optional[str] = Depends(oauth2_scheme), db = Depends(get_db)):
+    """Get the current user's id and roles from the access token claims
+    
+    Only id, phone, is_admin, is_doctor and is_active are populated. The user
+    (cached principal) is loaded instead for tokens issued before role
+    claims existed, when the user's roles/status changed after the token was
+    issued (its token_version is stale), and whenever token versions are not
+    shared across workers through Redis (see PrincipalCache.claims_trusted).
+    is_active is among the versioned claims, so a deactivation makes the
+    token stale too.
+    """
+    user_id, payload = _decode_access_token(token)
+    
+    token_version = payload.get("token_version")
+    if (
+        token_version is None
+        or not principal_cache.claims_trusted
+        or principal_cache.is_stale(user_id, token_version)
+    ):
+        user = await _load_principal(db, user_id)
+    else:
+        user = Principal(
+            id=user_id,
+            phone=payload.get("phone"),
+            is_active=True,
+            is_admin=bool(payload.get("is_admin")),
+            is_doctor=bool(payload.get("is_doctor")),
+            token_version=token_version,
+        )
     
+    _ensure_active(user)
     return user
 
 
-async def get_current_admin_user(current_user = Depends(get_current_user)):
-    """Get current authenticated admin user"""
+async def get_current_admin_user(current_user = Depends(get_current_principal)):
+    """Get current authenticated admin user (authorized from token claims)"""
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
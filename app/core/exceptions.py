@@ -66,6 +66,16 @@ class ConflictException(APIException):
         )
 
 
+class BatchException(APIException):
+    """Batch rejected because of some of its items; nothing was written"""
+    
+    def __init__(self, errors: list, detail: str = "Batch rejected, no changes were made"):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={"message": detail, "errors": errors},
+        )
+
+
 class InternalServerException(APIException):
     """Internal server error exception"""
     
@@ -74,3 +84,25 @@ class InternalServerException(APIException):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=detail,
         )
+
+
+class RateLimitException(APIException):
+    """Too many requests exception"""
+    
+    def __init__(self, detail: str = "Too many requests, please try again later", retry_after: int = 60):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class ServiceUnavailableException(APIException):
+    """Service temporarily unavailable exception"""
+    
+    def __init__(self, detail: str = "Service temporarily unavailable", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -0,0 +1,141 @@
+"""Async password hashing service backed by a bounded worker pool"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.config import settings
+from app.core.exceptions import ServiceUnavailableException
+from app.core.security import SecurityUtils
+
+logger = logging.getLogger(__name__)
+
+
+def _timed_call(func: Callable, *args) -> tuple[Any, float]:
+    """Run func in the worker and return its result with the elapsed run time"""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+class PasswordHashingService:
+    """Run bcrypt hashing and verification off the event loop
+
+    bcrypt is deliberately slow, so calling it from a coroutine blocks every
+    other request on the worker. Calls are dispatched to a bounded thread or
+    process pool, and callers are rejected once too many are already waiting.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 32,
+        executor_type: str = "thread",
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.executor_type = executor_type
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self._metrics: Dict[str, Dict[str, float]] = {}
+
+    def _get_executor(self) -> Executor:
+        """Create the worker pool on first use"""
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+        return self._executor
+
+    async def _run(self, operation: str, func: Callable, *args) -> Any:
+        """Dispatch a call to the pool, enforcing the queue-depth limit"""
+        if self._pending >= self.max_pending:
+            self._record_rejection(operation)
+            raise ServiceUnavailableException(detail="Server is busy, please retry shortly")
+
+        self._pending += 1
+        submitted = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result, run_time = await loop.run_in_executor(
+                self._get_executor(), _timed_call, func, *args
+            )
+        finally:
+            self._pending -= 1
+
+        self._record(operation, time.perf_counter() - submitted, run_time)
+        return result
+
+    def _metric(self, operation: str) -> Dict[str, float]:
+        """Get (or create) the metrics bucket for an operation"""
+        return self._metrics.setdefault(operation, {
+            "calls": 0,
+            "rejected": 0,
+            "total_seconds": 0.0,
+            "run_seconds": 0.0,
+            "wait_seconds": 0.0,
+            "max_seconds": 0.0,
+        })
+
+    def _record(self, operation: str, total: float, run_time: float) -> None:
+        """Record timing for a completed call"""
+        metric = self._metric(operation)
+        metric["calls"] += 1
+        metric["total_seconds"] += total
+        metric["run_seconds"] += run_time
+        metric["wait_seconds"] += max(total - run_time, 0.0)
+        metric["max_seconds"] = max(metric["max_seconds"], total)
+        logger.debug(f"password {operation} took {total * 1000:.1f} ms ({run_time * 1000:.1f} ms in worker)")
+
+    def _record_rejection(self, operation: str) -> None:
+        """Record a call rejected because the queue was full"""
+        self._metric(operation)["rejected"] += 1
+        logger.warning(f"password {operation} rejected: {self._pending} calls already pending")
+
+    async def hash(self, password: str) -> str:
+        """Hash a password in the worker pool"""
+        return await self._run("hash", SecurityUtils.get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the worker pool"""
+        return await self._run("verify", SecurityUtils.verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool configuration and per-operation timings"""
+        operations = {}
+        for operation, metric in self._metrics.items():
+            calls = metric["calls"] or 1
+            operations[operation] = {
+                "calls": int(metric["calls"]),
+                "rejected": int(metric["rejected"]),
+                "avg_ms": round(metric["total_seconds"] / calls * 1000, 2),
+                "avg_run_ms": round(metric["run_seconds"] / calls * 1000, 2),
+                "avg_wait_ms": round(metric["wait_seconds"] / calls * 1000, 2),
+                "max_ms": round(metric["max_seconds"] * 1000, 2),
+            }
+        return {
+            "executor": self.executor_type,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "operations": operations,
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHashingService(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    executor_type=settings.PASSWORD_HASH_EXECUTOR,
+)
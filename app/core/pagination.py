@@ -0,0 +1,103 @@
+"""Keyset pagination cursors
+
+A cursor is the sort-column values of the last row on a page, so the next
+page starts with `WHERE (sort columns) > (those values)` on an index instead
+of an OFFSET that reads and discards every earlier row. Cursors are signed
+so clients treat them as opaque and cannot forge positions or replay a
+cursor from one listing against another.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+from datetime import date, datetime, time
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from fastapi import Response
+
+from app.config import settings
+from app.core.constants import ErrorMessages
+from app.core.exceptions import ValidationException
+
+# Response header carrying the next cursor for endpoints that return a bare list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_SIGNATURE_BYTES = 16
+_signing_key = hashlib.sha256(f"pagination-cursor:{settings.SECRET_KEY}".encode()).digest()
+
+
+class Page(NamedTuple):
+    """One page of a listing"""
+    items: List[Any]
+    total: Optional[int]
+    next_cursor: Optional[str]
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(_signing_key, payload, hashlib.sha256).digest()[:_SIGNATURE_BYTES]
+
+
+def _dump_value(value: Any) -> Any:
+    # datetime before date: datetime is a date subclass
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, time):
+        return {"t": value.isoformat()}
+    return value
+
+
+def _load_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "t" in value:
+            return time.fromisoformat(value["t"])
+        raise ValueError("Unknown cursor value type")
+    return value
+
+
+def encode_cursor(sort_key: str, values: Sequence[Any]) -> str:
+    """Signed cursor for the row with the given sort-column values"""
+    payload = json.dumps(
+        {"k": sort_key, "v": [_dump_value(value) for value in values]},
+        separators=(",", ":"),
+    ).encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(cursor: str, sort_key: str) -> List[Any]:
+    """Sort-column values from a cursor issued for the same listing
+
+    Raises ValidationException for tampered, malformed or foreign cursors.
+    """
+    try:
+        encoded_payload, encoded_signature = cursor.split(".")
+        payload = _b64decode(encoded_payload)
+        if not hmac.compare_digest(_b64decode(encoded_signature), _sign(payload)):
+            raise ValueError("Bad signature")
+        data = json.loads(payload)
+        if data["k"] != sort_key:
+            raise ValueError("Cursor belongs to another listing")
+        return [_load_value(value) for value in data["v"]]
+    except (ValueError, KeyError, TypeError):
+        raise ValidationException(detail=ErrorMessages.INVALID_CURSOR)
+
+
+def with_next_cursor(response: Response, page: Page) -> List[Any]:
+    """Items of a page served as a bare list, passing next_cursor in a header"""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
@@ -0,0 +1,247 @@
+"""Per-worker cache of authenticated principals"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# SET the key to ARGV[1] (expiring in ARGV[2] seconds) unless it already holds a newer version
+_STORE_NEWER_VERSION = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '-1')
+if tonumber(ARGV[1]) > current then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+end
+"""
+
+
+class Principal:
+    """Detached, read-only snapshot of a User row
+
+    Exposes the same attributes as the ORM object (minus the password hash),
+    so endpoints and response models can use it in place of a loaded User.
+    """
+
+    def __init__(self, **values: Any):
+        self.__dict__.update(values)
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        """Snapshot the column values of a User instance"""
+        return cls(**{
+            column.key: getattr(user, column.key)
+            for column in user.__table__.columns
+            if column.key != "hashed_password"
+        })
+
+    def __repr__(self) -> str:
+        return f"<Principal id={self.__dict__.get('id')}>"
+
+
+class PrincipalCache:
+    """TTL + LRU cache of principals keyed by user id
+
+    Entries are dropped locally on invalidation and, when a Redis channel is
+    configured, invalidations are broadcast so every worker drops them too.
+    The cache also remembers the newest token version seen per user, which
+    lets role claims in access tokens be trusted until that version moves on.
+    Versions are shared through Redis keys as well, so a restarted worker
+    learns about earlier changes; without Redis, claims are not trusted.
+    A version is forgotten version_ttl seconds (the access token lifetime)
+    after it was seen, when every token issued before it has expired.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: int = 60, channel: Optional[str] = None, version_ttl: int = 1800):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.channel = channel
+        self.version_ttl = version_ttl
+        self.version_prefix = f"{channel}:version:"
+        self._entries: "OrderedDict[int, tuple[float, Principal]]" = OrderedDict()
+        self._token_versions: Dict[int, tuple[int, float]] = {}
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        """Get a cached principal if it has not expired"""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, principal = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(user_id, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return principal
+
+    def set(self, principal: Principal) -> None:
+        """Cache a principal, evicting the least recently used entry if full"""
+        self.note_token_version(principal.id, getattr(principal, "token_version", None))
+        if self.max_size <= 0:
+            return
+        self._entries[principal.id] = (time.monotonic() + self.ttl, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def note_token_version(self, user_id: int, token_version: Optional[int]) -> None:
+        """Remember the newest token version seen for a user, for version_ttl seconds"""
+        if token_version is None or token_version <= self._known_version(user_id):
+            return
+        self._token_versions[user_id] = (token_version, time.monotonic() + self.version_ttl)
+        if len(self._token_versions) % 1024 == 0:
+            now = time.monotonic()
+            self._token_versions = {
+                key: entry for key, entry in self._token_versions.items() if entry[1] >= now
+            }
+
+    def _known_version(self, user_id: int) -> int:
+        """Newest unexpired token version seen for a user, 0 if none"""
+        entry = self._token_versions.get(user_id)
+        if entry is None:
+            return 0
+        token_version, forget_at = entry
+        if forget_at < time.monotonic():
+            self._token_versions.pop(user_id, None)
+            return 0
+        return token_version
+
+    def is_stale(self, user_id: int, token_version: int) -> bool:
+        """Check whether claims issued at token_version predate a known role/status change"""
+        return token_version < self._known_version(user_id)
+
+    @property
+    def claims_trusted(self) -> bool:
+        """Whether token versions reach this worker from every other one
+
+        Only then can role claims be trusted without loading the user: this
+        needs the shared versions loaded and the invalidation listener up.
+        """
+        return self._redis is not None and self._listener is not None and not self._listener.done()
+
+    def invalidate(self, user_id: int, token_version: Optional[int] = None, broadcast: bool = True) -> None:
+        """Drop a user from this worker's cache and notify the other workers"""
+        self._entries.pop(user_id, None)
+        self.note_token_version(user_id, token_version)
+        if broadcast and self._redis is not None:
+            try:
+                asyncio.get_running_loop().create_task(self._publish(user_id, token_version))
+            except RuntimeError:
+                pass
+
+    def clear(self) -> None:
+        """Drop every cached principal"""
+        self._entries.clear()
+
+    async def _publish(self, user_id: int, token_version: Optional[int]) -> None:
+        """Store the new token version and broadcast an invalidation to the other workers"""
+        message = str(user_id) if token_version is None else f"{user_id}:{token_version}"
+        try:
+            if token_version is not None:
+                await self._redis.eval(
+                    _STORE_NEWER_VERSION, 1, f"{self.version_prefix}{user_id}", token_version, self.version_ttl
+                )
+            await self._redis.publish(self.channel, message)
+        except Exception as e:
+            logger.warning(f"Failed to publish principal invalidation for user {user_id}: {e}")
+
+    async def _listen(self, pubsub) -> None:
+        """Apply invalidations broadcast by other workers"""
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    user_id, _, token_version = message["data"].partition(":")
+                    self.invalidate(
+                        int(user_id),
+                        int(token_version) if token_version else None,
+                        broadcast=False,
+                    )
+                except (AttributeError, TypeError, ValueError):
+                    continue
+        finally:
+            await pubsub.unsubscribe(self.channel)
+
+    async def _load_versions(self) -> None:
+        """Load the token versions other workers stored in Redis"""
+        keys = [key async for key in self._redis.scan_iter(match=f"{self.version_prefix}*", count=1000)]
+        for start in range(0, len(keys), 1000):
+            batch = keys[start:start + 1000]
+            for key, value in zip(batch, await self._redis.mget(batch)):
+                if value is not None:
+                    self.note_token_version(int(key[len(self.version_prefix):]), int(value))
+
+    async def start(self) -> None:
+        """Subscribe to the invalidation channel and load shared token versions"""
+        if not self.channel or not settings.REDIS_URL:
+            logger.warning(
+                "PRINCIPAL_CACHE_CHANNEL or REDIS_URL is not set; role claims are not trusted "
+                "and admin requests load the user"
+            )
+            return
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            logger.warning("redis is not installed; principal cache invalidation is local only and role claims are not trusted")
+            return
+
+        try:
+            self._redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            await self._redis.ping()
+            # Subscribe before loading so no version stored in between is missed
+            pubsub = self._redis.pubsub()
+            await pubsub.subscribe(self.channel)
+            self._listener = asyncio.create_task(self._listen(pubsub))
+            await self._load_versions()
+        except Exception as e:
+            logger.warning(f"Principal cache invalidation channel unavailable, role claims are not trusted: {e}")
+            await self.stop()
+            return
+
+        logger.info(f"Principal cache listening for invalidations on '{self.channel}'")
+
+    async def stop(self) -> None:
+        """Stop listening and close the Redis connection"""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache size and hit rate"""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self._redis is not None,
+            "claims_trusted": self.claims_trusted,
+            "token_versions": len(self._token_versions),
+        }
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE if settings.PRINCIPAL_CACHE_ENABLED else 0,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+    channel=settings.PRINCIPAL_CACHE_CHANNEL,
+    version_ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
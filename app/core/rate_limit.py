@@ -0,0 +1,211 @@
+"""Request rate limiting
+
+Limits are enforced by route dependencies, which FastAPI resolves before the
+endpoint's own parameters, so a rejected request never opens a DB session or
+reaches bcrypt. Buckets are kept in-process by default; with
+RATE_LIMIT_BACKEND=redis a shared sliding window holds the limits across
+every gunicorn worker.
+"""
+
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional
+
+from fastapi import Request
+
+from app.config import settings
+from app.core.exceptions import RateLimitException
+from app.core.security import SecurityUtils
+
+logger = logging.getLogger(__name__)
+
+# Drop entries older than the window, then record the request only if the
+# window has room; return 0, or the seconds until the oldest entry leaves it
+_SLIDING_WINDOW_HIT = """
+local now = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - period)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('EXPIRE', KEYS[1], period)
+    return '0'
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+if oldest[2] == nil then
+    return tostring(period)
+end
+return tostring(tonumber(oldest[2]) + period - now)
+"""
+
+
+class RateLimit(NamedTuple):
+    """Allow `requests` per `period` seconds"""
+    requests: int
+    period: int
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Parse a limit written as "requests/seconds", e.g. "10/60" """
+        requests, _, period = value.partition("/")
+        return cls(int(requests), int(period or 60))
+
+
+class InMemoryTokenBucket:
+    """Per-worker token buckets with a cap on the number of tracked keys"""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+
+    def hit(self, key: str, limit: RateLimit) -> float:
+        """Take a token; return 0 if allowed, else seconds until one is available"""
+        now = time.monotonic()
+        rate = limit.requests / limit.period
+        tokens, updated_at = self._buckets.get(key, (float(limit.requests), now))
+        tokens = min(float(limit.requests), tokens + (now - updated_at) * rate)
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            return (1 - tokens) / rate
+
+        self._buckets[key] = (tokens - 1, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return 0.0
+
+
+class RedisSlidingWindow:
+    """Sliding-window log in a Redis sorted set, shared by all workers"""
+
+    def __init__(self, client, prefix: str = "ratelimit:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        """Record a request if the window has room; return 0 if allowed, else seconds until it frees up
+
+        Rejected requests are not recorded, so a client retrying over the
+        limit is let through again once its earlier requests leave the
+        window, as with the in-memory token bucket.
+        """
+        now = time.time()
+        retry_after = float(await self.client.eval(
+            _SLIDING_WINDOW_HIT,
+            1,
+            f"{self.prefix}{key}",
+            now,
+            limit.period,
+            limit.requests,
+            f"{now}:{uuid.uuid4().hex[:8]}",
+        ))
+        if retry_after <= 0:
+            return 0.0
+        return max(retry_after, 1.0)
+
+
+class RateLimiter:
+    """Route-level rate limiter keyed by client IP and, optionally, phone number"""
+
+    def __init__(self, backend: str = "memory"):
+        self.backend = backend
+        self.local = InMemoryTokenBucket()
+        self.shared: Optional[RedisSlidingWindow] = None
+        self.rejected = 0
+
+    def limit_for(self, name: str) -> RateLimit:
+        """Configured limit for a route, falling back to the global default"""
+        value = settings.RATE_LIMIT_ROUTES.get(name)
+        if value:
+            return RateLimit.parse(value)
+        return RateLimit(settings.RATE_LIMIT_REQUESTS, settings.RATE_LIMIT_PERIOD)
+
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        """Count a request against a key, using Redis when it is available"""
+        if self.shared is not None:
+            try:
+                return await self.shared.hit(key, limit)
+            except Exception as e:
+                logger.warning(f"Redis rate limiter unavailable, limiting in-process: {e}")
+        return self.local.hit(key, limit)
+
+    async def check(self, key: str, limit: RateLimit) -> None:
+        """Raise RateLimitException if the key is over its limit"""
+        retry_after = await self.hit(key, limit)
+        if retry_after > 0:
+            self.rejected += 1
+            raise RateLimitException(retry_after=int(retry_after) + 1)
+
+    def stats(self) -> dict:
+        """Snapshot of limiter state"""
+        return {
+            "enabled": settings.RATE_LIMIT_ENABLED,
+            "backend": "redis" if self.shared is not None else "memory",
+            "rejected": self.rejected,
+        }
+
+    async def start(self) -> None:
+        """Connect the shared backend if configured"""
+        if self.backend != "redis" or not settings.REDIS_URL:
+            return
+        try:
+            import redis.asyncio as redis
+
+            client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            await client.ping()
+            self.shared = RedisSlidingWindow(client)
+            logger.info("Rate limits shared through Redis")
+        except Exception as e:
+            logger.warning(f"Redis rate limiter unavailable, limiting in-process: {e}")
+
+    async def stop(self) -> None:
+        """Close the shared backend"""
+        if self.shared is not None:
+            await self.shared.client.aclose()
+            self.shared = None
+
+
+rate_limiter = RateLimiter(backend=settings.RATE_LIMIT_BACKEND)
+
+
+def client_ip(request: Request) -> str:
+    """Client address, honouring X-Forwarded-For behind a trusted proxy
+
+    The last entry is the one appended by the proxy itself; earlier entries
+    are supplied by the client and cannot be trusted.
+    """
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[-1].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit(name: str, by_phone: bool = False) -> Callable:
+    """Build a route dependency enforcing the named limit per IP (and per phone)
+
+    Use in the route decorator, e.g.
+    ``@router.post("/login", dependencies=[Depends(rate_limit("login", by_phone=True))])``
+    """
+    async def dependency(request: Request) -> None:
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+
+        limit = rate_limiter.limit_for(name)
+        await rate_limiter.check(f"{name}:ip:{client_ip(request)}", limit)
+
+        if by_phone:
+            try:
+                phone = (await request.json()).get("phone")
+            except (ValueError, AttributeError, json.JSONDecodeError):
+                phone = None
+            if isinstance(phone, str) and phone:
+                phone_limit = rate_limiter.limit_for(f"{name}_phone")
+                normalized = SecurityUtils.normalize_phone(phone)
+                await rate_limiter.check(f"{name}:phone:{normalized}", phone_limit)
+
+    return dependency
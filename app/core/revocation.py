@@ -0,0 +1,301 @@
+"""Server-side token revocation
+
+Revoked token ids (``jti`` claims) are mirrored into a per-worker hash set so
+that checking a token costs one dict lookup and no I/O. The set is kept in
+sync from a shared store by background tasks: Redis (SET with expiry +
+pub/sub) when configured, otherwise an append-only file on the local disk
+that workers tail. The file is tailed in Redis mode too, as revocations go
+there when Redis writes fail, and is periodically rewritten without the
+entries that have expired. File reads and writes run in a thread, off the
+event loop.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Not on POSIX: appends are unlocked and the file is never compacted
+    fcntl = None
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationList:
+    """Per-worker set of revoked token ids backed by Redis or a local file"""
+
+    def __init__(
+        self,
+        backend: str = "file",
+        file_path: str = ".revoked_tokens.jsonl",
+        channel: str = "token-revocations",
+        key_prefix: str = "revoked:",
+        sync_interval: float = 1.0,
+        compact_interval: float = 3600.0,
+    ):
+        self.backend = backend
+        self.file_path = file_path
+        self.channel = channel
+        self.key_prefix = key_prefix
+        self.sync_interval = sync_interval
+        self.compact_interval = compact_interval
+        self._revoked: Dict[str, float] = {}
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+        self._listening = False
+        self.resubscribes = 0
+        self._follower: Optional[asyncio.Task] = None
+        self._file_offset = 0
+        self._file_inode: Optional[int] = None
+        self._next_compact = time.monotonic() + compact_interval
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        """Check whether a token id has been revoked (a dict lookup, no I/O)"""
+        if not jti:
+            return False
+
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at < time.time():
+            # The token has expired anyway, so the entry is no longer needed
+            self._revoked.pop(jti, None)
+            return False
+        return True
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """Revoke a token id until the token would have expired"""
+        ttl = int(expires_at - time.time()) + 1
+        if not jti or ttl <= 0:
+            return
+
+        self._add(jti, expires_at)
+        if self._redis is not None:
+            try:
+                await self._redis.set(f"{self.key_prefix}{jti}", str(expires_at), ex=ttl)
+                await self._redis.publish(self.channel, json.dumps({"jti": jti, "exp": expires_at}))
+                return
+            except Exception as e:
+                logger.warning(f"Failed to store revocation in Redis, using file fallback: {e}")
+        await asyncio.to_thread(self._append_file, jti, expires_at)
+
+    def _add(self, jti: str, expires_at: float) -> None:
+        """Add a revoked id to the local set, pruning expired ids as it grows"""
+        self._revoked[jti] = expires_at
+        if len(self._revoked) % 1024 == 0:
+            now = time.time()
+            self._revoked = {key: exp for key, exp in self._revoked.items() if exp >= now}
+
+    def _lock(self):
+        """Open and exclusively lock the file guarding appends and compaction"""
+        lock = open(f"{self.file_path}.lock", "a")
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    def _append_file(self, jti: str, expires_at: float) -> None:
+        """Append a revocation to the shared file"""
+        try:
+            # Locked, so a compaction cannot replace the file under the write
+            with self._lock(), open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"jti": jti, "exp": expires_at}) + "\n")
+        except OSError as e:
+            logger.error(f"Failed to persist token revocation: {e}")
+
+    def _compact_file(self) -> None:
+        """Rewrite the shared file without expired entries
+
+        The new file replaces the old one atomically; other workers notice
+        the new inode and read it again from the start.
+        """
+        if fcntl is None:
+            return
+        now = time.time()
+        try:
+            with self._lock():
+                with open(self.file_path, "r", encoding="utf-8") as f:
+                    lines = f.readlines()
+                kept = []
+                for line in lines:
+                    try:
+                        if line.endswith("\n") and float(json.loads(line)["exp"]) >= now:
+                            kept.append(line)
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                if len(kept) == len(lines):
+                    return
+                temp_path = f"{self.file_path}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.writelines(kept)
+                os.replace(temp_path, self.file_path)
+            logger.info(f"Compacted token revocations: dropped {len(lines) - len(kept)} expired entries")
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Failed to compact token revocations: {e}")
+
+    def _read_file(self) -> List[Tuple[str, float]]:
+        """Read the revocations appended to the shared file since the last read"""
+        entries = []
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_ino != self._file_inode or stat.st_size < self._file_offset:
+                    # Replaced by a compaction: read the new file from the start
+                    self._file_inode = stat.st_ino
+                    self._file_offset = 0
+                if stat.st_size <= self._file_offset:
+                    return entries
+                f.seek(self._file_offset)
+                for line in f:
+                    if not line.endswith("\n"):
+                        # Partially written line; pick it up on the next read
+                        break
+                    self._file_offset += len(line.encode("utf-8"))
+                    try:
+                        entry = json.loads(line)
+                        entries.append((entry["jti"], float(entry["exp"])))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to read token revocations: {e}")
+        return entries
+
+    async def _sync_file(self) -> None:
+        """Load revocations appended by other workers, compacting the file when due"""
+        if time.monotonic() >= self._next_compact:
+            self._next_compact = time.monotonic() + self.compact_interval
+            await asyncio.to_thread(self._compact_file)
+        for jti, expires_at in await asyncio.to_thread(self._read_file):
+            self._add(jti, expires_at)
+
+    async def _follow_file(self) -> None:
+        """Sync the shared file every sync_interval seconds"""
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self._sync_file()
+            except Exception as e:
+                logger.warning(f"Failed to sync token revocations: {e}")
+
+    async def _listen(self, pubsub) -> None:
+        """Apply revocations published by other workers
+
+        When the subscription drops it is renewed with exponential backoff,
+        and everything stored in Redis is loaded again to catch up on the
+        revocations published while this worker was not listening.
+        """
+        delay = 1.0
+        try:
+            while True:
+                try:
+                    if pubsub is None:
+                        pubsub = self._redis.pubsub()
+                        await pubsub.subscribe(self.channel)
+                        await self._load_redis()
+                        self.resubscribes += 1
+                        logger.info(f"Resubscribed to token revocations ({len(self._revoked)} active)")
+                    self._listening = True
+                    delay = 1.0
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        try:
+                            entry = json.loads(message["data"])
+                            self._add(entry["jti"], float(entry["exp"]))
+                        except (ValueError, KeyError, TypeError):
+                            continue
+                    raise ConnectionError("subscription closed")
+                except Exception as e:
+                    self._listening = False
+                    logger.warning(f"Lost token revocation channel, resubscribing in {delay:.0f}s: {e}")
+                    await self._close_pubsub(pubsub)
+                    pubsub = None
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 30.0)
+        finally:
+            self._listening = False
+            await self._close_pubsub(pubsub)
+
+    async def _close_pubsub(self, pubsub) -> None:
+        """Close a pub/sub connection, ignoring errors from a broken one"""
+        if pubsub is None:
+            return
+        try:
+            await pubsub.aclose()
+        except Exception:
+            pass
+
+    async def _load_redis(self) -> None:
+        """Load every revocation currently stored in Redis"""
+        keys = [key async for key in self._redis.scan_iter(match=f"{self.key_prefix}*", count=1000)]
+        for start in range(0, len(keys), 1000):
+            batch = keys[start:start + 1000]
+            for key, value in zip(batch, await self._redis.mget(batch)):
+                if value is not None:
+                    self._add(key[len(self.key_prefix):], float(value))
+
+    async def start(self) -> None:
+        """Load existing revocations and start following new ones"""
+        if self.backend == "redis" and settings.REDIS_URL:
+            try:
+                import redis.asyncio as redis
+
+                self._redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
+                # Subscribe before loading so nothing revoked in between is missed
+                pubsub = self._redis.pubsub()
+                await pubsub.subscribe(self.channel)
+                self._listener = asyncio.create_task(self._listen(pubsub))
+                await self._load_redis()
+                logger.info(f"Token revocations loaded from Redis ({len(self._revoked)} active)")
+            except Exception as e:
+                logger.warning(f"Redis revocation store unavailable, using file fallback: {e}")
+                await self.stop()
+
+        # Also in Redis mode, for revocations that fell back to the file while Redis writes failed
+        await self._sync_file()
+        self._follower = asyncio.create_task(self._follow_file())
+        logger.info(f"Token revocations followed in {self.file_path} ({len(self._revoked)} active)")
+
+    async def stop(self) -> None:
+        """Stop following revocations and close the Redis connection"""
+        for task in (self._listener, self._follower):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._listener = None
+        self._follower = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def stats(self) -> Dict[str, object]:
+        """Snapshot of the revocation list"""
+        return {
+            "backend": "redis" if self._redis is not None else "file",
+            "revoked": len(self._revoked),
+            "listening": self._listening,
+            "resubscribes": self.resubscribes,
+            "following_file": self._follower is not None and not self._follower.done(),
+        }
+
+
+token_revocations = TokenRevocationList(
+    backend=settings.TOKEN_REVOCATION_BACKEND,
+    file_path=settings.TOKEN_REVOCATION_FILE,
+    channel=settings.TOKEN_REVOCATION_CHANNEL,
+    sync_interval=settings.TOKEN_REVOCATION_SYNC_INTERVAL,
+    compact_interval=settings.TOKEN_REVOCATION_COMPACT_INTERVAL,
+)
@@ -7,8 +7,11 @@ import bcrypt
 from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 import re
+import uuid
 
 from app.config import settings
+from app.core.token_cache import token_cache
+from app.core.revocation import token_revocations
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
@@ -34,10 +37,23 @@ class SecurityUtils:
         password_bytes = password.encode('utf-8')
         if len(password_bytes) > 72:
             password = password_bytes[:72].decode('utf-8', errors='ignore')
-        salt = bcrypt.gensalt(rounds=12)
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
     
+    @staticmethod
+    def get_hash_rounds(hashed_password: str) -> Optional[int]:
+        """Get the bcrypt cost factor of a hash ("$2b$12$..." -> 12)"""
+        parts = hashed_password.split("$")
+        if len(parts) < 4 or not parts[2].isdigit():
+            return None
+        return int(parts[2])
+    
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """Check whether a hash was made with a different cost than configured"""
+        return SecurityUtils.get_hash_rounds(hashed_password) != settings.BCRYPT_ROUNDS
+    
     @staticmethod
     def validate_password(password: str) -> tuple[bool, str]:
         """Validate password strength - bcrypt will automatically truncate to 72 bytes"""
@@ -95,7 +111,7 @@ class TokenUtils:
         else:
             expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         
-        to_encode.update({"exp": expire, "type": "access"})
+        to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
         encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
         return encoded_jwt
     
@@ -104,15 +120,26 @@ class TokenUtils:
         """Create a JWT refresh token"""
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-        to_encode.update({"exp": expire, "type": "refresh"})
+        to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
         encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
         return encoded_jwt
     
     @staticmethod
-    def decode_token(token: str) -> Dict[str, Any]:
-        """Decode and validate a JWT token"""
+    def decode_token(token: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Decode and validate a JWT token
+        
+        Verified claims are cached until the token expires, so repeated
+        requests with the same token skip the signature check.
+        """
+        if use_cache:
+            cached = token_cache.get(token)
+            if cached is not None:
+                return cached
+        
         try:
             payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            if use_cache:
+                token_cache.set(token, payload)
             return payload
         except JWTError as e:
             raise HTTPException(
@@ -122,10 +149,36 @@ class TokenUtils:
             )
     
     @staticmethod
-    def create_tokens(user_id: int, phone: str) -> Dict[str, str]:
-        """Create both access and refresh tokens"""
+    def is_revoked(payload: Dict[str, Any]) -> bool:
+        """Check whether a decoded token has been revoked"""
+        return token_revocations.is_revoked(payload.get("jti"))
+    
+    @staticmethod
+    async def revoke_token(token: str) -> None:
+        """Revoke a token until it expires; invalid tokens are ignored"""
+        try:
+            payload = TokenUtils.decode_token(token)
+        except HTTPException:
+            return
+        
+        token_cache.discard(token)
+        if payload.get("jti") and payload.get("exp"):
+            await token_revocations.revoke(payload["jti"], payload["exp"])
+    
+    @staticmethod
+    def role_claims(user) -> Dict[str, Any]:
+        """Role and status claims carried by access tokens"""
+        return {
+            "is_admin": bool(user.is_admin),
+            "is_doctor": bool(user.is_doctor),
+            "token_version": user.token_version or 0,
+        }
+    
+    @staticmethod
+    def create_tokens(user_id: int, phone: str, extra_claims: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """Create both access and refresh tokens (extra_claims go in the access token)"""
         access_token = TokenUtils.create_access_token(
-            data={"sub": str(user_id), "phone": phone}
+            data={"sub": str(user_id), "phone": phone, **(extra_claims or {})}
         )
         refresh_token = TokenUtils.create_refresh_token(
             data={"sub": str(user_id), "phone": phone}
@@ -0,0 +1,79 @@
+"""Per-worker cache of free appointment slots"""
+
+import time
+from collections import OrderedDict
+from datetime import date, time as time_of_day
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+
+class SlotCache:
+    """TTL + LRU cache of a doctor's free slots keyed by (doctor id, date)
+
+    Bookings and cancellations drop the day they touch and schedule changes
+    drop the whole doctor, on this worker. Other workers catch up within the
+    TTL; a slot they still show as free is refused with a 409 on booking, as
+    the database, not this cache, enforces one booking per slot.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: int = 60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[tuple[int, date], tuple[float, tuple[time_of_day, ...]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, doctor_id: int, day: date) -> Optional[tuple[time_of_day, ...]]:
+        """Get the cached free slots of a doctor-day if they have not expired"""
+        key = (doctor_id, day)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, slots = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return slots
+
+    def set(self, doctor_id: int, day: date, slots: tuple[time_of_day, ...]) -> None:
+        """Cache a doctor-day, evicting the least recently used entry if full"""
+        if self.max_size <= 0:
+            return
+        key = (doctor_id, day)
+        self._entries[key] = (time.monotonic() + self.ttl, slots)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, doctor_id: int, day: date) -> None:
+        """Drop one doctor-day"""
+        self._entries.pop((doctor_id, day), None)
+
+    def invalidate_doctor(self, doctor_id: int) -> None:
+        """Drop every cached day of a doctor"""
+        for key in [key for key in self._entries if key[0] == doctor_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached day"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache size and hit rate"""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+slot_cache = SlotCache(max_size=settings.SLOT_CACHE_MAX_SIZE, ttl=settings.SLOT_CACHE_TTL)
@@ -0,0 +1,78 @@
+"""Bounded cache of verified JWT claims"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+
+class VerifiedTokenCache:
+    """LRU cache of decoded claims keyed by a SHA-256 digest of the token
+
+    Only tokens that passed signature verification are stored, and each entry
+    is kept no longer than the token's own ``exp``. Operations never await, so
+    they are atomic with respect to other coroutines on the event loop.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """Digest the token so raw credentials are never held as keys"""
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Get the cached claims for a token if it has not expired"""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, claims = entry
+        if expires_at <= time.time():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(claims)
+
+    def set(self, token: str, claims: Dict[str, Any]) -> None:
+        """Cache verified claims until the token expires"""
+        expires_at = claims.get("exp")
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        key = self._key(token)
+        self._entries[key] = (float(expires_at), dict(claims))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        """Drop a token from the cache"""
+        self._entries.pop(self._key(token), None)
+
+    def clear(self) -> None:
+        """Drop every cached token"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache size and hit rate"""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_cache = VerifiedTokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
@@ -1,10 +1,13 @@
 """Ambulance Service CRUD operations"""
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
+from typing import Optional, Type
+from pydantic import BaseModel
 
 from app.db.models import AmbulanceService
 from app.schemas.ambulance import AmbulanceServiceCreate, AmbulanceServiceUpdate
+from app.core.pagination import Page
 from app.crud.base import CRUDBase
 
 
@@ -13,18 +16,17 @@ class CRUDAmbulanceService(CRUDBase[AmbulanceService, AmbulanceServiceCreate, Am
     
     async def get_by_name(self, db: AsyncSession, name: str) -> AmbulanceService:
         """Get ambulance service by name"""
-        result = await db.execute(
-            select(AmbulanceService).where(AmbulanceService.name == name)
-        )
+        statement = self._statement("get_by_name", lambda: select(AmbulanceService).where(AmbulanceService.name == bindparam("name")))
+        result = await db.execute(statement, {"name": name})
         return result.scalars().first()
     
-    async def get_active(self, db: AsyncSession, skip: int = 0, limit: int = 10) -> tuple[list[AmbulanceService], int]:
+    async def get_active(self, db: AsyncSession, skip: int = 0, limit: int = 10, include_total: bool = True, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get active ambulance services"""
-        return await self.get_all(db, skip, limit, {"is_active": True})
+        return await self.get_page(db, skip, limit, {"is_active": True}, include_total=include_total, cursor=cursor, response_model=response_model)
     
-    async def get_available_24_7(self, db: AsyncSession, skip: int = 0, limit: int = 10) -> tuple[list[AmbulanceService], int]:
+    async def get_available_24_7(self, db: AsyncSession, skip: int = 0, limit: int = 10, include_total: bool = True, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get 24/7 available ambulance services"""
-        return await self.get_all(db, skip, limit, {"is_active": True, "available_24_7": True})
+        return await self.get_page(db, skip, limit, {"is_active": True, "available_24_7": True}, include_total=include_total, cursor=cursor, response_model=response_model)
 
 
 ambulance_service = CRUDAmbulanceService(AmbulanceService)
@@ -1,49 +1,122 @@
 """Appointment CRUD operations"""
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, exists, and_, bindparam, event, inspect
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from datetime import date
-from typing import Optional
+from typing import Optional, Type
+from pydantic import BaseModel
 
-from app.db.models import Appointment
+from app.db.models import Appointment, Department, Doctor
 from app.schemas.appointment import AppointmentCreate, AppointmentUpdate
+from app.core.constants import AppointmentStatus, ErrorMessages
+from app.core.exceptions import ConflictException, NotFoundException
+from app.core.slot_cache import slot_cache
+from app.core.pagination import Page
 from .base import CRUDBase
 
 
 class CRUDAppointment(CRUDBase[Appointment, AppointmentCreate, AppointmentUpdate]):
     """Appointment CRUD operations"""
     
+    # Latest first; matches the (appointment_date, id) and (patient_id|doctor_id|status, appointment_date) indexes
+    sort_columns = ("appointment_date", "id")
+    sort_descending = True
+    
     async def create(self, db: AsyncSession, obj_in: AppointmentCreate, patient_id: Optional[int] = None) -> Appointment:
-        """Create new appointment with optional patient_id override"""
+        """Book an appointment with one INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING
+        
+        The row is selected from the department only while it is active, and
+        the partial unique index on active bookings of a doctor slot makes a
+        taken slot insert nothing. An unknown or archived department
+        (NotFoundException) and a taken slot (ConflictException) are told
+        apart only after the insert failed, and the foreign keys reject an
+        unknown doctor (NotFoundException). Nothing is looked up beforehand,
+        so concurrent requests cannot both book the same slot.
+        """
         obj_data = obj_in.dict()
-        if patient_id is not None:
-            obj_data["patient_id"] = patient_id
+        obj_data["patient_id"] = patient_id
+        
+        try:
+            result = await db.execute(self._book_statement(db.get_bind().dialect.name), obj_data)
+            db_obj = result.scalars().first()
+        except IntegrityError:
+            await db.rollback()
+            await self._check_references(db, obj_data)
+            # The references were valid by the time they were checked, e.g. the doctor was deleted in between
+            raise ConflictException(detail=ErrorMessages.DOCTOR_NOT_AVAILABLE)
+        if db_obj is None:
+            await db.rollback()
+            await self._check_references(db, obj_data)
+            raise ConflictException(detail=ErrorMessages.DOCTOR_NOT_AVAILABLE)
         
-        db_obj = self.model(**obj_data)
-        db.add(db_obj)
         await db.commit()
-        await db.refresh(db_obj)
+        if db_obj.doctor_id is not None:
+            slot_cache.invalidate(db_obj.doctor_id, db_obj.appointment_date)
         return db_obj
     
-    async def get_by_patient(self, db: AsyncSession, patient_id: int, skip: int = 0, limit: int = 100):
-        """Get appointments by patient"""
+    def _book_statement(self, dialect: str):
+        """Upsert selecting the booking from its active department, skipping rows clashing with a unique index"""
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        columns = ("patient_id", "doctor_id", "appointment_date", "appointment_time", "notes")
+        
+        def build():
+            row = select(
+                *(bindparam(name, type_=Appointment.__table__.c[name].type) for name in columns),
+                Department.id,
+            ).where(
+                and_(
+                    Department.id == bindparam("department_id"),
+                    Department.is_active == True,
+                )
+            )
+            # Loaded through from_statement, as ORM inserts take their parameters as the row itself
+            return select(Appointment).from_statement(
+                insert(Appointment.__table__)
+                .from_select([*columns, "department_id"], row)
+                # Only a clash with uq_appointments_doctor_slot means the slot is taken
+                .on_conflict_do_nothing(
+                    index_elements=["doctor_id", "appointment_date", "appointment_time"],
+                    index_where=Appointment.status.in_(AppointmentStatus.ACTIVE),
+                )
+                .returning(*Appointment.__table__.c)
+            )
+        
+        return self._statement(("book", dialect), build)
+    
+    async def _check_references(self, db: AsyncSession, obj_data: dict) -> None:
+        """Raise NotFoundException for the archived or unknown department or unknown doctor of a failed booking"""
+        statement = self._statement("check_references", lambda: select(
+            exists().where(and_(Department.id == bindparam("department_id"), Department.is_active == True)),
+            exists().where(Doctor.id == bindparam("doctor_id")),
+        ))
         result = await db.execute(
-            select(Appointment)
-            .where(Appointment.patient_id == patient_id)
-            .offset(skip)
-            .limit(limit)
+            statement,
+            {"department_id": obj_data["department_id"], "doctor_id": obj_data.get("doctor_id")},
         )
-        return result.scalars().all()
+        department_active, doctor_exists = result.one()
+        if not department_active:
+            raise NotFoundException(detail="Department not found")
+        if obj_data.get("doctor_id") is not None and not doctor_exists:
+            raise NotFoundException(detail="Doctor not found")
+    
+    async def update(self, db: AsyncSession, db_obj: Appointment, obj_in: AppointmentUpdate) -> Appointment:
+        """Update appointment; moving it onto a booked slot raises ConflictException"""
+        try:
+            return await super().update(db, db_obj, obj_in)
+        except IntegrityError:
+            await db.rollback()
+            raise ConflictException(detail=ErrorMessages.DOCTOR_NOT_AVAILABLE)
+    
+    async def get_by_patient(self, db: AsyncSession, patient_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
+        """Get appointments by patient"""
+        return await self.get_page(db, skip, limit, {"patient_id": patient_id}, include_total=False, cursor=cursor, response_model=response_model)
     
-    async def get_by_doctor(self, db: AsyncSession, doctor_id: int, skip: int = 0, limit: int = 100):
+    async def get_by_doctor(self, db: AsyncSession, doctor_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get appointments by doctor"""
-        result = await db.execute(
-            select(Appointment)
-            .where(Appointment.doctor_id == doctor_id)
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        return await self.get_page(db, skip, limit, {"doctor_id": doctor_id}, include_total=False, cursor=cursor, response_model=response_model)
     
     async def get_by_date_range(
         self,
@@ -54,28 +127,26 @@ class CRUDAppointment(CRUDBase[Appointment, AppointmentCreate, AppointmentUpdate
         limit: int = 100
     ):
         """Get appointments by date range"""
-        result = await db.execute(
-            select(Appointment)
+        statement = self._statement("get_by_date_range", lambda: (
+            self._order_by(select(Appointment))
             .where(
                 and_(
-                    Appointment.appointment_date >= start_date,
-                    Appointment.appointment_date <= end_date
+                    Appointment.appointment_date >= bindparam("start_date"),
+                    Appointment.appointment_date <= bindparam("end_date")
                 )
             )
-            .offset(skip)
-            .limit(limit)
+            .offset(bindparam("skip"))
+            .limit(bindparam("limit"))
+        ))
+        result = await db.execute(
+            statement,
+            {"start_date": start_date, "end_date": end_date, "skip": skip, "limit": limit},
         )
         return result.scalars().all()
     
-    async def get_by_status(self, db: AsyncSession, status: str, skip: int = 0, limit: int = 100):
+    async def get_by_status(self, db: AsyncSession, status: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get appointments by status"""
-        result = await db.execute(
-            select(Appointment)
-            .where(Appointment.status == status)
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        return await self.get_page(db, skip, limit, {"status": status}, include_total=False, cursor=cursor, response_model=response_model)
     
     async def check_availability(
         self,
@@ -85,18 +156,51 @@ class CRUDAppointment(CRUDBase[Appointment, AppointmentCreate, AppointmentUpdate
         appointment_time: str
     ) -> bool:
         """Check if doctor is available at given time"""
-        result = await db.execute(
-            select(Appointment)
+        statement = self._statement("check_availability", lambda: (
+            select(Appointment.id)
             .where(
                 and_(
-                    Appointment.doctor_id == doctor_id,
-                    Appointment.appointment_date == appointment_date,
-                    Appointment.appointment_time == appointment_time,
-                    Appointment.status.in_(["confirmed", "pending"])
+                    Appointment.doctor_id == bindparam("doctor_id"),
+                    Appointment.appointment_date == bindparam("appointment_date"),
+                    Appointment.appointment_time == bindparam("appointment_time"),
+                    Appointment.status.in_(AppointmentStatus.ACTIVE)
                 )
             )
+            .limit(1)
+        ))
+        result = await db.execute(
+            statement,
+            {"doctor_id": doctor_id, "appointment_date": appointment_date, "appointment_time": appointment_time},
         )
-        return result.scalars().first() is None
+        return result.first() is None
+
+
+@event.listens_for(Appointment, "after_update")
+@event.listens_for(Appointment, "after_delete")
+def _track_booked_day(mapper, connection, target):
+    """Remember the doctor-days an appointment change frees or takes, old and new"""
+    session = object_session(target)
+    if session is None:
+        return
+    state = inspect(target)
+    days = session.info.setdefault("changed_doctor_days", set())
+    for doctor_id in state.attrs.doctor_id.history.sum():
+        for day in state.attrs.appointment_date.history.sum():
+            if doctor_id is not None:
+                days.add((doctor_id, day))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_booked_days(session):
+    """Drop the cached free slots of doctor-days changed by a commit"""
+    for doctor_id, day in session.info.pop("changed_doctor_days", ()):
+        slot_cache.invalidate(doctor_id, day)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_booked_days(session):
+    """Forget tracked appointment changes that were rolled back"""
+    session.info.pop("changed_doctor_days", None)
 
 
 appointment = CRUDAppointment(Appointment)
@@ -1,23 +1,151 @@
 """Base CRUD operations"""
 
+from collections.abc import Mapping
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import Generic, TypeVar, Type, Optional, List, Any
+from sqlalchemy import select, insert, update, delete, func, bindparam, table, column, tuple_, inspect, any_, BigInteger, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import undefer, joinedload, selectinload
+from sqlalchemy.sql import Executable
+from typing import Generic, TypeVar, Type, Optional, List, Any, Callable, Hashable, Sequence, get_args
+
+from app.config import settings
+from app.core.constants import ErrorMessages
+from app.core.exceptions import ValidationException, ConflictException, BatchException
+from app.core.pagination import Page, encode_cursor, decode_cursor
 
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType")
 UpdateSchemaType = TypeVar("UpdateSchemaType")
 
 
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Response model of a nested field typed X or Optional[X]"""
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+def _entities(rows: Sequence[Row]) -> List[Any]:
+    """ORM objects from rows whose first column is the entity"""
+    return [row[0] for row in rows]
+
+
+def _mappings(rows: Sequence[Row]) -> List[Any]:
+    """Column-name mappings of projected rows"""
+    return [row._mapping for row in rows]
+
+
+def _nested_mappings(rows: Sequence[Row]) -> List[dict]:
+    """Projected rows with <relationship>__<column> labels folded into nested dicts"""
+    items = []
+    for row in rows:
+        item: dict = {}
+        for key, value in row._mapping.items():
+            outer, _, inner = key.partition("__")
+            if inner:
+                item.setdefault(outer, {})[inner] = value
+            else:
+                item[key] = value
+        for key, value in item.items():
+            # An outer join that found nothing
+            if isinstance(value, dict) and all(nested is None for nested in value.values()):
+                item[key] = None
+        items.append(item)
+    return items
+
+
+def _item_error(index: int, id: Optional[int], detail: str) -> dict:
+    """One failing item of a batch, by position (and id, for existing records)"""
+    error: dict = {"index": index}
+    if id is not None:
+        error["id"] = id
+    error["detail"] = detail
+    return error
+
+
+def loading_plan(model: Any, paths: Sequence[str], joined: bool = True) -> tuple:
+    """Loader options for relationship paths such as "doctor.user"
+    
+    Relationships are lazy="raise", so whatever a caller reads must be named
+    here. Many-to-one steps are joined into the statement (selectin-loaded
+    when joined is False, e.g. for INSERT ... RETURNING); collections are
+    selectin-loaded with one statement each.
+    """
+    options = []
+    for path in paths:
+        option = None
+        entity = model
+        for name in path.split("."):
+            relationship = inspect(entity).relationships.get(name)
+            if relationship is None:
+                raise ValueError(f"{entity.__name__} has no relationship {name!r}")
+            attribute = getattr(entity, name)
+            strategy = joinedload if joined and not relationship.uselist else selectinload
+            option = strategy(attribute) if option is None else getattr(option, strategy.__name__)(attribute)
+            entity = relationship.mapper.class_
+        options.append(option)
+    return tuple(options)
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base CRUD class"""
     
+    # Listing order; the columns (ending in a unique one) should be indexed for keyset pagination
+    sort_columns: tuple[str, ...] = ("id",)
+    sort_descending: bool = False
+    # Relationship paths (see loading_plan) loaded with listing queries
+    list_load: tuple[str, ...] = ()
+    
     def __init__(self, model: Type[ModelType]):
         self.model = model
+        self._statements: dict[Hashable, Executable] = {}
+        self._projections: dict[Type[BaseModel], tuple[Any, Callable]] = {}
+        # Columns deferred on the model, which single-record reads load anyway
+        self._deferred = tuple(attr.key for attr in inspect(model).column_attrs if attr.deferred)
+        self._undefer_options = tuple(undefer(getattr(model, key)) for key in self._deferred)
+        self._columns = frozenset(attr.key for attr in inspect(model).column_attrs)
+        # Single-column unique constraints, checked per item by the bulk writes
+        self._unique = tuple(col.key for col in model.__table__.columns if col.unique)
+    
+    def _statement(self, key: Hashable, build: Callable[[], Executable]) -> Executable:
+        """Build a statement once and reuse it on every call
+        
+        Values go in as bindparams supplied at execute time, so the same
+        statement object (and its memoized cache key and compiled SQL) serves
+        every call instead of a new select() being built and keyed each time.
+        """
+        statement = self._statements.get(key)
+        if statement is None:
+            statement = self._statements[key] = build()
+        return statement
+    
+    def _filter_keys(self, filters: Optional[dict]) -> tuple[str, ...]:
+        """Filter names that map to model columns and have a value"""
+        if not filters:
+            return ()
+        return tuple(
+            key for key, value in filters.items()
+            if hasattr(self.model, key) and value is not None
+        )
+    
+    def _where_filters(self, statement, keys: tuple[str, ...]):
+        """Add an equality bindparam (named f_<key>) per filter"""
+        for key in keys:
+            statement = statement.where(getattr(self.model, key) == bindparam(f"f_{key}"))
+        return statement
     
-    async def get(self, db: AsyncSession, id: int) -> Optional[ModelType]:
-        """Get single record by ID"""
-        result = await db.execute(select(self.model).where(self.model.id == id))
+    async def get(self, db: AsyncSession, id: int, load: Sequence[str] = ()) -> Optional[ModelType]:
+        """Get single record by ID, with the relationship paths in load"""
+        statement = self._statement(("get", tuple(load)), lambda: (
+            select(self.model)
+            .where(self.model.id == bindparam("id"))
+            .options(*self._undefer_options, *loading_plan(self.model, load))
+        ))
+        result = await db.execute(statement, {"id": id})
         return result.scalars().first()
     
     async def get_all(
@@ -25,49 +153,266 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
-        filters: Optional[dict] = None
-    ) -> tuple[List[ModelType], int]:
-        """Get all records with pagination and optional filters"""
-        query = select(self.model)
-        
-        # Apply filters if provided
-        if filters:
-            for key, value in filters.items():
-                if hasattr(self.model, key) and value is not None:
-                    query = query.where(getattr(self.model, key) == value)
-        
-        # Get total count
-        count_query = select(func.count(self.model.id))
-        if filters:
-            for key, value in filters.items():
-                if hasattr(self.model, key) and value is not None:
-                    count_query = count_query.where(getattr(self.model, key) == value)
-        
-        count_result = await db.execute(count_query)
-        total = count_result.scalar() or 0
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        result = await db.execute(query)
-        items = result.scalars().all()
+        filters: Optional[dict] = None,
+        include_total: bool = True,
+        estimated_total: bool = False,
+    ) -> tuple[List[ModelType], Optional[int]]:
+        """Get all records with pagination and optional filters
         
-        return items, total
+        The total (None when include_total is False) comes from the page
+        query itself. With estimated_total, unfiltered listings of tables
+        larger than ESTIMATED_COUNT_MIN_ROWS report the planner's row
+        estimate instead of counting.
+        """
+        page = await self.get_page(db, skip, limit, filters, include_total, estimated_total)
+        return page.items, page.total
     
-    async def create(self, db: AsyncSession, obj_in: CreateSchemaType) -> ModelType:
-        """Create new record"""
-        db_obj = self.model(**obj_in.dict())
-        db.add(db_obj)
+    async def get_page(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[dict] = None,
+        include_total: bool = True,
+        estimated_total: bool = False,
+        cursor: Optional[str] = None,
+        response_model: Optional[Type[BaseModel]] = None,
+    ) -> Page:
+        """get_all, plus a next_cursor for keyset pagination
+        
+        Pass the previous page's next_cursor to continue after it; skip is
+        ignored when a cursor is given. With a response_model the items are
+        row mappings of just the columns it reads (see _projection) instead
+        of ORM objects.
+        """
+        keys = self._filter_keys(filters)
+        params = {f"f_{key}": filters[key] for key in keys}
+        if response_model is None:
+            build = lambda: self._where_filters(select(self.model), keys).options(*loading_plan(self.model, self.list_load))
+            shape = _entities
+        else:
+            projection, shape = self._projection(response_model)
+            build = lambda: self._where_filters(projection, keys)
+        key = ("get_all", keys, response_model)
+        
+        if include_total and estimated_total and not keys:
+            estimate = await self.estimate_count(db)
+            if estimate is not None and estimate >= settings.ESTIMATED_COUNT_MIN_ROWS:
+                page = await self._fetch_page(db, key, build, params, skip, limit, False, cursor, shape)
+                return page._replace(total=estimate)
+        
+        return await self._fetch_page(db, key, build, params, skip, limit, include_total, cursor, shape)
+    
+    def _projection(self, response_model: Type[BaseModel]) -> tuple[Any, Callable]:
+        """Select of only the columns response_model reads, and how to shape its rows
+        
+        Model columns named like a response field are selected, plus the sort
+        columns. A field typed as a nested response model that names a
+        many-to-one relationship is filled from an outer join, its columns
+        labelled <relationship>__<column>. Skipping ORM hydration leaves
+        pydantic a single copy to make, and unused (often large Text)
+        columns are never read.
+        """
+        projection = self._projections.get(response_model)
+        if projection is not None:
+            return projection
+        
+        mapper = inspect(self.model)
+        wanted = set(response_model.model_fields) | set(self.sort_columns)
+        columns = [getattr(self.model, attr.key) for attr in mapper.column_attrs if attr.key in wanted]
+        joins = []
+        for name, field in response_model.model_fields.items():
+            nested = _nested_model(field.annotation)
+            relationship = mapper.relationships.get(name)
+            if nested is None or relationship is None or relationship.uselist:
+                continue
+            related = relationship.mapper.class_
+            columns += [
+                getattr(related, attr.key).label(f"{name}__{attr.key}")
+                for attr in relationship.mapper.column_attrs
+                if attr.key in nested.model_fields
+            ]
+            joins.append(getattr(self.model, name))
+        
+        statement = select(*columns)
+        for relationship in joins:
+            statement = statement.outerjoin(relationship)
+        projection = self._projections[response_model] = (statement, _nested_mappings if joins else _mappings)
+        return projection
+    
+    def _sort_key(self) -> str:
+        """Identifies the listing order a cursor was issued for"""
+        direction = "desc" if self.sort_descending else "asc"
+        return f"{self.model.__tablename__}:{','.join(self.sort_columns)}:{direction}"
+    
+    def _order_by(self, statement):
+        """Order by the sort columns"""
+        columns = [getattr(self.model, name) for name in self.sort_columns]
+        if self.sort_descending:
+            columns = [column.desc() for column in columns]
+        return statement.order_by(*columns)
+    
+    def _after_cursor(self, statement):
+        """Keep rows after the cursor row: (sort columns) >/< bindparams c_<n>"""
+        columns = [getattr(self.model, name) for name in self.sort_columns]
+        position = tuple_(*[bindparam(f"c_{index}", type_=col.type) for index, col in enumerate(columns)])
+        if self.sort_descending:
+            return statement.where(tuple_(*columns) < position)
+        return statement.where(tuple_(*columns) > position)
+    
+    def _next_cursor(self, items: List[Any], limit: int) -> Optional[str]:
+        """Cursor after the last item, if a row beyond the page was fetched"""
+        if len(items) <= limit:
+            return None
+        last = items[limit - 1]
+        if isinstance(last, Mapping):
+            values = [last[name] for name in self.sort_columns]
+        else:
+            values = [getattr(last, name) for name in self.sort_columns]
+        return encode_cursor(self._sort_key(), values)
+    
+    async def _fetch_page(
+        self,
+        db: AsyncSession,
+        key: Hashable,
+        build: Callable[[], Any],
+        params: dict,
+        skip: int,
+        limit: int,
+        include_total: bool,
+        cursor: Optional[str] = None,
+        shape: Callable[[Sequence[Row]], List[Any]] = _entities,
+    ) -> Page:
+        """Run a page query in sort order, after the cursor if given
+        
+        One extra row is fetched to tell whether a next page exists. The
+        total is read from a count(*) OVER () column when requested; after a
+        cursor the window only sees the remaining rows, so it is counted
+        separately instead.
+        """
+        page_params = {**params, "skip": skip, "limit": limit + 1}
+        after = cursor is not None
+        if after:
+            values = decode_cursor(cursor, self._sort_key())
+            if len(values) != len(self.sort_columns):
+                raise ValidationException(detail=ErrorMessages.INVALID_CURSOR)
+            page_params.update({f"c_{index}": value for index, value in enumerate(values)})
+            page_params["skip"] = 0
+        
+        def build_page():
+            statement = self._order_by(build())
+            if after:
+                statement = self._after_cursor(statement)
+            return statement
+        
+        if not include_total or after:
+            query = self._statement(
+                (key, "page", after),
+                lambda: build_page().offset(bindparam("skip")).limit(bindparam("limit")),
+            )
+            result = await db.execute(query, page_params)
+            items = shape(result.all())
+            total = await self._count(db, key, build, params) if include_total else None
+            return Page(items[:limit], total, self._next_cursor(items, limit))
+        
+        query = self._statement(
+            (key, "page_with_total"),
+            lambda: build_page()
+            .add_columns(func.count().over().label("total"))
+            .offset(bindparam("skip"))
+            .limit(bindparam("limit")),
+        )
+        result = await db.execute(query, page_params)
+        rows = result.all()
+        if rows:
+            items = shape(rows)
+            return Page(items[:limit], rows[0].total, self._next_cursor(items, limit))
+        if skip == 0:
+            return Page([], 0, None)
+        
+        # Past the last page there is no row to carry the window total
+        return Page([], await self._count(db, key, build, params), None)
+    
+    async def _count(self, db: AsyncSession, key: Hashable, build: Callable[[], Any], params: dict) -> int:
+        """Count every row of a listing"""
+        count_query = self._statement(
+            (key, "count"),
+            lambda: select(func.count()).select_from(build().subquery()),
+        )
+        count_result = await db.execute(count_query, params)
+        return count_result.scalar() or 0
+    
+    async def estimate_count(self, db: AsyncSession) -> Optional[int]:
+        """Planner's row estimate for the whole table (PostgreSQL only)
+        
+        Returns None on other databases or before the table was first analyzed.
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return None
+        
+        query = self._statement(
+            "estimate_count",
+            lambda: select(column("reltuples").cast(BigInteger))
+            .select_from(table("pg_class"))
+            .where(column("oid") == func.to_regclass(self.model.__tablename__)),
+        )
+        result = await db.execute(query)
+        estimate = result.scalar()
+        if estimate is None or estimate < 0:
+            return None
+        return estimate
+    
+    async def create(self, db: AsyncSession, obj_in: CreateSchemaType, load: Sequence[str] = ()) -> ModelType:
+        """Create new record, with the relationship paths in load"""
+        return await self._insert(db, obj_in.dict(), load)
+    
+    async def _insert(self, db: AsyncSession, values: dict, load: Sequence[str] = ()) -> ModelType:
+        """Insert one row with INSERT ... RETURNING and commit
+        
+        Server-generated columns (id, server defaults) come back with the
+        INSERT, so the returned record needs no refresh after the commit.
+        Relationships in load are selectin-loaded right after it.
+        """
+        result = await db.execute(self._insert_statement(load), values)
+        db_obj = result.scalars().one()
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
     
+    async def _insert_many(self, db: AsyncSession, rows: Sequence[dict]) -> List[ModelType]:
+        """Insert rows with multi-row INSERT ... RETURNING, records in the order of rows
+        
+        PostgreSQL sorts the returned records by parameter order itself.
+        SQLite cannot without running one INSERT per row, but a single
+        writer gives the rows ascending ids in order, so the records are
+        sorted by id there instead.
+        """
+        ordered = db.get_bind().dialect.name == "postgresql"
+        result = await db.execute(self._insert_statement(ordered=ordered), rows)
+        items = result.scalars().all()
+        if not ordered:
+            items = sorted(items, key=lambda item: item.id)
+        return items
+    
+    def _insert_statement(self, load: Sequence[str] = (), ordered: bool = False) -> Executable:
+        """ORM INSERT returning the whole record, deferred columns included"""
+        return self._statement(("insert", tuple(load), ordered), lambda: (
+            insert(self.model)
+            .returning(self.model, sort_by_parameter_order=ordered)
+            .options(*self._undefer_options, *loading_plan(self.model, load, joined=False))
+        ))
+    
     async def update(
         self,
         db: AsyncSession,
         db_obj: ModelType,
         obj_in: UpdateSchemaType
     ) -> ModelType:
-        """Update existing record"""
+        """Update existing record
+        
+        Goes through the unit of work so mapper events still fire; the flush
+        is a single UPDATE (RETURNING any server-generated columns) and the
+        record is not refreshed after the commit.
+        """
         update_data = obj_in.dict(exclude_unset=True)
         for field, value in update_data.items():
             if hasattr(db_obj, field):
@@ -75,24 +420,180 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         
         db.add(db_obj)
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
     
     async def delete(self, db: AsyncSession, id: int) -> bool:
-        """Delete record by ID"""
-        db_obj = await self.get(db, id)
-        if db_obj:
-            await db.delete(db_obj)
-            await db.commit()
-            return True
-        return False
+        """Delete record by ID with a single DELETE ... RETURNING
+        
+        Dependent rows are left to the foreign keys' ON DELETE rules rather
+        than loaded and deleted one by one, and mapper delete events do not
+        fire.
+        """
+        statement = self._statement("delete", lambda: (
+            delete(self.model).where(self.model.id == bindparam("id")).returning(self.model.id)
+        ))
+        result = await db.execute(statement, {"id": id})
+        deleted = result.first() is not None
+        await db.commit()
+        return deleted
     
     async def exists(self, db: AsyncSession, **filters) -> bool:
         """Check if record exists"""
-        query = select(self.model)
-        for key, value in filters.items():
-            if hasattr(self.model, key):
-                query = query.where(getattr(self.model, key) == value)
+        keys = tuple(key for key in filters if hasattr(self.model, key) and filters[key] is not None)
+        null_keys = tuple(key for key in filters if hasattr(self.model, key) and filters[key] is None)
         
-        result = await db.execute(query)
-        return result.scalars().first() is not None
+        def build():
+            query = self._where_filters(select(self.model.id), keys)
+            for key in null_keys:
+                query = query.where(getattr(self.model, key).is_(None))
+            return query.limit(1)
+        
+        query = self._statement(("exists", keys, null_keys), build)
+        result = await db.execute(query, {f"f_{key}": filters[key] for key in keys})
+        return result.first() is not None
+    
+    async def bulk_create(self, db: AsyncSession, objs_in: Sequence[CreateSchemaType]) -> List[ModelType]:
+        """Create many records in one transaction
+        
+        The rows go out as multi-row INSERT ... VALUES ... RETURNING
+        statements (up to a thousand rows each) with a single commit. Raises
+        BatchException listing each failing item, writing nothing, if any
+        item would break a unique column.
+        """
+        rows = [obj_in.dict() for obj_in in objs_in]
+        errors = await self._unique_errors(db, [(index, None, row) for index, row in enumerate(rows)])
+        if errors:
+            raise BatchException(errors)
+        
+        try:
+            items = await self._insert_many(db, rows)
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise ConflictException(detail=ErrorMessages.CONFLICT)
+        return items
+    
+    async def bulk_update(
+        self,
+        db: AsyncSession,
+        objs_in: Sequence[tuple[int, UpdateSchemaType]],
+    ) -> List[ModelType]:
+        """Apply (id, changes) pairs in one transaction
+        
+        Items setting the same fields share one executemany UPDATE ... WHERE
+        id = ? and there is a single commit. Raises BatchException listing
+        each failing item (unknown or repeated id, unique column clash),
+        writing nothing, if any item fails.
+        """
+        changes = [
+            (index, id, {key: value for key, value in obj_in.dict(exclude_unset=True).items() if key in self._columns})
+            for index, (id, obj_in) in enumerate(objs_in)
+        ]
+        errors = await self._update_errors(db, changes)
+        if errors:
+            raise BatchException(errors)
+        
+        rows = [{**values, "id": id} for _, id, values in changes if values]
+        try:
+            if rows:
+                await db.execute(update(self.model), rows)
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise ConflictException(detail=ErrorMessages.CONFLICT)
+        return await self._get_many(db, [id for id, _ in objs_in])
+    
+    async def bulk_delete(self, db: AsyncSession, ids: Sequence[int]) -> List[int]:
+        """Delete many records by ID with one DELETE ... RETURNING and one commit
+        
+        PostgreSQL gets the ids as a single array parameter (id = ANY(:ids)),
+        other databases an expanded IN list. Raises BatchException, deleting
+        nothing, if any id does not exist.
+        """
+        dialect = db.get_bind().dialect.name
+        
+        def build():
+            if dialect == "postgresql":
+                condition = self.model.id == any_(bindparam("ids", type_=ARRAY(Integer)))
+            else:
+                condition = self.model.id.in_(bindparam("ids", expanding=True))
+            return delete(self.model).where(condition).returning(self.model.id)
+        
+        statement = self._statement(("bulk_delete", dialect), build)
+        result = await db.execute(statement, {"ids": list(ids)})
+        deleted = set(result.scalars().all())
+        errors = [
+            _item_error(index, id, ErrorMessages.NOT_FOUND)
+            for index, id in enumerate(ids) if id not in deleted
+        ]
+        if errors:
+            await db.rollback()
+            raise BatchException(errors)
+        
+        await db.commit()
+        return list(ids)
+    
+    async def _update_errors(self, db: AsyncSession, changes: Sequence[tuple[int, int, dict]]) -> List[dict]:
+        """Per-item errors of a batch update of (index, id, values) changes"""
+        ids = [id for _, id, _ in changes]
+        existing = set(await self._existing_ids(db, ids))
+        errors = []
+        seen = set()
+        for index, id in enumerate(ids):
+            if id not in existing:
+                errors.append(_item_error(index, id, ErrorMessages.NOT_FOUND))
+            elif id in seen:
+                errors.append(_item_error(index, id, "Duplicate id in batch"))
+            seen.add(id)
+        errors += await self._unique_errors(db, changes)
+        return sorted(errors, key=lambda error: error["index"])
+    
+    async def _existing_ids(self, db: AsyncSession, ids: Sequence[int]) -> List[int]:
+        """Those of ids that exist"""
+        statement = self._statement("existing_ids", lambda: (
+            select(self.model.id).where(self.model.id.in_(bindparam("ids", expanding=True)))
+        ))
+        result = await db.execute(statement, {"ids": list(ids)})
+        return result.scalars().all()
+    
+    async def _get_many(self, db: AsyncSession, ids: Sequence[int]) -> List[ModelType]:
+        """Records by ID, in the order of ids, freshly loaded"""
+        statement = self._statement("get_many", lambda: (
+            select(self.model)
+            .where(self.model.id.in_(bindparam("ids", expanding=True)))
+            .options(*self._undefer_options)
+            .execution_options(populate_existing=True)
+        ))
+        result = await db.execute(statement, {"ids": list(ids)})
+        by_id = {db_obj.id: db_obj for db_obj in result.scalars().all()}
+        return [by_id[id] for id in ids if id in by_id]
+    
+    async def _unique_errors(self, db: AsyncSession, items: Sequence[tuple[int, Optional[int], dict]]) -> List[dict]:
+        """Per-item errors for unique column values repeated in the batch or taken by another record
+        
+        items are (index, id or None for new records, values).
+        """
+        errors = []
+        for key in self._unique:
+            values = {}
+            for index, id, row in items:
+                value = row.get(key)
+                if value is None:
+                    continue
+                if value in values:
+                    errors.append(_item_error(index, id, f"Duplicate {key} in batch"))
+                else:
+                    values[value] = (index, id)
+            if not values:
+                continue
+            
+            column_ = getattr(self.model, key)
+            statement = self._statement(("taken", key), lambda: (
+                select(column_, self.model.id).where(column_.in_(bindparam("values", expanding=True)))
+            ))
+            result = await db.execute(statement, {"values": list(values)})
+            for value, owner_id in result.all():
+                index, id = values[value]
+                if owner_id != id:
+                    errors.append(_item_error(index, id, f"{key} already exists"))
+        return sorted(errors, key=lambda error: error["index"])
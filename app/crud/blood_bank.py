@@ -1,9 +1,13 @@
 """Blood Bank CRUD operations"""
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from app.db.models import BloodBank
+from sqlalchemy import select, and_, bindparam
+from typing import Optional, List, Sequence
+from app.db.models import BloodBank, BloodInventory
 from app.schemas.blood_bank import BloodBankCreate, BloodBankUpdate
+from app.core.constants import BloodGroup
+from app.core.exceptions import BatchException
+from app.core.pagination import Page
 from app.crud.base import CRUDBase
 
 
@@ -12,69 +16,98 @@ class CRUDBloodBank(CRUDBase[BloodBank, BloodBankCreate, BloodBankUpdate]):
     
     async def get_by_name(self, db: AsyncSession, name: str) -> BloodBank | None:
         """Get blood bank by name"""
-        query = select(self.model).where(self.model.name == name)
-        result = await db.execute(query)
+        query = self._statement("get_by_name", lambda: select(self.model).where(self.model.name == bindparam("name")))
+        result = await db.execute(query, {"name": name})
         return result.scalars().first()
     
     async def get_available_24_7(
         self, 
         db: AsyncSession, 
         skip: int = 0, 
-        limit: int = 10
-    ) -> tuple[list[BloodBank], int]:
+        limit: int = 10,
+        include_total: bool = True,
+        cursor: Optional[str] = None
+    ) -> Page:
         """Get 24/7 available blood banks"""
         filters = {"available_24_7": True, "is_active": True}
-        return await self.get_all(db, skip=skip, limit=limit, filters=filters)
+        return await self.get_page(db, skip=skip, limit=limit, filters=filters, include_total=include_total, cursor=cursor)
     
     async def get_by_blood_group(
         self, 
         db: AsyncSession, 
         blood_group: str,
         skip: int = 0,
-        limit: int = 10
-    ) -> tuple[list[BloodBank], int]:
-        """Get blood banks with available blood group"""
-        # Map blood group to column name
-        blood_group_map = {
-            "O+": "blood_group_o_positive",
-            "O-": "blood_group_o_negative",
-            "A+": "blood_group_a_positive",
-            "A-": "blood_group_a_negative",
-            "B+": "blood_group_b_positive",
-            "B-": "blood_group_b_negative",
-            "AB+": "blood_group_ab_positive",
-            "AB-": "blood_group_ab_negative",
-        }
+        limit: int = 10,
+        include_total: bool = True,
+        cursor: Optional[str] = None
+    ) -> Page:
+        """Get blood banks with available blood group
         
-        column_name = blood_group_map.get(blood_group)
-        if not column_name:
-            return [], 0
+        The inventory subquery is answered from the (blood_group, units,
+        bank_id) index alone.
+        """
+        if blood_group not in BloodGroup.ALL:
+            return Page([], 0, None)
         
-        # Get column dynamically
-        column = getattr(self.model, column_name)
+        in_stock = (
+            select(BloodInventory.bank_id)
+            .where(BloodInventory.blood_group == bindparam("blood_group"))
+            .where(BloodInventory.units > 0)
+        )
+        return await self._fetch_page(
+            db,
+            "get_by_blood_group",
+            lambda: select(self.model).where(and_(self.model.id.in_(in_stock), self.model.is_active == True)),
+            {"blood_group": blood_group},
+            skip,
+            limit,
+            include_total,
+            cursor,
+        )
+
+    
+    async def create(self, db: AsyncSession, obj_in: BloodBankCreate) -> BloodBank:
+        """Create new blood bank
         
-        # Query for banks with available blood
-        query = select(self.model).where(
-            and_(
-                column > 0,
-                self.model.is_active == True
-            )
-        ).offset(skip).limit(limit)
+        The blood group fields become blood_inventory rows, so this goes
+        through the unit of work rather than a single INSERT ... RETURNING.
+        """
+        bank = BloodBank(**obj_in.dict())
+        db.add(bank)
+        await db.commit()
+        return bank
+    
+    async def bulk_create(self, db: AsyncSession, objs_in: Sequence[BloodBankCreate]) -> List[BloodBank]:
+        """Create many blood banks in one transaction
         
-        result = await db.execute(query)
-        items = result.scalars().all()
+        The blood group fields live in blood_inventory rows rather than
+        columns, so the banks go through the unit of work, whose flush still
+        sends each table's rows as batched multi-row INSERTs.
+        """
+        rows = [obj_in.dict() for obj_in in objs_in]
+        errors = await self._unique_errors(db, [(index, None, row) for index, row in enumerate(rows)])
+        if errors:
+            raise BatchException(errors)
         
-        # Get total count
-        count_query = select(self.model).where(
-            and_(
-                column > 0,
-                self.model.is_active == True
-            )
-        )
-        count_result = await db.execute(count_query)
-        total = len(count_result.scalars().all())
+        banks = [BloodBank(**row) for row in rows]
+        db.add_all(banks)
+        await db.commit()
+        return banks
+    
+    async def bulk_update(self, db: AsyncSession, objs_in: Sequence[tuple[int, BloodBankUpdate]]) -> List[BloodBank]:
+        """Apply (id, changes) pairs, blood group units included, in one transaction"""
+        changes = [(index, id, obj_in.dict(exclude_unset=True)) for index, (id, obj_in) in enumerate(objs_in)]
+        errors = await self._update_errors(db, changes)
+        if errors:
+            raise BatchException(errors)
         
-        return items, total
+        banks = await self._get_many(db, [id for id, _ in objs_in])
+        for bank, (_, _, values) in zip(banks, changes):
+            for field, value in values.items():
+                if hasattr(bank, field):
+                    setattr(bank, field, value)
+        await db.commit()
+        return banks
 
 
 # Create instance
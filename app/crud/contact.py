@@ -1,35 +1,29 @@
 """Contact message CRUD operations"""
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from typing import Optional, Type
+from pydantic import BaseModel
 
 from app.db.models import ContactMessage
 from app.schemas.contact import ContactMessageCreate, ContactMessageUpdate
+from app.core.pagination import Page
 from .base import CRUDBase
 
 
 class CRUDContactMessage(CRUDBase[ContactMessage, ContactMessageCreate, ContactMessageUpdate]):
     """Contact message CRUD operations"""
     
-    async def get_by_status(self, db: AsyncSession, status: str, skip: int = 0, limit: int = 100):
+    # Newest first; matches the (created_at, id) and (status, created_at) indexes
+    sort_columns = ("created_at", "id")
+    sort_descending = True
+    
+    async def get_by_status(self, db: AsyncSession, status: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get messages by status"""
-        result = await db.execute(
-            select(ContactMessage)
-            .where(ContactMessage.status == status)
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        return await self.get_page(db, skip, limit, {"status": status}, include_total=False, cursor=cursor, response_model=response_model)
     
-    async def get_by_email(self, db: AsyncSession, email: str, skip: int = 0, limit: int = 100):
+    async def get_by_email(self, db: AsyncSession, email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get messages by email"""
-        result = await db.execute(
-            select(ContactMessage)
-            .where(ContactMessage.email == email)
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        return await self.get_page(db, skip, limit, {"email": email}, include_total=False, cursor=cursor, response_model=response_model)
 
 
 contact_message = CRUDContactMessage(ContactMessage)
@@ -1,10 +1,14 @@
 """Department CRUD operations"""
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, bindparam
+from typing import Optional, Type
+from pydantic import BaseModel
 
-from app.db.models import Department
+from app.db.models import Department, Doctor
 from app.schemas.department import DepartmentCreate, DepartmentUpdate
+from app.core.pagination import Page
+from app.core.slot_cache import slot_cache
 from .base import CRUDBase
 
 
@@ -13,18 +17,55 @@ class CRUDDepartment(CRUDBase[Department, DepartmentCreate, DepartmentUpdate]):
     
     async def get_by_name(self, db: AsyncSession, name: str):
         """Get department by name"""
-        result = await db.execute(select(Department).where(Department.name == name))
+        statement = self._statement("get_by_name", lambda: select(Department).where(Department.name == bindparam("name")))
+        result = await db.execute(statement, {"name": name})
         return result.scalars().first()
     
-    async def get_active(self, db: AsyncSession, skip: int = 0, limit: int = 100):
+    async def get_detail(self, db: AsyncSession, id: int) -> Optional[tuple[Department, int]]:
+        """Get department and its number of doctors in one statement
+        
+        The doctors are counted by a correlated subquery instead of loading
+        the collection.
+        """
+        statement = self._statement("get_detail", lambda: (
+            select(
+                Department,
+                select(func.count(Doctor.id))
+                .where(Doctor.department_id == Department.id)
+                .correlate(Department)
+                .scalar_subquery()
+                .label("doctors_count"),
+            )
+            .where(Department.id == bindparam("id"))
+            .options(*self._undefer_options)
+        ))
+        result = await db.execute(statement, {"id": id})
+        return result.first()
+    
+    async def get_active(self, db: AsyncSession, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get all active departments"""
-        result = await db.execute(
-            select(Department)
-            .where(Department.is_active == True)
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        return await self.get_page(db, skip, limit, {"is_active": True}, include_total=False, cursor=cursor, response_model=response_model)
+
+    
+    async def archive(self, db: AsyncSession, id: int) -> bool:
+        """Deactivate a department with a single UPDATE, keeping its doctors and appointments
+        
+        An archived department takes no new bookings and its doctors show no
+        free slots; the slot cache is cleared so this worker stops offering
+        them at once.
+        """
+        statement = self._statement("archive", lambda: (
+            update(Department)
+            .where(Department.id == bindparam("department_id"))
+            .values(is_active=False)
+            .returning(Department.id)
+        ))
+        result = await db.execute(statement, {"department_id": id})
+        archived = result.first() is not None
+        await db.commit()
+        if archived:
+            slot_cache.clear()
+        return archived
 
 
 department = CRUDDepartment(Department)
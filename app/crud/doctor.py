@@ -1,48 +1,61 @@
 """Doctor CRUD operations"""
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, bindparam
+from typing import Optional, Type
+from pydantic import BaseModel
 
-from app.db.models import Doctor
+from app.db.models import Doctor, Appointment
 from app.schemas.doctor import DoctorCreate, DoctorUpdate
-from .base import CRUDBase
+from app.core.pagination import Page
+from .base import CRUDBase, loading_plan
 
 
 class CRUDDoctor(CRUDBase[Doctor, DoctorCreate, DoctorUpdate]):
     """Doctor CRUD operations"""
     
+    # DoctorResponse embeds the user
+    list_load = ("user",)
+    
     async def get_by_user_id(self, db: AsyncSession, user_id: int):
         """Get doctor by user ID"""
-        result = await db.execute(
+        statement = self._statement("get_by_user_id", lambda: (
             select(Doctor)
-            .where(Doctor.user_id == user_id)
-            .options(selectinload(Doctor.user))
-        )
+            .where(Doctor.user_id == bindparam("user_id"))
+            .options(*loading_plan(Doctor, ("user",)))
+        ))
+        result = await db.execute(statement, {"user_id": user_id})
         return result.scalars().first()
     
-    async def get_by_department(self, db: AsyncSession, department_id: int, skip: int = 0, limit: int = 100):
+    async def get_detail(self, db: AsyncSession, id: int) -> Optional[tuple[Doctor, int]]:
+        """Get doctor with user and department, and its number of appointments, in one statement
+        
+        The appointments are counted by a correlated subquery instead of
+        loading the collection.
+        """
+        statement = self._statement("get_detail", lambda: (
+            select(
+                Doctor,
+                select(func.count(Appointment.id))
+                .where(Appointment.doctor_id == Doctor.id)
+                .correlate(Doctor)
+                .scalar_subquery()
+                .label("appointments_count"),
+            )
+            .where(Doctor.id == bindparam("id"))
+            .options(*self._undefer_options, *loading_plan(Doctor, ("user", "department")))
+        ))
+        result = await db.execute(statement, {"id": id})
+        return result.first()
+    
+    async def get_by_department(self, db: AsyncSession, department_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get doctors by department"""
-        result = await db.execute(
-            select(Doctor)
-            .where(Doctor.department_id == department_id)
-            .where(Doctor.is_available == True)
-            .options(selectinload(Doctor.user))
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        filters = {"department_id": department_id, "is_available": True}
+        return await self.get_page(db, skip, limit, filters, include_total=False, cursor=cursor, response_model=response_model)
     
-    async def get_available(self, db: AsyncSession, skip: int = 0, limit: int = 100):
+    async def get_available(self, db: AsyncSession, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get all available doctors"""
-        result = await db.execute(
-            select(Doctor)
-            .where(Doctor.is_available == True)
-            .options(selectinload(Doctor.user))
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        return await self.get_page(db, skip, limit, {"is_available": True}, include_total=False, cursor=cursor, response_model=response_model)
 
 
 doctor = CRUDDoctor(Doctor)
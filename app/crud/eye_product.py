@@ -2,30 +2,33 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from typing import Optional, Type
+from pydantic import BaseModel
 
 from app.db.models import EyeProduct
 from app.schemas.eye_product import EyeProductCreate, EyeProductUpdate
+from app.core.pagination import Page
 from app.crud.base import CRUDBase
 
 
 class CRUDEyeProduct(CRUDBase[EyeProduct, EyeProductCreate, EyeProductUpdate]):
     """CRUD operations for EyeProduct model"""
     
-    async def get_by_category(self, db: AsyncSession, category: str, skip: int = 0, limit: int = 10) -> tuple[list[EyeProduct], int]:
+    async def get_by_category(self, db: AsyncSession, category: str, skip: int = 0, limit: int = 10, include_total: bool = True, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get eye products by category"""
-        return await self.get_all(db, skip, limit, {"category": category, "is_active": True})
+        return await self.get_page(db, skip, limit, {"category": category, "is_active": True}, include_total=include_total, cursor=cursor, response_model=response_model)
     
-    async def get_by_brand(self, db: AsyncSession, brand: str, skip: int = 0, limit: int = 10) -> tuple[list[EyeProduct], int]:
+    async def get_by_brand(self, db: AsyncSession, brand: str, skip: int = 0, limit: int = 10, include_total: bool = True, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get eye products by brand"""
-        return await self.get_all(db, skip, limit, {"brand": brand, "is_active": True})
+        return await self.get_page(db, skip, limit, {"brand": brand, "is_active": True}, include_total=include_total, cursor=cursor, response_model=response_model)
     
-    async def get_available(self, db: AsyncSession, skip: int = 0, limit: int = 10) -> tuple[list[EyeProduct], int]:
+    async def get_available(self, db: AsyncSession, skip: int = 0, limit: int = 10, include_total: bool = True, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get available eye products"""
-        return await self.get_all(db, skip, limit, {"is_available": True, "is_active": True})
+        return await self.get_page(db, skip, limit, {"is_available": True, "is_active": True}, include_total=include_total, cursor=cursor, response_model=response_model)
     
-    async def get_active(self, db: AsyncSession, skip: int = 0, limit: int = 10) -> tuple[list[EyeProduct], int]:
+    async def get_active(self, db: AsyncSession, skip: int = 0, limit: int = 10, include_total: bool = True, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get active eye products"""
-        return await self.get_all(db, skip, limit, {"is_active": True})
+        return await self.get_page(db, skip, limit, {"is_active": True}, include_total=include_total, cursor=cursor, response_model=response_model)
 
 
 eye_product = CRUDEyeProduct(EyeProduct)
@@ -0,0 +1,208 @@
+"""Doctor schedule CRUD operations and free-slot queries"""
+
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy import select, delete, and_, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Appointment, Department, Doctor, DoctorSchedule, DoctorScheduleException
+from app.schemas.schedule import DoctorScheduleCreate, ScheduleExceptionCreate
+from app.core.constants import AppointmentStatus, DEFAULT_SLOT_MINUTES
+from app.core.exceptions import ValidationException
+from app.core.slot_cache import slot_cache
+from .base import CRUDBase
+
+
+def _day_slots(hours: Iterable[tuple[time, time, int]]) -> list[tuple[time, time]]:
+    """(start, end) of every slot in the working hours, in order and not overlapping"""
+    slots = []
+    for start, end, minutes in sorted(hours):
+        step = timedelta(minutes=minutes)
+        at = datetime.combine(date.min, start)
+        stop = datetime.combine(date.min, end)
+        while at + step <= stop:
+            if not slots or at.time() >= slots[-1][1]:
+                slots.append((at.time(), (at + step).time()))
+            at += step
+    return slots
+
+
+def _free_slots(slots: list[tuple[time, time]], booked: Iterable[time]) -> tuple[time, ...]:
+    """Start times of the slots no booking falls in
+    
+    Every slot starts as a set bit; each booking finds its slot by bisecting
+    the start times and clears that bit.
+    """
+    starts = [start for start, _ in slots]
+    free = (1 << len(slots)) - 1
+    for at in booked:
+        index = bisect_right(starts, at) - 1
+        if index >= 0 and at < slots[index][1]:
+            free &= ~(1 << index)
+    return tuple(start for index, start in enumerate(starts) if free >> index & 1)
+
+
+class CRUDDoctorSchedule(CRUDBase[DoctorSchedule, DoctorScheduleCreate, DoctorScheduleCreate]):
+    """Weekly working hours of doctors and the free slots they leave"""
+    
+    async def get_by_doctor(self, db: AsyncSession, doctor_id: int) -> Sequence[DoctorSchedule]:
+        """Get a doctor's weekly schedule"""
+        statement = self._statement("get_by_doctor", lambda: (
+            select(DoctorSchedule)
+            .where(DoctorSchedule.doctor_id == bindparam("doctor_id"))
+            .order_by(DoctorSchedule.weekday, DoctorSchedule.start_time)
+        ))
+        result = await db.execute(statement, {"doctor_id": doctor_id})
+        return result.scalars().all()
+    
+    async def replace(self, db: AsyncSession, doctor_id: int, entries: Sequence[DoctorScheduleCreate]) -> list[DoctorSchedule]:
+        """Replace a doctor's weekly schedule; hours on one weekday must not overlap
+        
+        The old rows go in one DELETE and the new ones in one multi-row
+        INSERT ... RETURNING, committed together.
+        """
+        for weekday in {entry.weekday for entry in entries}:
+            hours = sorted((entry.start_time, entry.end_time) for entry in entries if entry.weekday == weekday)
+            if any(start < previous_end for (_, previous_end), (start, _) in zip(hours, hours[1:])):
+                raise ValidationException(detail=f"Working hours overlap on weekday {weekday}")
+        
+        statement = self._statement("delete_by_doctor", lambda: (
+            delete(DoctorSchedule).where(DoctorSchedule.doctor_id == bindparam("doctor_id"))
+        ))
+        await db.execute(statement, {"doctor_id": doctor_id})
+        db_objs = []
+        if entries:
+            rows = [{**entry.dict(), "doctor_id": doctor_id} for entry in entries]
+            db_objs = await self._insert_many(db, rows)
+        await db.commit()
+        slot_cache.invalidate_doctor(doctor_id)
+        return sorted(db_objs, key=lambda obj: (obj.weekday, obj.start_time))
+    
+    async def get_free_slots(self, db: AsyncSession, doctor_id: int, start: date, end: date) -> Optional[list[tuple[date, tuple[time, ...]]]]:
+        """Free slots of a doctor on each date from start to end, None if the doctor does not exist
+        
+        Days come from slot_cache where possible. The rest are built in
+        three statements however many days are missing: the doctor with its
+        weekly schedule (no slots if it or its department is unavailable),
+        the exceptions in range, and the active bookings in range, the last
+        one a single range scan of idx_appointments_doctor_date.
+        """
+        days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+        free = {day: slot_cache.get(doctor_id, day) for day in days}
+        missing = [day for day, slots in free.items() if slots is None]
+        if not missing:
+            return list(free.items())
+        
+        hours_statement = self._statement("hours", lambda: (
+            select(
+                and_(Doctor.is_available == True, Department.is_active == True).label("is_available"),
+                DoctorSchedule.weekday,
+                DoctorSchedule.start_time,
+                DoctorSchedule.end_time,
+                DoctorSchedule.slot_minutes,
+            )
+            .select_from(Doctor)
+            .join(Department, Department.id == Doctor.department_id)
+            .outerjoin(DoctorSchedule, DoctorSchedule.doctor_id == Doctor.id)
+            .where(Doctor.id == bindparam("doctor_id"))
+        ))
+        rows = (await db.execute(hours_statement, {"doctor_id": doctor_id})).all()
+        if not rows:
+            return None
+        
+        if not rows[0].is_available:
+            for day in missing:
+                free[day] = ()
+                slot_cache.set(doctor_id, day, ())
+            return list(free.items())
+        
+        weekly = {weekday: [] for weekday in range(7)}
+        for row in rows:
+            if row.weekday is not None:
+                weekly[row.weekday].append((row.start_time, row.end_time, row.slot_minutes))
+        
+        params = {"doctor_id": doctor_id, "start": missing[0], "end": missing[-1]}
+        exceptions_statement = self._statement("exceptions", lambda: (
+            select(
+                DoctorScheduleException.exception_date,
+                DoctorScheduleException.start_time,
+                DoctorScheduleException.end_time,
+                DoctorScheduleException.slot_minutes,
+            )
+            .where(
+                and_(
+                    DoctorScheduleException.doctor_id == bindparam("doctor_id"),
+                    DoctorScheduleException.exception_date.between(bindparam("start"), bindparam("end")),
+                )
+            )
+        ))
+        exceptions = {}
+        for row in await db.execute(exceptions_statement, params):
+            hours = exceptions.setdefault(row.exception_date, [])
+            if row.start_time is not None:
+                hours.append((row.start_time, row.end_time, row.slot_minutes or DEFAULT_SLOT_MINUTES))
+        
+        booked_statement = self._statement("booked", lambda: (
+            select(Appointment.appointment_date, Appointment.appointment_time)
+            .where(
+                and_(
+                    Appointment.doctor_id == bindparam("doctor_id"),
+                    Appointment.appointment_date.between(bindparam("start"), bindparam("end")),
+                    Appointment.status.in_(AppointmentStatus.ACTIVE),
+                )
+            )
+        ))
+        booked = {}
+        for row in await db.execute(booked_statement, params):
+            booked.setdefault(row.appointment_date, []).append(row.appointment_time)
+        
+        for day in missing:
+            hours = exceptions.get(day, weekly[day.weekday()])
+            free[day] = _free_slots(_day_slots(hours), booked.get(day, ()))
+            slot_cache.set(doctor_id, day, free[day])
+        return list(free.items())
+
+
+class CRUDScheduleException(CRUDBase[DoctorScheduleException, ScheduleExceptionCreate, ScheduleExceptionCreate]):
+    """Per-date working hours of doctors"""
+    
+    async def get_by_doctor(self, db: AsyncSession, doctor_id: int, start: date) -> Sequence[DoctorScheduleException]:
+        """Get a doctor's exceptions on or after start"""
+        statement = self._statement("get_by_doctor", lambda: (
+            select(DoctorScheduleException)
+            .where(
+                and_(
+                    DoctorScheduleException.doctor_id == bindparam("doctor_id"),
+                    DoctorScheduleException.exception_date >= bindparam("start"),
+                )
+            )
+            .order_by(DoctorScheduleException.exception_date, DoctorScheduleException.start_time)
+        ))
+        result = await db.execute(statement, {"doctor_id": doctor_id, "start": start})
+        return result.scalars().all()
+    
+    async def create(self, db: AsyncSession, obj_in: ScheduleExceptionCreate, doctor_id: int) -> DoctorScheduleException:
+        """Add an exception to a doctor's schedule"""
+        db_obj = await self._insert(db, {**obj_in.dict(), "doctor_id": doctor_id})
+        slot_cache.invalidate(doctor_id, db_obj.exception_date)
+        return db_obj
+    
+    async def delete(self, db: AsyncSession, id: int) -> bool:
+        """Delete an exception, restoring the weekly schedule on its date"""
+        statement = self._statement("delete", lambda: (
+            delete(DoctorScheduleException)
+            .where(DoctorScheduleException.id == bindparam("id"))
+            .returning(DoctorScheduleException.doctor_id, DoctorScheduleException.exception_date)
+        ))
+        row = (await db.execute(statement, {"id": id})).first()
+        await db.commit()
+        if row is None:
+            return False
+        slot_cache.invalidate(row.doctor_id, row.exception_date)
+        return True
+
+
+schedule = CRUDDoctorSchedule(DoctorSchedule)
+schedule_exception = CRUDScheduleException(DoctorScheduleException)
@@ -1,10 +1,13 @@
 """Service CRUD operations"""
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
+from typing import Optional, Type
+from pydantic import BaseModel
 
 from app.db.models import Service
 from app.schemas.service import ServiceCreate, ServiceUpdate
+from app.core.pagination import Page
 from app.crud.base import CRUDBase
 
 
@@ -13,14 +16,13 @@ class CRUDService(CRUDBase[Service, ServiceCreate, ServiceUpdate]):
     
     async def get_by_name(self, db: AsyncSession, name: str) -> Service:
         """Get service by name"""
-        result = await db.execute(
-            select(Service).where(Service.name == name)
-        )
+        statement = self._statement("get_by_name", lambda: select(Service).where(Service.name == bindparam("name")))
+        result = await db.execute(statement, {"name": name})
         return result.scalars().first()
     
-    async def get_active(self, db: AsyncSession, skip: int = 0, limit: int = 10) -> tuple[list[Service], int]:
+    async def get_active(self, db: AsyncSession, skip: int = 0, limit: int = 10, include_total: bool = True, cursor: Optional[str] = None, response_model: Optional[Type[BaseModel]] = None) -> Page:
         """Get active services"""
-        return await self.get_all(db, skip, limit, {"is_active": True})
+        return await self.get_page(db, skip, limit, {"is_active": True}, include_total=include_total, cursor=cursor, response_model=response_model)
 
 
 service = CRUDService(Service)
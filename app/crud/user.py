@@ -1,39 +1,88 @@
 """User CRUD operations"""
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, event, inspect, bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, object_session
 from typing import Optional
+import logging
 
 from app.db.models import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import SecurityUtils
+from app.core.hashing import password_hasher
+from app.core.principal_cache import principal_cache
+from app.core.bloom import BloomFilter
+from app.config import settings
 from .base import CRUDBase
 
+logger = logging.getLogger(__name__)
+
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     """User CRUD operations"""
     
+    def __init__(self, model):
+        super().__init__(model)
+        # Per-worker filter of registered phones; only trusted once loaded
+        self.phone_filter = BloomFilter(
+            capacity=settings.PHONE_BLOOM_FILTER_CAPACITY,
+            error_rate=settings.PHONE_BLOOM_FILTER_ERROR_RATE,
+        )
+        self.phone_filter_loaded = False
+    
+    async def load_phone_filter(self, db: AsyncSession, batch_size: int = 10000) -> int:
+        """Load every registered phone into the Bloom filter"""
+        self.phone_filter.clear()
+        result = await db.stream_scalars(
+            select(User.phone).execution_options(yield_per=batch_size)
+        )
+        async for phone in result:
+            self.phone_filter.add(phone)
+        self.phone_filter_loaded = True
+        return self.phone_filter.count
+    
+    def phone_may_exist(self, phone: str) -> bool:
+        """Check whether a phone might already be registered
+        
+        False means the phone is definitely new (as far as this worker knows),
+        so callers can skip the lookup and rely on the unique index.
+        """
+        if not self.phone_filter_loaded:
+            return True
+        return self.phone_filter.might_contain(SecurityUtils.normalize_phone(phone))
+    
     async def get_by_phone(self, db: AsyncSession, phone: str) -> Optional[User]:
         """Get user by phone number"""
         # Normalize phone number
         normalized_phone = SecurityUtils.normalize_phone(phone)
-        result = await db.execute(select(User).where(User.phone == normalized_phone))
+        statement = self._statement("get_by_phone", lambda: (
+            select(User).where(User.phone == bindparam("phone")).options(*self._undefer_options)
+        ))
+        result = await db.execute(statement, {"phone": normalized_phone})
         return result.scalars().first()
     
     async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
         """Get user by email"""
-        result = await db.execute(select(User).where(User.email == email))
+        statement = self._statement("get_by_email", lambda: (
+            select(User).where(User.email == bindparam("email")).options(*self._undefer_options)
+        ))
+        result = await db.execute(statement, {"email": email})
         return result.scalars().first()
     
     async def create(self, db: AsyncSession, obj_in: UserCreate) -> User:
-        """Create new user"""
+        """Create new user
+        
+        Raises IntegrityError (after rolling back) if the phone or email is
+        already registered; the unique indexes are the source of truth.
+        """
         # Normalize phone number
         normalized_phone = SecurityUtils.normalize_phone(obj_in.phone)
         
         # Hash password
-        hashed_password = SecurityUtils.get_password_hash(obj_in.password)
+        hashed_password = await password_hasher.hash(obj_in.password)
         
-        db_obj = User(
+        values = dict(
             phone=normalized_phone,
             hashed_password=hashed_password,
             full_name=obj_in.full_name,
@@ -50,20 +99,41 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             emergency_contact_name=obj_in.emergency_contact_name,
             emergency_contact_phone=obj_in.emergency_contact_phone,
         )
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        try:
+            db_obj = await self._insert(db, values)
+        except IntegrityError:
+            await db.rollback()
+            raise
+        
+        if self.phone_filter_loaded:
+            self.phone_filter.add(normalized_phone)
         return db_obj
     
     async def authenticate(self, db: AsyncSession, phone: str, password: str) -> Optional[User]:
-        """Authenticate user with phone and password"""
+        """Authenticate user with phone and password
+        
+        Hashes made with a different bcrypt cost than BCRYPT_ROUNDS are
+        transparently re-hashed with the plain password on successful login.
+        """
         user = await self.get_by_phone(db, phone)
         if not user:
             return None
         
-        if not SecurityUtils.verify_password(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             return None
         
+        if SecurityUtils.needs_rehash(user.hashed_password):
+            try:
+                new_hash = await password_hasher.hash(password)
+            except Exception as e:
+                # The login itself succeeded; try again on the next one
+                logger.warning(f"Failed to rehash password for user {user.id}: {e}")
+                return user
+            
+            user.hashed_password = new_hash
+            db.add(user)
+            await db.commit()
+        
         return user
     
     async def change_password(
@@ -73,15 +143,24 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         old_password: str,
         new_password: str
     ) -> bool:
-        """Change user password"""
-        if not SecurityUtils.verify_password(old_password, user.hashed_password):
+        """Change user password (the cached principal is invalidated on commit)"""
+        if not await password_hasher.verify(old_password, user.hashed_password):
             return False
         
-        user.hashed_password = SecurityUtils.get_password_hash(new_password)
+        user.hashed_password = await password_hasher.hash(new_password)
         db.add(user)
         await db.commit()
         return True
     
+    async def delete(self, db: AsyncSession, id: int) -> bool:
+        """Delete user through the unit of work, so its cached principal is invalidated"""
+        db_obj = await self.get(db, id)
+        if not db_obj:
+            return False
+        await db.delete(db_obj)
+        await db.commit()
+        return True
+    
     async def get_active_users(self, db: AsyncSession, skip: int = 0, limit: int = 100):
         """Get all active users"""
         result = await db.execute(
@@ -93,4 +172,38 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         return result.scalars().all()
 
 
+# Changes to these columns make the role claims in issued access tokens stale
+TOKEN_CLAIM_COLUMNS = ("is_admin", "is_doctor", "is_active")
+
+
+@event.listens_for(User, "before_update")
+def _bump_token_version(mapper, connection, target):
+    """Bump the token version when a user's role or status changes"""
+    state = inspect(target)
+    if any(state.attrs[key].history.has_changes() for key in TOKEN_CLAIM_COLUMNS):
+        target.token_version = (target.token_version or 0) + 1
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _track_user_change(mapper, connection, target):
+    """Remember users written in this session so their cached principal can be dropped"""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_users", {})[target.id] = target.token_version
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session):
+    """Invalidate cached principals once user changes are committed"""
+    for user_id, token_version in session.info.pop("changed_users", {}).items():
+        principal_cache.invalidate(user_id, token_version)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    """Forget tracked user changes that were rolled back"""
+    session.info.pop("changed_users", None)
+
+
 user = CRUDUser(User)
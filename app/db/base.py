@@ -2,4 +2,11 @@
 
 from sqlalchemy.orm import declarative_base
 
-Base = declarative_base()
+
+class _MapperDefaults:
+    # Flushes fetch server-generated columns with RETURNING on the INSERT/UPDATE
+    # itself, so objects stay complete without a refresh after commit
+    __mapper_args__ = {"eager_defaults": True}
+
+
+Base = declarative_base(cls=_MapperDefaults)
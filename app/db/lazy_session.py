@@ -0,0 +1,91 @@
+"""Request-scoped session that holds a pool connection only while it is needed
+
+An AsyncSession already waits for its first statement before checking out a
+connection, but then keeps that connection until the request tears the
+session down, including time spent serializing the response, hashing
+passwords or awaiting other I/O. LazyAsyncSession ends the transaction
+right after a plain read, so the connection goes back to the pool between
+statements. Once the transaction writes, locks rows or streams results, the
+connection is held until the endpoint commits or rolls back, as before.
+"""
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import Select
+
+# session.info key marking a transaction that must keep its connection
+HOLD_CONNECTION = "hold_connection"
+
+
+def _is_plain_read(statement: Any) -> bool:
+    """A SELECT that takes no row locks"""
+    return isinstance(statement, Select) and statement._for_update_arg is None
+
+
+def _end_of_transaction(session, transaction) -> None:
+    """Forget the hold once the outermost transaction is over"""
+    if transaction.parent is None:
+        session.info.pop(HOLD_CONNECTION, None)
+
+
+class LazyAsyncSession(AsyncSession):
+    """AsyncSession that returns its connection to the pool after each read
+
+    Pass ``release_after_read=True`` to enable; otherwise it behaves exactly
+    like AsyncSession (scripts and startup tasks use it that way).
+    """
+
+    def __init__(self, *args: Any, release_after_read: bool = False, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.release_after_read = release_after_read
+        self.releases = 0
+        event.listen(self.sync_session, "after_transaction_end", _end_of_transaction)
+
+    def hold_connection(self) -> None:
+        """Keep the connection until the current transaction ends"""
+        self.info[HOLD_CONNECTION] = True
+
+    async def _release_after(self, read: bool) -> None:
+        """End a read-only transaction so its connection goes back to the pool"""
+        if not self.release_after_read or not self.in_transaction():
+            return
+        if not read:
+            self.hold_connection()
+            return
+        if self.info.get(HOLD_CONNECTION) or self.in_nested_transaction():
+            return
+        if self.new or self.dirty or self.deleted:
+            return
+        # expire_on_commit=False keeps loaded objects usable after this
+        await self.commit()
+        self.releases += 1
+
+    async def execute(self, statement, *args: Any, **kwargs: Any):
+        result = await super().execute(statement, *args, **kwargs)
+        await self._release_after(_is_plain_read(statement))
+        return result
+
+    async def scalar(self, statement, *args: Any, **kwargs: Any):
+        result = await super().scalar(statement, *args, **kwargs)
+        await self._release_after(_is_plain_read(statement))
+        return result
+
+    async def get(self, entity, ident, *args: Any, **kwargs: Any):
+        instance = await super().get(entity, ident, *args, **kwargs)
+        await self._release_after(not kwargs.get("with_for_update"))
+        return instance
+
+    async def refresh(self, instance, *args: Any, **kwargs: Any) -> None:
+        await super().refresh(instance, *args, **kwargs)
+        await self._release_after(not kwargs.get("with_for_update"))
+
+    async def stream(self, statement, *args: Any, **kwargs: Any):
+        # The cursor stays open while the caller iterates
+        self.hold_connection()
+        return await super().stream(statement, *args, **kwargs)
+
+    async def flush(self, objects=None) -> None:
+        await super().flush(objects)
+        self.hold_connection()
@@ -0,0 +1,54 @@
+"""Alembic schema versioning helpers
+
+Migrations run once per deploy (scripts/migrate_db.py) before the server
+starts. Workers only compare the database's revision with the code's head
+revision at boot, a single-row query instead of reflecting every table.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+def alembic_config() -> Config:
+    """Alembic configuration for this project, leaving app logging alone"""
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def head_revision() -> Optional[str]:
+    """Newest migration revision shipped with the code"""
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+async def current_revision(engine: AsyncEngine) -> Optional[str]:
+    """Revision recorded in the database's alembic_version table"""
+    async with engine.connect() as conn:
+        return await conn.run_sync(
+            lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision()
+        )
+
+
+async def check_schema_revision(engine: AsyncEngine) -> bool:
+    """Log an error unless the database is migrated to the code's head revision"""
+    expected = head_revision()
+    actual = await current_revision(engine)
+    if actual == expected:
+        logger.info(f"Database schema at revision {actual}")
+        return True
+
+    logger.error(
+        f"Database schema is at revision {actual or 'none'} but the code expects {expected}; "
+        f"run `python scripts/migrate_db.py` before starting the server"
+    )
+    return False
@@ -1,13 +1,17 @@
 """SQLAlchemy database models"""
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Date, Time, Enum, JSON, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 import enum
 
 from app.db.base import Base
-from app.core.constants import AppointmentStatus, ContactMessageStatus
+from app.core.constants import AppointmentStatus, ContactMessageStatus, BloodGroup
+
+# Relationships are lazy="raise": an async session cannot lazy load, so callers
+# name the relations they read (see app.crud.base.loading_plan) and an
+# unplanned access fails loudly instead of issuing hidden queries.
 
 
 class User(Base):
@@ -29,19 +33,21 @@ class User(Base):
     district = Column(String(100), nullable=True)
     upazila = Column(String(100), nullable=True)
     village = Column(String(255), nullable=True)
-    address = Column(Text, nullable=True)
+    # Large text columns are deferred: list and relationship loads skip them
+    address = deferred(Column(Text, nullable=True))
     emergency_contact_name = Column(String(255), nullable=True)
     emergency_contact_phone = Column(String(20), nullable=True)
     
     is_active = Column(Boolean, default=True, index=True)
     is_admin = Column(Boolean, default=False)
     is_doctor = Column(Boolean, default=False)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)  # Bumped when role/status claims change
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    appointments = relationship("Appointment", back_populates="patient", foreign_keys="Appointment.patient_id")
-    doctor_profile = relationship("Doctor", back_populates="user", uselist=False)
+    appointments = relationship("Appointment", back_populates="patient", foreign_keys="Appointment.patient_id", lazy="raise")
+    doctor_profile = relationship("Doctor", back_populates="user", uselist=False, lazy="raise")
     
     __table_args__ = (
         Index('idx_users_phone_active', 'phone', 'is_active'),
@@ -54,15 +60,16 @@ class Department(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), unique=True, nullable=False, index=True)
-    description = Column(Text, nullable=True)
+    description = deferred(Column(Text, nullable=True))
     image_url = Column(String(500), nullable=True)
     is_active = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    doctors = relationship("Doctor", back_populates="department", cascade="all, delete-orphan")
-    appointments = relationship("Appointment", back_populates="department", cascade="all, delete-orphan")
+    # Deleted by the foreign keys' ON DELETE CASCADE, without loading them first
+    doctors = relationship("Doctor", back_populates="department", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    appointments = relationship("Appointment", back_populates="department", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
 
 class Doctor(Base):
@@ -73,32 +80,73 @@ class Doctor(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True, index=True)
     specialty = Column(String(255), nullable=False, index=True)
     image_url = Column(String(500), nullable=True)
-    bio = Column(Text, nullable=True)
+    bio = deferred(Column(Text, nullable=True))
     experience_years = Column(Integer, nullable=True)
-    department_id = Column(Integer, ForeignKey("departments.id"), nullable=False, index=True)
+    department_id = Column(Integer, ForeignKey("departments.id", ondelete="CASCADE"), nullable=False, index=True)
     is_available = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    user = relationship("User", back_populates="doctor_profile")
-    department = relationship("Department", back_populates="doctors")
-    appointments = relationship("Appointment", back_populates="doctor", foreign_keys="Appointment.doctor_id")
+    user = relationship("User", back_populates="doctor_profile", lazy="raise")
+    department = relationship("Department", back_populates="doctors", lazy="raise")
+    appointments = relationship("Appointment", back_populates="doctor", foreign_keys="Appointment.doctor_id", passive_deletes=True, lazy="raise")
+    schedules = relationship("DoctorSchedule", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    schedule_exceptions = relationship("DoctorScheduleException", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
     
     __table_args__ = (
         Index('idx_doctors_department_available', 'department_id', 'is_available'),
     )
 
 
+class DoctorSchedule(Base):
+    """Weekly working hours of a doctor, split into bookable slots"""
+    __tablename__ = "doctor_schedules"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    doctor_id = Column(Integer, ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
+    weekday = Column(Integer, nullable=False)  # 0 = Monday ... 6 = Sunday
+    start_time = Column(Time, nullable=False)
+    end_time = Column(Time, nullable=False)
+    slot_minutes = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('idx_doctor_schedules_doctor_weekday', 'doctor_id', 'weekday'),
+    )
+
+
+class DoctorScheduleException(Base):
+    """Working hours of a doctor on one date, replacing the weekly schedule
+    
+    A row without start and end time marks the whole date off.
+    """
+    __tablename__ = "doctor_schedule_exceptions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    doctor_id = Column(Integer, ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
+    exception_date = Column(Date, nullable=False)
+    start_time = Column(Time, nullable=True)
+    end_time = Column(Time, nullable=True)
+    slot_minutes = Column(Integer, nullable=True)
+    reason = Column(String(255), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('idx_doctor_schedule_exceptions_doctor_date', 'doctor_id', 'exception_date'),
+    )
+
+
 class Appointment(Base):
     """Appointment model"""
     __tablename__ = "appointments"
     
     id = Column(Integer, primary_key=True, index=True)
     patient_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    doctor_id = Column(Integer, ForeignKey("doctors.id"), nullable=True, index=True)
-    department_id = Column(Integer, ForeignKey("departments.id"), nullable=False, index=True)
-    appointment_date = Column(Date, nullable=False, index=True)
+    doctor_id = Column(Integer, ForeignKey("doctors.id", ondelete="SET NULL"), nullable=True, index=True)
+    department_id = Column(Integer, ForeignKey("departments.id", ondelete="CASCADE"), nullable=False, index=True)
+    appointment_date = Column(Date, nullable=False)
     appointment_time = Column(Time, nullable=False)
     notes = Column(Text, nullable=True)
     status = Column(String(50), default=AppointmentStatus.CONFIRMED, index=True)
@@ -106,14 +154,26 @@ class Appointment(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    patient = relationship("User", back_populates="appointments", foreign_keys=[patient_id])
-    doctor = relationship("Doctor", back_populates="appointments", foreign_keys=[doctor_id])
-    department = relationship("Department", back_populates="appointments")
+    patient = relationship("User", back_populates="appointments", foreign_keys=[patient_id], lazy="raise")
+    doctor = relationship("Doctor", back_populates="appointments", foreign_keys=[doctor_id], lazy="raise")
+    department = relationship("Department", back_populates="appointments", lazy="raise")
     
     __table_args__ = (
         Index('idx_appointments_patient_date', 'patient_id', 'appointment_date'),
         Index('idx_appointments_doctor_date', 'doctor_id', 'appointment_date'),
         Index('idx_appointments_status_date', 'status', 'appointment_date'),
+        # Keyset order of the unfiltered listing (also serves date-range lookups)
+        Index('idx_appointments_date_id', 'appointment_date', 'id'),
+        # One active booking per doctor slot
+        Index(
+            'uq_appointments_doctor_slot',
+            'doctor_id',
+            'appointment_date',
+            'appointment_time',
+            unique=True,
+            postgresql_where=status.in_(AppointmentStatus.ACTIVE),
+            sqlite_where=status.in_(AppointmentStatus.ACTIVE),
+        ),
     )
 
 
@@ -133,6 +193,8 @@ class ContactMessage(Base):
     
     __table_args__ = (
         Index('idx_contact_messages_status_date', 'status', 'created_at'),
+        # Keyset order of the unfiltered listing
+        Index('idx_contact_messages_created_id', 'created_at', 'id'),
     )
 
 
@@ -142,7 +204,7 @@ class Service(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, unique=True)
-    description = Column(Text, nullable=True)
+    description = deferred(Column(Text, nullable=True))
     icon = Column(String(100), nullable=True)
     image_url = Column(String(500), nullable=True)
     is_active = Column(Boolean, default=True, index=True)
@@ -196,6 +258,25 @@ class EyeProduct(Base):
     )
 
 
+def _inventory_units(blood_group: str) -> property:
+    """Read/write a blood group's units on BloodBank.inventory under the old column name"""
+    
+    def get_units(bank: "BloodBank") -> int:
+        for row in bank.inventory:
+            if row.blood_group == blood_group:
+                return row.units
+        return 0
+    
+    def set_units(bank: "BloodBank", units: int) -> None:
+        for row in bank.inventory:
+            if row.blood_group == blood_group:
+                row.units = units or 0
+                return
+        bank.inventory.append(BloodInventory(blood_group=blood_group, units=units or 0))
+    
+    return property(get_units, set_units)
+
+
 class BloodBank(Base):
     """Blood Bank model"""
     __tablename__ = "blood_banks"
@@ -209,26 +290,44 @@ class BloodBank(Base):
     longitude = Column(String(50), nullable=True)
     image_url = Column(String(500), nullable=True)
     
-    # Blood inventory
-    blood_group_o_positive = Column(Integer, default=0)  # O+
-    blood_group_o_negative = Column(Integer, default=0)  # O-
-    blood_group_a_positive = Column(Integer, default=0)  # A+
-    blood_group_a_negative = Column(Integer, default=0)  # A-
-    blood_group_b_positive = Column(Integer, default=0)  # B+
-    blood_group_b_negative = Column(Integer, default=0)  # B-
-    blood_group_ab_positive = Column(Integer, default=0)  # AB+
-    blood_group_ab_negative = Column(Integer, default=0)  # AB-
-    
     available_24_7 = Column(Boolean, default=True)
     is_active = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Relationships
+    inventory = relationship("BloodInventory", lazy="selectin", cascade="all, delete-orphan", passive_deletes=True)
+    
+    # Blood inventory, one BloodInventory row per group
+    blood_group_o_positive = _inventory_units(BloodGroup.O_POSITIVE)
+    blood_group_o_negative = _inventory_units(BloodGroup.O_NEGATIVE)
+    blood_group_a_positive = _inventory_units(BloodGroup.A_POSITIVE)
+    blood_group_a_negative = _inventory_units(BloodGroup.A_NEGATIVE)
+    blood_group_b_positive = _inventory_units(BloodGroup.B_POSITIVE)
+    blood_group_b_negative = _inventory_units(BloodGroup.B_NEGATIVE)
+    blood_group_ab_positive = _inventory_units(BloodGroup.AB_POSITIVE)
+    blood_group_ab_negative = _inventory_units(BloodGroup.AB_NEGATIVE)
+    
     __table_args__ = (
         Index('idx_blood_banks_active', 'is_active'),
     )
 
 
+class BloodInventory(Base):
+    """Units of one blood group held by a blood bank"""
+    __tablename__ = "blood_inventory"
+    
+    bank_id = Column(Integer, ForeignKey("blood_banks.id", ondelete="CASCADE"), primary_key=True)
+    blood_group = Column(String(3), primary_key=True)
+    units = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        # Covers blood-group searches: bank_id is read from the index without visiting the table
+        Index('idx_blood_inventory_group_units', 'blood_group', 'units', 'bank_id'),
+    )
+
+
 class AuditLog(Base):
     """Audit log model for tracking changes"""
     __tablename__ = "audit_logs"
@@ -0,0 +1,119 @@
+"""Connection pool instrumentation"""
+
+import logging
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+
+class PoolMetrics:
+    """Per-worker counters for one engine's connection pool"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter"""
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def wait_started(self) -> None:
+        """A caller started waiting for a connection"""
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+
+    def wait_finished(self, seconds: float, timed_out: bool = False) -> None:
+        """A caller got a connection (or gave up) after waiting"""
+        self.waiting -= 1
+        self.wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        if timed_out:
+            self.timeouts += 1
+
+    def attach(self, pool: Pool) -> None:
+        """Count connection lifecycle events (and waits, if instrumented) on a pool"""
+        pool.metrics = self
+
+        @event.listens_for(pool, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            self.connects += 1
+
+        @event.listens_for(pool, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            self.checkouts += 1
+
+        @event.listens_for(pool, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            self.checkins += 1
+
+        @event.listens_for(pool, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            self.invalidations += 1
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """Live pool state plus accumulated counters"""
+        checkouts = self.checkouts or 1
+        stats: Dict[str, Any] = {
+            "pool_class": type(pool).__name__,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "avg_wait_ms": round(self.wait_seconds / checkouts * 1000, 3),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+        if hasattr(pool, "checkedout"):
+            stats.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        return stats
+
+
+# SQLAlchemy names pool loggers after the pool class; keep this one as quiet
+# as the stock pools under the "sqlalchemy" logger
+logging.getLogger(f"{__name__}.InstrumentedAsyncAdaptedQueuePool").setLevel(logging.WARNING)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that times how long callers wait for a connection"""
+
+    metrics: PoolMetrics = None
+
+    def _do_get(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super()._do_get()
+
+        metrics.wait_started()
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            metrics.wait_finished(time.perf_counter() - started, timed_out=True)
+            raise
+        except Exception:
+            metrics.wait_finished(time.perf_counter() - started)
+            raise
+        metrics.wait_finished(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # Event listeners are copied by recreate() (e.g. on dispose()); the metrics sink is not
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
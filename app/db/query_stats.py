@@ -0,0 +1,128 @@
+"""Per-request SQL statement counting and N+1 detection
+
+Cursor events on the engines add each statement's count and duration to
+the QueryStats of the request being served (tracked in a context variable),
+which the middleware reports as a Server-Timing header, in the logs and in
+per-route totals for /admin/system/queries.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+# Bind placeholders and expanded IN lists vary between otherwise identical statements
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|:\w+|\?")
+_IN_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeats with different parameters compare equal"""
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _IN_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """Statements executed while serving one request"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        """Add one executed statement"""
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[tuple[str, int]]:
+        """Statement shapes executed at least threshold times"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def server_timing(self) -> str:
+        """Server-Timing header value"""
+        return f'db;dur={self.seconds * 1000:.1f};desc="{self.count} queries"'
+
+
+def start_request() -> tuple[QueryStats, Any]:
+    """Begin collecting statements for the current request"""
+    stats = QueryStats()
+    return stats, _current.set(stats)
+
+
+def end_request(token: Any) -> None:
+    """Stop collecting statements for the current request"""
+    _current.reset(token)
+
+
+def current() -> Optional[QueryStats]:
+    """Stats of the request being served, if any"""
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = conn.info["query_started_at"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - started_at)
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute is skipped when a statement fails
+    started = exception_context.connection.info.get("query_started_at") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument(engine: AsyncEngine) -> None:
+    """Count and time every statement an engine executes"""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+class RouteQueryTotals:
+    """Per-route statement totals for this worker"""
+
+    def __init__(self):
+        self._routes: Dict[str, Dict[str, float]] = {}
+
+    def add(self, route: str, stats: QueryStats) -> None:
+        """Fold one request's stats into its route's totals"""
+        totals = self._routes.setdefault(route, {"requests": 0, "queries": 0, "max_queries": 0, "db_ms": 0.0})
+        totals["requests"] += 1
+        totals["queries"] += stats.count
+        totals["max_queries"] = max(totals["max_queries"], stats.count)
+        totals["db_ms"] += stats.seconds * 1000
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Totals per route, busiest first, with per-request averages"""
+        return {
+            route: {
+                "requests": totals["requests"],
+                "avg_queries": round(totals["queries"] / totals["requests"], 2),
+                "max_queries": totals["max_queries"],
+                "avg_db_ms": round(totals["db_ms"] / totals["requests"], 3),
+            }
+            for route, totals in sorted(self._routes.items(), key=lambda item: -item[1]["queries"])
+        }
+
+
+route_query_totals = RouteQueryTotals()
@@ -0,0 +1,104 @@
+"""Read-your-writes routing between the primary and the read replica"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Requests with these methods never pin a client to the primary
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class PrimaryPins:
+    """Clients that wrote recently and must read from the primary for a while
+
+    Pins are kept per worker, and with the "redis" backend also as expiring
+    Redis keys, so a client's next read sees its pin whichever worker serves
+    it. With the "memory" backend a read landing on another worker within
+    the window may still hit the lagging replica.
+    """
+
+    def __init__(self, window: float = 5.0, max_clients: int = 100_000, backend: str = "memory", key_prefix: str = "primary-pin:"):
+        self.window = window
+        self.max_clients = max_clients
+        self.backend = backend
+        self.key_prefix = key_prefix
+        self._pins: "OrderedDict[str, float]" = OrderedDict()
+        self._redis = None
+
+    async def pin(self, key: str) -> None:
+        """Route the client's reads to the primary for the next window seconds"""
+        if self.window <= 0:
+            return
+        self._pins[key] = time.monotonic() + self.window
+        self._pins.move_to_end(key)
+        while len(self._pins) > self.max_clients:
+            self._pins.popitem(last=False)
+
+        if self._redis is not None:
+            try:
+                await self._redis.set(f"{self.key_prefix}{key}", 1, px=int(self.window * 1000))
+            except Exception as e:
+                logger.warning(f"Failed to share primary pin: {e}")
+
+    async def is_pinned(self, key: str) -> bool:
+        """Check whether the client wrote within the window, on any worker"""
+        expires_at = self._pins.get(key)
+        if expires_at is not None:
+            if expires_at >= time.monotonic():
+                return True
+            self._pins.pop(key, None)
+
+        if self._redis is None:
+            return False
+        try:
+            return bool(await self._redis.exists(f"{self.key_prefix}{key}"))
+        except Exception as e:
+            # Unknown: the primary is always up to date
+            logger.warning(f"Failed to read primary pin: {e}")
+            return True
+
+    async def start(self) -> None:
+        """Connect the shared backend if configured and a replica is in use"""
+        if self.backend != "redis" or not settings.REDIS_URL or not settings.DATABASE_REPLICA_URL:
+            return
+        try:
+            import redis.asyncio as redis
+
+            client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            await client.ping()
+            self._redis = client
+            logger.info("Primary pins shared through Redis")
+        except Exception as e:
+            logger.warning(f"Redis primary pins unavailable, pinning per worker: {e}")
+
+    async def stop(self) -> None:
+        """Close the shared backend"""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+primary_pins = PrimaryPins(
+    window=settings.DB_READ_YOUR_WRITES_WINDOW,
+    backend=settings.DB_READ_YOUR_WRITES_BACKEND,
+)
+
+
+def client_key(request: Request) -> Optional[str]:
+    """Identify a client by its bearer token; None for anonymous requests
+
+    Anonymous clients are not pinned: behind a proxy their address is the
+    proxy's, and their follow-up requests carry the token they just got.
+    """
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return None
+    return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
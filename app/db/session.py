@@ -1,36 +1,144 @@
 """Database session management"""
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
+from sqlalchemy import text, event
+from sqlalchemy.engine import make_url
 from typing import AsyncGenerator
+import logging
+import uuid
 
-from app.config import settings
+from app.config import settings, worker_count
 from app.db.base import Base
+from app.db.lazy_session import LazyAsyncSession
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool, PoolMetrics
+from app.db import query_stats
+from app.db.routing import primary_pins, client_key
+
+logger = logging.getLogger(__name__)
+
+
+def _pool_options() -> dict:
+    """Engine pool arguments from settings"""
+    if settings.ENVIRONMENT == "testing":
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
+def _connect_args(url: str) -> dict:
+    """asyncpg connection arguments from settings
+    
+    Behind pgbouncer in transaction pooling mode a connection may land on a
+    different server connection for every transaction, so prepared
+    statements are not cached, each one gets a unique name, and only
+    startup parameters pgbouncer understands are sent.
+    """
+    if make_url(url).get_driver_name() != "asyncpg":
+        return {}
+    
+    server_settings = {"application_name": settings.DB_APPLICATION_NAME}
+    if settings.DB_PGBOUNCER_MODE:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4().hex}__",
+            "server_settings": server_settings,
+        }
+    return {
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "server_settings": {**settings.DB_SERVER_SETTINGS, **server_settings},
+    }
+
 
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
     future=True,
-    pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=0,
-    poolclass=NullPool if settings.ENVIRONMENT == "testing" else None,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=_connect_args(settings.DATABASE_URL),
+    **_pool_options(),
 )
+pool_metrics = PoolMetrics()
+pool_metrics.attach(engine.sync_engine.pool)
+query_stats.instrument(engine)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        # SQLite only enforces foreign keys (and their ON DELETE rules) when asked per connection
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
-    class_=AsyncSession,
+    class_=LazyAsyncSession,
     expire_on_commit=False,
     autoflush=False,
     autocommit=False,
 )
 
+# Optional read-only replica for read-heavy endpoints
+replica_engine = None
+replica_pool_metrics = None
+ReadSessionLocal = AsyncSessionLocal
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        echo=settings.DATABASE_ECHO,
+        future=True,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_connect_args(settings.DATABASE_REPLICA_URL),
+        **_pool_options(),
+    )
+    replica_pool_metrics = PoolMetrics()
+    replica_pool_metrics.attach(replica_engine.sync_engine.pool)
+    query_stats.instrument(replica_engine)
+    ReadSessionLocal = async_sessionmaker(
+        replica_engine,
+        class_=LazyAsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session"""
-    async with AsyncSessionLocal() as session:
+    """Get database session
+    
+    No connection is taken until the first statement, and reads hand it back
+    to the pool straight away (DB_RELEASE_AFTER_READ). FastAPI resolves this
+    dependency once per request, so auth dependencies and the endpoint share it.
+    """
+    async with AsyncSessionLocal(release_after_read=settings.DB_RELEASE_AFTER_READ) as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Get a read-only database session, served by the replica when configured
+    
+    Authenticated clients that wrote recently are pinned to the primary for
+    DB_READ_YOUR_WRITES_WINDOW seconds so they see their own changes.
+    """
+    session_factory = ReadSessionLocal
+    if replica_engine is not None:
+        key = client_key(request)
+        if key is not None and await primary_pins.is_pinned(key):
+            session_factory = AsyncSessionLocal
+    
+    async with session_factory(release_after_read=settings.DB_RELEASE_AFTER_READ) as session:
         try:
             yield session
         finally:
@@ -47,3 +155,56 @@ async def drop_db():
     """Drop all database tables"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+
+
+def get_pool_stats() -> dict:
+    """Live connection pool state for this worker"""
+    stats = pool_metrics.snapshot(engine.sync_engine.pool)
+    if replica_engine is not None:
+        stats["replica"] = replica_pool_metrics.snapshot(replica_engine.sync_engine.pool)
+    return stats
+
+
+async def dispose_engines() -> None:
+    """Close every pooled connection"""
+    await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+
+
+async def check_connection_budget() -> None:
+    """Warn when every worker's pools together could exceed the server's connection limit
+    
+    The replica pools count too when the replica URL points at the same
+    server as the primary.
+    """
+    if settings.ENVIRONMENT == "testing":
+        return
+    
+    workers = worker_count()
+    per_worker = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    pools = 1
+    if replica_engine is not None:
+        primary, replica = make_url(settings.DATABASE_URL), make_url(settings.DATABASE_REPLICA_URL)
+        if (primary.host, primary.port) == (replica.host, replica.port):
+            pools = 2
+    total = per_worker * pools * workers
+    
+    max_connections = settings.DB_MAX_CONNECTIONS
+    if max_connections is None and engine.dialect.name == "postgresql":
+        async with engine.connect() as conn:
+            max_connections = int((await conn.execute(text("SHOW max_connections"))).scalar())
+            reserved = int((await conn.execute(text("SHOW superuser_reserved_connections"))).scalar())
+            max_connections -= reserved
+    if max_connections is None:
+        return
+    
+    pool_count = " x 2 pools (primary and replica)" if pools == 2 else ""
+    if total > max_connections:
+        logger.warning(
+            f"Connection pools may exhaust the database: {workers} workers{pool_count} x "
+            f"{per_worker} connections (DB_POOL_SIZE + DB_MAX_OVERFLOW) = {total}, "
+            f"but the server allows {max_connections}. Lower DB_POOL_SIZE/DB_MAX_OVERFLOW or WORKERS."
+        )
+    else:
+        logger.info(f"Connection budget: {total} of {max_connections} connections across {workers} workers{pool_count}")
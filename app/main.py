@@ -10,9 +10,18 @@ import logging
 
 from app.config import settings
 from app.api.v1.api import api_router
-from app.db.session import engine, init_db
+from app.db.session import engine, init_db, AsyncSessionLocal, check_connection_budget, dispose_engines
+from app.db.migrations import check_schema_revision
+from app.db import query_stats
+from app.db.routing import SAFE_METHODS, primary_pins, client_key
+from app.crud.user import user as crud_user
 from app.db.models import Base
 from app.core.exceptions import APIException
+from app.core.hashing import password_hasher
+from app.core.principal_cache import principal_cache
+from app.core.revocation import token_revocations
+from app.core.rate_limit import rate_limiter
+from app.core.pagination import NEXT_CURSOR_HEADER
 
 # Configure logging
 logging.basicConfig(
@@ -28,19 +37,41 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up application...")
     try:
-        await init_db()
-        logger.info("Database initialized successfully")
+        if settings.DB_CREATE_TABLES_ON_STARTUP:
+            await init_db()
+            logger.info("Database initialized successfully")
+        else:
+            await check_schema_revision(engine)
+        await check_connection_budget()
     except Exception as e:
         logger.warning(f"Failed to initialize database on startup (will retry on first request): {e}")
         # Don't raise - allow app to start even if DB is not ready
         # This is important for Render free tier where DB might be slow to start
     
+    if settings.PHONE_BLOOM_FILTER_ENABLED:
+        try:
+            async with AsyncSessionLocal() as session:
+                count = await crud_user.load_phone_filter(session)
+            logger.info(f"Loaded {count} registered phones into the registration filter")
+        except Exception as e:
+            logger.warning(f"Failed to load registration phone filter (lookups stay enabled): {e}")
+    
+    await principal_cache.start()
+    await token_revocations.start()
+    await rate_limiter.start()
+    await primary_pins.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
     try:
-        await engine.dispose()
+        password_hasher.shutdown()
+        await principal_cache.stop()
+        await token_revocations.stop()
+        await rate_limiter.stop()
+        await primary_pins.stop()
+        await dispose_engines()
         logger.info("Application shutdown complete")
     except Exception as e:
         logger.warning(f"Error during shutdown: {e}")
@@ -95,10 +126,47 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH", "HEAD"],
         allow_headers=["*"],
-        expose_headers=["*"],
+        # A credentialed request only sees headers exposed by name
+        expose_headers=["*", NEXT_CURSOR_HEADER],
         max_age=86400,  # 24 hours
     )
     
+    # Pin clients that just wrote to the primary so replica lag never hides their changes
+    @app.middleware("http")
+    async def read_your_writes(request: Request, call_next):
+        response = await call_next(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            key = client_key(request)
+            if key is not None:
+                await primary_pins.pin(key)
+        return response
+    
+    # Count SQL statements per request; report them as Server-Timing and flag N+1 patterns
+    detect_n_plus_one = settings.N_PLUS_ONE_DETECTION
+    if detect_n_plus_one is None:
+        detect_n_plus_one = settings.ENVIRONMENT != "production"
+    
+    if settings.QUERY_STATS_ENABLED:
+        @app.middleware("http")
+        async def count_queries(request: Request, call_next):
+            stats, token = query_stats.start_request()
+            try:
+                response = await call_next(request)
+            finally:
+                query_stats.end_request(token)
+            
+            route = request.scope.get("route")
+            route_name = f"{request.method} {route.path}" if route is not None else f"{request.method} (unmatched)"
+            query_stats.route_query_totals.add(route_name, stats)
+            response.headers.append("Server-Timing", stats.server_timing())
+            
+            if stats.count > settings.QUERY_STATS_WARN_COUNT:
+                logger.warning(f"{route_name} ran {stats.count} SQL statements ({stats.seconds * 1000:.1f} ms)")
+            if detect_n_plus_one:
+                for shape, count in stats.repeated(settings.N_PLUS_ONE_THRESHOLD):
+                    logger.warning(f"Possible N+1 in {route_name}: {count}x {shape[:200]}")
+            return response
+    
     # Exception handler for validation errors
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
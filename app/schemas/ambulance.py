@@ -36,6 +36,11 @@ class AmbulanceServiceUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class AmbulanceServiceBatchUpdate(AmbulanceServiceUpdate):
+    """Ambulance service changes within a batch update"""
+    id: int
+
+
 class AmbulanceServiceResponse(AmbulanceServiceBase):
     """Ambulance service response schema"""
     id: int
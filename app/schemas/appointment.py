@@ -56,3 +56,4 @@ class AppointmentListResponse(BaseModel):
     page: int
     page_size: int
     items: list[AppointmentResponse]
+    next_cursor: Optional[str] = None
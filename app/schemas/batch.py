@@ -0,0 +1,15 @@
+"""Batch operation schemas"""
+
+from pydantic import BaseModel, Field
+
+from app.core.constants import MAX_BATCH_SIZE
+
+
+class BatchDelete(BaseModel):
+    """Batch delete request schema"""
+    ids: list[int] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchDeleteResponse(BaseModel):
+    """Batch delete response schema"""
+    deleted: list[int]
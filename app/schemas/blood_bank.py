@@ -53,6 +53,11 @@ class BloodBankUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class BloodBankBatchUpdate(BloodBankUpdate):
+    """Blood bank changes within a batch update"""
+    id: int
+
+
 class BloodBankResponse(BloodBankBase, BloodInventory):
     """Blood Bank response schema"""
     id: int
@@ -41,3 +41,4 @@ class ContactMessageListResponse(BaseModel):
     page: int
     page_size: int
     items: list[ContactMessageResponse]
+    next_cursor: Optional[str] = None
@@ -25,6 +25,11 @@ class DepartmentUpdate(BaseModel):
     is_active: Optional[bool] = Field(None)
 
 
+class DepartmentBatchUpdate(DepartmentUpdate):
+    """Department changes within a batch update"""
+    id: int
+
+
 class DepartmentResponse(DepartmentBase):
     """Department response schema"""
     id: int
@@ -36,6 +36,11 @@ class EyeProductUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class EyeProductBatchUpdate(EyeProductUpdate):
+    """Eye product changes within a batch update"""
+    id: int
+
+
 class EyeProductResponse(EyeProductBase):
     """Eye product response schema"""
     id: int
@@ -0,0 +1,75 @@
+"""Doctor schedule schemas"""
+
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, time, datetime
+from typing import Optional
+
+from app.core.constants import DEFAULT_SLOT_MINUTES
+
+
+class DoctorScheduleBase(BaseModel):
+    """Weekly working hours schema"""
+    weekday: int = Field(..., ge=0, le=6, description="Day of week, 0 = Monday")
+    start_time: time = Field(..., description="Start of working hours")
+    end_time: time = Field(..., description="End of working hours")
+    slot_minutes: int = Field(DEFAULT_SLOT_MINUTES, ge=5, le=24 * 60, description="Length of one appointment slot")
+    
+    @model_validator(mode='after')
+    def validate_hours(self):
+        """Working hours must end after they start"""
+        if self.end_time <= self.start_time:
+            raise ValueError('end_time must be after start_time')
+        return self
+
+
+class DoctorScheduleCreate(DoctorScheduleBase):
+    """Weekly working hours creation schema"""
+    pass
+
+
+class DoctorScheduleResponse(DoctorScheduleBase):
+    """Weekly working hours response schema"""
+    id: int
+    doctor_id: int
+    
+    class Config:
+        from_attributes = True
+
+
+class ScheduleExceptionBase(BaseModel):
+    """Per-date working hours schema; without start and end time the date is off"""
+    exception_date: date = Field(..., description="Date the weekly schedule is replaced on")
+    start_time: Optional[time] = Field(None, description="Start of working hours on this date")
+    end_time: Optional[time] = Field(None, description="End of working hours on this date")
+    slot_minutes: Optional[int] = Field(None, ge=5, le=24 * 60, description="Length of one appointment slot")
+    reason: Optional[str] = Field(None, max_length=255, description="Reason, e.g. leave or surgery")
+    
+    @model_validator(mode='after')
+    def validate_hours(self):
+        """Start and end time come together, and end after the start"""
+        if (self.start_time is None) != (self.end_time is None):
+            raise ValueError('start_time and end_time must be given together')
+        if self.start_time is not None and self.end_time <= self.start_time:
+            raise ValueError('end_time must be after start_time')
+        return self
+
+
+class ScheduleExceptionCreate(ScheduleExceptionBase):
+    """Per-date working hours creation schema"""
+    pass
+
+
+class ScheduleExceptionResponse(ScheduleExceptionBase):
+    """Per-date working hours response schema"""
+    id: int
+    doctor_id: int
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class DaySlots(BaseModel):
+    """Free appointment slots of a doctor on one date"""
+    date: date
+    slots: list[time]
@@ -26,6 +26,11 @@ class ServiceUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class ServiceBatchUpdate(ServiceUpdate):
+    """Service changes within a batch update"""
+    id: int
+
+
 class ServiceResponse(ServiceBase):
     """Service response schema"""
     id: int
@@ -1,7 +1,8 @@
 """Gunicorn configuration file for Render deployment with ASGI support"""
 
 import os
-import multiprocessing
+
+from app.config import worker_count
 
 # Server socket - bind to the PORT environment variable or default to 8000
 port = os.getenv('PORT', '8000')
@@ -9,7 +10,7 @@ bind = f"0.0.0.0:{port}"
 backlog = 2048
 
 # Worker processes - use uvicorn workers for ASGI support
-workers = int(os.getenv('WORKERS', max(2, multiprocessing.cpu_count())))
+workers = worker_count()
 worker_class = "uvicorn.workers.UvicornWorker"
 worker_connections = 1000
 timeout = 120
@@ -0,0 +1,319 @@
+"""Baseline schema: every table as created by Base.metadata.create_all
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 02:04:30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ambulance_services',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('phone', sa.String(length=20), nullable=False),
+    sa.Column('location', sa.String(length=500), nullable=True),
+    sa.Column('latitude', sa.String(length=50), nullable=True),
+    sa.Column('longitude', sa.String(length=50), nullable=True),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('available_24_7', sa.Boolean(), nullable=True),
+    sa.Column('ambulance_count', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_ambulance_services_active', 'ambulance_services', ['is_active'], unique=False)
+    op.create_index(op.f('ix_ambulance_services_id'), 'ambulance_services', ['id'], unique=False)
+    op.create_index(op.f('ix_ambulance_services_is_active'), 'ambulance_services', ['is_active'], unique=False)
+    op.create_index(op.f('ix_ambulance_services_name'), 'ambulance_services', ['name'], unique=True)
+    op.create_index(op.f('ix_ambulance_services_phone'), 'ambulance_services', ['phone'], unique=False)
+
+    op.create_table('blood_banks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('phone', sa.String(length=20), nullable=False),
+    sa.Column('location', sa.String(length=500), nullable=True),
+    sa.Column('latitude', sa.String(length=50), nullable=True),
+    sa.Column('longitude', sa.String(length=50), nullable=True),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('blood_group_o_positive', sa.Integer(), nullable=True),
+    sa.Column('blood_group_o_negative', sa.Integer(), nullable=True),
+    sa.Column('blood_group_a_positive', sa.Integer(), nullable=True),
+    sa.Column('blood_group_a_negative', sa.Integer(), nullable=True),
+    sa.Column('blood_group_b_positive', sa.Integer(), nullable=True),
+    sa.Column('blood_group_b_negative', sa.Integer(), nullable=True),
+    sa.Column('blood_group_ab_positive', sa.Integer(), nullable=True),
+    sa.Column('blood_group_ab_negative', sa.Integer(), nullable=True),
+    sa.Column('available_24_7', sa.Boolean(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_blood_banks_active', 'blood_banks', ['is_active'], unique=False)
+    op.create_index(op.f('ix_blood_banks_id'), 'blood_banks', ['id'], unique=False)
+    op.create_index(op.f('ix_blood_banks_is_active'), 'blood_banks', ['is_active'], unique=False)
+    op.create_index(op.f('ix_blood_banks_name'), 'blood_banks', ['name'], unique=True)
+    op.create_index(op.f('ix_blood_banks_phone'), 'blood_banks', ['phone'], unique=False)
+
+    op.create_table('contact_messages',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('subject', sa.String(length=255), nullable=True),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_contact_messages_status_date', 'contact_messages', ['status', 'created_at'], unique=False)
+    op.create_index(op.f('ix_contact_messages_email'), 'contact_messages', ['email'], unique=False)
+    op.create_index(op.f('ix_contact_messages_id'), 'contact_messages', ['id'], unique=False)
+    op.create_index(op.f('ix_contact_messages_status'), 'contact_messages', ['status'], unique=False)
+
+    op.create_table('departments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_departments_id'), 'departments', ['id'], unique=False)
+    op.create_index(op.f('ix_departments_is_active'), 'departments', ['is_active'], unique=False)
+    op.create_index(op.f('ix_departments_name'), 'departments', ['name'], unique=True)
+
+    op.create_table('eye_products',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('category', sa.String(length=100), nullable=False),
+    sa.Column('brand', sa.String(length=255), nullable=True),
+    sa.Column('price', sa.String(length=50), nullable=True),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('stock_quantity', sa.Integer(), nullable=True),
+    sa.Column('is_available', sa.Boolean(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_eye_products_brand', 'eye_products', ['brand'], unique=False)
+    op.create_index('idx_eye_products_category_active', 'eye_products', ['category', 'is_active'], unique=False)
+    op.create_index(op.f('ix_eye_products_category'), 'eye_products', ['category'], unique=False)
+    op.create_index(op.f('ix_eye_products_id'), 'eye_products', ['id'], unique=False)
+    op.create_index(op.f('ix_eye_products_is_active'), 'eye_products', ['is_active'], unique=False)
+    op.create_index(op.f('ix_eye_products_is_available'), 'eye_products', ['is_available'], unique=False)
+    op.create_index(op.f('ix_eye_products_name'), 'eye_products', ['name'], unique=False)
+
+    op.create_table('services',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('icon', sa.String(length=100), nullable=True),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_index(op.f('ix_services_id'), 'services', ['id'], unique=False)
+    op.create_index(op.f('ix_services_is_active'), 'services', ['is_active'], unique=False)
+
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=False),
+    sa.Column('hashed_password', sa.String(length=255), nullable=False),
+    sa.Column('full_name', sa.String(length=255), nullable=True),
+    sa.Column('email', sa.String(length=255), nullable=True),
+    sa.Column('nid', sa.String(length=20), nullable=True),
+    sa.Column('date_of_birth', sa.Date(), nullable=True),
+    sa.Column('gender', sa.String(length=20), nullable=True),
+    sa.Column('blood_group', sa.String(length=10), nullable=True),
+    sa.Column('division', sa.String(length=100), nullable=True),
+    sa.Column('district', sa.String(length=100), nullable=True),
+    sa.Column('upazila', sa.String(length=100), nullable=True),
+    sa.Column('village', sa.String(length=255), nullable=True),
+    sa.Column('address', sa.Text(), nullable=True),
+    sa.Column('emergency_contact_name', sa.String(length=255), nullable=True),
+    sa.Column('emergency_contact_phone', sa.String(length=20), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_admin', sa.Boolean(), nullable=True),
+    sa.Column('is_doctor', sa.Boolean(), nullable=True),
+    sa.Column('token_version', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_users_phone_active', 'users', ['phone', 'is_active'], unique=False)
+    op.create_index(op.f('ix_users_created_at'), 'users', ['created_at'], unique=False)
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_index(op.f('ix_users_is_active'), 'users', ['is_active'], unique=False)
+    op.create_index(op.f('ix_users_nid'), 'users', ['nid'], unique=False)
+    op.create_index(op.f('ix_users_phone'), 'users', ['phone'], unique=True)
+
+    op.create_table('audit_logs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('action', sa.String(length=100), nullable=False),
+    sa.Column('entity_type', sa.String(length=100), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=True),
+    sa.Column('old_values', sa.JSON(), nullable=True),
+    sa.Column('new_values', sa.JSON(), nullable=True),
+    sa.Column('ip_address', sa.String(length=45), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_audit_logs_entity', 'audit_logs', ['entity_type', 'entity_id'], unique=False)
+    op.create_index('idx_audit_logs_user_date', 'audit_logs', ['user_id', 'created_at'], unique=False)
+    op.create_index(op.f('ix_audit_logs_created_at'), 'audit_logs', ['created_at'], unique=False)
+    op.create_index(op.f('ix_audit_logs_id'), 'audit_logs', ['id'], unique=False)
+    op.create_index(op.f('ix_audit_logs_user_id'), 'audit_logs', ['user_id'], unique=False)
+
+    op.create_table('doctors',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('specialty', sa.String(length=255), nullable=False),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('bio', sa.Text(), nullable=True),
+    sa.Column('experience_years', sa.Integer(), nullable=True),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.Column('is_available', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_doctors_department_available', 'doctors', ['department_id', 'is_available'], unique=False)
+    op.create_index(op.f('ix_doctors_department_id'), 'doctors', ['department_id'], unique=False)
+    op.create_index(op.f('ix_doctors_id'), 'doctors', ['id'], unique=False)
+    op.create_index(op.f('ix_doctors_is_available'), 'doctors', ['is_available'], unique=False)
+    op.create_index(op.f('ix_doctors_specialty'), 'doctors', ['specialty'], unique=False)
+    op.create_index(op.f('ix_doctors_user_id'), 'doctors', ['user_id'], unique=True)
+
+    op.create_table('appointments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('patient_id', sa.Integer(), nullable=False),
+    sa.Column('doctor_id', sa.Integer(), nullable=True),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.Column('appointment_date', sa.Date(), nullable=False),
+    sa.Column('appointment_time', sa.Time(), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ),
+    sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ),
+    sa.ForeignKeyConstraint(['patient_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_appointments_doctor_date', 'appointments', ['doctor_id', 'appointment_date'], unique=False)
+    op.create_index('idx_appointments_patient_date', 'appointments', ['patient_id', 'appointment_date'], unique=False)
+    op.create_index('idx_appointments_status_date', 'appointments', ['status', 'appointment_date'], unique=False)
+    op.create_index(op.f('ix_appointments_appointment_date'), 'appointments', ['appointment_date'], unique=False)
+    op.create_index(op.f('ix_appointments_department_id'), 'appointments', ['department_id'], unique=False)
+    op.create_index(op.f('ix_appointments_doctor_id'), 'appointments', ['doctor_id'], unique=False)
+    op.create_index(op.f('ix_appointments_id'), 'appointments', ['id'], unique=False)
+    op.create_index(op.f('ix_appointments_patient_id'), 'appointments', ['patient_id'], unique=False)
+    op.create_index(op.f('ix_appointments_status'), 'appointments', ['status'], unique=False)
+
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_appointments_status'), table_name='appointments')
+    op.drop_index(op.f('ix_appointments_patient_id'), table_name='appointments')
+    op.drop_index(op.f('ix_appointments_id'), table_name='appointments')
+    op.drop_index(op.f('ix_appointments_doctor_id'), table_name='appointments')
+    op.drop_index(op.f('ix_appointments_department_id'), table_name='appointments')
+    op.drop_index(op.f('ix_appointments_appointment_date'), table_name='appointments')
+    op.drop_index('idx_appointments_status_date', table_name='appointments')
+    op.drop_index('idx_appointments_patient_date', table_name='appointments')
+    op.drop_index('idx_appointments_doctor_date', table_name='appointments')
+
+    op.drop_table('appointments')
+    op.drop_index(op.f('ix_doctors_user_id'), table_name='doctors')
+    op.drop_index(op.f('ix_doctors_specialty'), table_name='doctors')
+    op.drop_index(op.f('ix_doctors_is_available'), table_name='doctors')
+    op.drop_index(op.f('ix_doctors_id'), table_name='doctors')
+    op.drop_index(op.f('ix_doctors_department_id'), table_name='doctors')
+    op.drop_index('idx_doctors_department_available', table_name='doctors')
+
+    op.drop_table('doctors')
+    op.drop_index(op.f('ix_audit_logs_user_id'), table_name='audit_logs')
+    op.drop_index(op.f('ix_audit_logs_id'), table_name='audit_logs')
+    op.drop_index(op.f('ix_audit_logs_created_at'), table_name='audit_logs')
+    op.drop_index('idx_audit_logs_user_date', table_name='audit_logs')
+    op.drop_index('idx_audit_logs_entity', table_name='audit_logs')
+
+    op.drop_table('audit_logs')
+    op.drop_index(op.f('ix_users_phone'), table_name='users')
+    op.drop_index(op.f('ix_users_nid'), table_name='users')
+    op.drop_index(op.f('ix_users_is_active'), table_name='users')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_index(op.f('ix_users_created_at'), table_name='users')
+    op.drop_index('idx_users_phone_active', table_name='users')
+
+    op.drop_table('users')
+    op.drop_index(op.f('ix_services_is_active'), table_name='services')
+    op.drop_index(op.f('ix_services_id'), table_name='services')
+
+    op.drop_table('services')
+    op.drop_index(op.f('ix_eye_products_name'), table_name='eye_products')
+    op.drop_index(op.f('ix_eye_products_is_available'), table_name='eye_products')
+    op.drop_index(op.f('ix_eye_products_is_active'), table_name='eye_products')
+    op.drop_index(op.f('ix_eye_products_id'), table_name='eye_products')
+    op.drop_index(op.f('ix_eye_products_category'), table_name='eye_products')
+    op.drop_index('idx_eye_products_category_active', table_name='eye_products')
+    op.drop_index('idx_eye_products_brand', table_name='eye_products')
+
+    op.drop_table('eye_products')
+    op.drop_index(op.f('ix_departments_name'), table_name='departments')
+    op.drop_index(op.f('ix_departments_is_active'), table_name='departments')
+    op.drop_index(op.f('ix_departments_id'), table_name='departments')
+
+    op.drop_table('departments')
+    op.drop_index(op.f('ix_contact_messages_status'), table_name='contact_messages')
+    op.drop_index(op.f('ix_contact_messages_id'), table_name='contact_messages')
+    op.drop_index(op.f('ix_contact_messages_email'), table_name='contact_messages')
+    op.drop_index('idx_contact_messages_status_date', table_name='contact_messages')
+
+    op.drop_table('contact_messages')
+    op.drop_index(op.f('ix_blood_banks_phone'), table_name='blood_banks')
+    op.drop_index(op.f('ix_blood_banks_name'), table_name='blood_banks')
+    op.drop_index(op.f('ix_blood_banks_is_active'), table_name='blood_banks')
+    op.drop_index(op.f('ix_blood_banks_id'), table_name='blood_banks')
+    op.drop_index('idx_blood_banks_active', table_name='blood_banks')
+
+    op.drop_table('blood_banks')
+    op.drop_index(op.f('ix_ambulance_services_phone'), table_name='ambulance_services')
+    op.drop_index(op.f('ix_ambulance_services_name'), table_name='ambulance_services')
+    op.drop_index(op.f('ix_ambulance_services_is_active'), table_name='ambulance_services')
+    op.drop_index(op.f('ix_ambulance_services_id'), table_name='ambulance_services')
+    op.drop_index('idx_ambulance_services_active', table_name='ambulance_services')
+
+    op.drop_table('ambulance_services')
@@ -0,0 +1,75 @@
+"""Move blood bank inventory from eight blood_group_* columns to blood_inventory rows
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 02:20:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Blood group stored in each legacy blood_banks column
+LEGACY_COLUMNS = {
+    'O+': 'blood_group_o_positive',
+    'O-': 'blood_group_o_negative',
+    'A+': 'blood_group_a_positive',
+    'A-': 'blood_group_a_negative',
+    'B+': 'blood_group_b_positive',
+    'B-': 'blood_group_b_negative',
+    'AB+': 'blood_group_ab_positive',
+    'AB-': 'blood_group_ab_negative',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('blood_inventory',
+    sa.Column('bank_id', sa.Integer(), nullable=False),
+    sa.Column('blood_group', sa.String(length=3), nullable=False),
+    sa.Column('units', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['bank_id'], ['blood_banks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('bank_id', 'blood_group')
+    )
+    op.create_index('idx_blood_inventory_group_units', 'blood_inventory', ['blood_group', 'units', 'bank_id'], unique=False)
+
+    for blood_group, column in LEGACY_COLUMNS.items():
+        op.execute(
+            sa.text(
+                f"INSERT INTO blood_inventory (bank_id, blood_group, units, updated_at) "
+                f"SELECT id, :blood_group, {column}, updated_at FROM blood_banks WHERE {column} IS NOT NULL"
+            ).bindparams(blood_group=blood_group)
+        )
+
+    with op.batch_alter_table('blood_banks') as batch_op:
+        for column in LEGACY_COLUMNS.values():
+            batch_op.drop_column(column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('blood_banks') as batch_op:
+        for column in LEGACY_COLUMNS.values():
+            batch_op.add_column(sa.Column(column, sa.Integer(), nullable=True))
+
+    for blood_group, column in LEGACY_COLUMNS.items():
+        op.execute(
+            sa.text(
+                f"UPDATE blood_banks SET {column} = COALESCE(("
+                f"SELECT units FROM blood_inventory "
+                f"WHERE blood_inventory.bank_id = blood_banks.id AND blood_inventory.blood_group = :blood_group"
+                f"), 0)"
+            ).bindparams(blood_group=blood_group)
+        )
+
+    op.drop_index('idx_blood_inventory_group_units', table_name='blood_inventory')
+    op.drop_table('blood_inventory')
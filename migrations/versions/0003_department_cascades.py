@@ -0,0 +1,56 @@
+"""ON DELETE rules for the foreign keys into departments and doctors
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 02:40:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The baseline foreign keys are unnamed; SQLite batch mode finds them under this convention
+NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+
+# (table, column, referred table, ON DELETE rule)
+FOREIGN_KEYS = [
+    ('doctors', 'department_id', 'departments', 'CASCADE'),
+    ('appointments', 'department_id', 'departments', 'CASCADE'),
+    ('appointments', 'doctor_id', 'doctors', 'SET NULL'),
+]
+
+
+def _replace_foreign_key(table: str, column: str, referred: str, ondelete: Union[str, None]) -> None:
+    """Recreate the foreign key on table.column with another ON DELETE rule"""
+    existing = next(
+        fk for fk in sa.inspect(op.get_bind()).get_foreign_keys(table)
+        if fk['constrained_columns'] == [column]
+    )
+    name = existing['name'] or NAMING_CONVENTION['fk'] % {
+        'table_name': table,
+        'column_0_name': column,
+        'referred_table_name': referred,
+    }
+    with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(name, type_='foreignkey')
+        batch_op.create_foreign_key(name, referred, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, referred, ondelete in FOREIGN_KEYS:
+        _replace_foreign_key(table, column, referred, ondelete)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, referred, _ in reversed(FOREIGN_KEYS):
+        _replace_foreign_key(table, column, referred, None)
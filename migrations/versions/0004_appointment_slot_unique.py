@@ -0,0 +1,49 @@
+"""Partial unique index on active bookings of a doctor slot
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 05:10:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = "status IN ('confirmed', 'pending')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Double bookings made before the index existed would fail its creation
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT doctor_id, appointment_date, appointment_time FROM appointments "
+        f"WHERE doctor_id IS NOT NULL AND {ACTIVE} "
+        "GROUP BY doctor_id, appointment_date, appointment_time HAVING COUNT(*) > 1"
+    )).fetchall()
+    if duplicates:
+        slots = ", ".join(f"doctor {row[0]} at {row[1]} {row[2]}" for row in duplicates[:10])
+        raise RuntimeError(
+            f"Cancel the duplicate active appointments before upgrading ({len(duplicates)} slots): {slots}"
+        )
+
+    op.create_index(
+        'uq_appointments_doctor_slot',
+        'appointments',
+        ['doctor_id', 'appointment_date', 'appointment_time'],
+        unique=True,
+        postgresql_where=sa.text(ACTIVE),
+        sqlite_where=sa.text(ACTIVE),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_appointments_doctor_slot', table_name='appointments')
@@ -0,0 +1,61 @@
+"""Doctor weekly schedules and per-date exceptions
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 05:40:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('doctor_schedules',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('doctor_id', sa.Integer(), nullable=False),
+    sa.Column('weekday', sa.Integer(), nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=False),
+    sa.Column('end_time', sa.Time(), nullable=False),
+    sa.Column('slot_minutes', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_doctor_schedules_doctor_weekday', 'doctor_schedules', ['doctor_id', 'weekday'], unique=False)
+    op.create_index(op.f('ix_doctor_schedules_id'), 'doctor_schedules', ['id'], unique=False)
+
+    op.create_table('doctor_schedule_exceptions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('doctor_id', sa.Integer(), nullable=False),
+    sa.Column('exception_date', sa.Date(), nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=True),
+    sa.Column('end_time', sa.Time(), nullable=True),
+    sa.Column('slot_minutes', sa.Integer(), nullable=True),
+    sa.Column('reason', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_doctor_schedule_exceptions_doctor_date', 'doctor_schedule_exceptions', ['doctor_id', 'exception_date'], unique=False)
+    op.create_index(op.f('ix_doctor_schedule_exceptions_id'), 'doctor_schedule_exceptions', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_doctor_schedule_exceptions_id'), table_name='doctor_schedule_exceptions')
+    op.drop_index('idx_doctor_schedule_exceptions_doctor_date', table_name='doctor_schedule_exceptions')
+    op.drop_table('doctor_schedule_exceptions')
+    op.drop_index(op.f('ix_doctor_schedules_id'), table_name='doctor_schedules')
+    op.drop_index('idx_doctor_schedules_doctor_weekday', table_name='doctor_schedules')
+    op.drop_table('doctor_schedules')
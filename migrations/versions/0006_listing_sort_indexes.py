@@ -0,0 +1,33 @@
+"""Indexes on the keyset sort columns of the unfiltered listings
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 06:20:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_contact_messages_created_id', 'contact_messages', ['created_at', 'id'], unique=False)
+    op.create_index('idx_appointments_date_id', 'appointments', ['appointment_date', 'id'], unique=False)
+    # Covered by the leading column of idx_appointments_date_id
+    op.drop_index(op.f('ix_appointments_appointment_date'), table_name='appointments')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_appointments_appointment_date'), 'appointments', ['appointment_date'], unique=False)
+    op.drop_index('idx_appointments_date_id', table_name='appointments')
+    op.drop_index('idx_contact_messages_created_id', table_name='contact_messages')
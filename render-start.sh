@@ -7,6 +7,9 @@ echo "🚀 Starting Modern Hospital Backend on Render..."
 echo "Environment: ${ENVIRONMENT:-production}"
 echo "Port: ${PORT:-8000}"
 
+# Apply schema migrations once, before any worker starts
+python scripts/migrate_db.py
+
 # Start the application with uvicorn
 exec uvicorn app:app \
   --host 0.0.0.0 \
@@ -11,13 +11,16 @@ echo "Port: ${PORT:-8000}"
 # Ensure we're in the backend directory
 cd "$(dirname "$0")"
 
+# Apply schema migrations once, before any worker starts
+python scripts/migrate_db.py
+
 # Run the application with gunicorn and uvicorn workers
 # This properly handles ASGI applications like FastAPI
+# gunicorn_config.py sets the worker count (app.config.worker_count)
 exec gunicorn \
   --config gunicorn_config.py \
   --worker-class uvicorn.workers.UvicornWorker \
   --bind 0.0.0.0:${PORT:-8000} \
-  --workers ${WORKERS:-4} \
   --timeout 120 \
   --access-logfile - \
   --error-logfile - \
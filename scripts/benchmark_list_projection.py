@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark CPU time and memory per list request, ORM hydration vs projection
+Seeds an in-memory SQLite database with doctors (long bios, users with long
+addresses) and appointments (long notes), then times the data access and
+response serialization behind GET /doctors and GET /appointments: full ORM
+objects as before, and CRUDBase projections of the response model's columns.
+
+Usage: python scripts/benchmark_list_projection.py [page_size] [iterations]
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+from datetime import date, time as time_of_day, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload, undefer
+
+from app.crud.appointment import appointment as crud_appointment
+from app.crud.doctor import doctor as crud_doctor
+from app.db.models import Base, Appointment, Department, Doctor, User
+from app.schemas.appointment import AppointmentResponse
+from app.schemas.doctor import DoctorResponse
+
+LONG_TEXT = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40
+
+
+async def seed(db: AsyncSession, rows: int) -> None:
+    """Doctors with users, and appointments, with large text columns filled"""
+    db.add(Department(name="Cardiology", description=LONG_TEXT))
+    for index in range(rows):
+        db.add(User(phone=f"+88017{index:08d}", hashed_password="x", full_name=f"Doctor {index}", address=LONG_TEXT))
+    await db.flush()
+    for index in range(rows):
+        db.add(Doctor(user_id=index + 1, department_id=1, specialty="Cardiology", bio=LONG_TEXT))
+        db.add(Appointment(
+            patient_id=index + 1,
+            doctor_id=index + 1,
+            department_id=1,
+            appointment_date=date(2026, 1, 1) + timedelta(days=index % 90),
+            appointment_time=time_of_day(9, 0),
+            notes=LONG_TEXT,
+        ))
+    await db.commit()
+
+
+async def measure(db: AsyncSession, request, iterations: int) -> tuple[float, float]:
+    """Average CPU milliseconds and peak KiB allocated per call of request"""
+    for _ in range(20):
+        await request()
+
+    db.expunge_all()
+    started = time.process_time()
+    for _ in range(iterations):
+        await request()
+        # A new session per request: drop the identity map between calls
+        db.expunge_all()
+    cpu_ms = (time.process_time() - started) / iterations * 1000
+
+    tracemalloc.start()
+    await request()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.expunge_all()
+    return cpu_ms, peak / 1024
+
+
+async def run(page_size: int, iterations: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    doctors = TypeAdapter(list[DoctorResponse])
+    appointments = TypeAdapter(list[AppointmentResponse])
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        await seed(db, max(page_size, 200))
+
+        async def doctors_orm():
+            # The previous get_available, before bio and address were deferred
+            result = await db.execute(
+                select(Doctor)
+                .where(Doctor.is_available == True)
+                .options(selectinload(Doctor.user).undefer(User.address), undefer(Doctor.bio))
+                .limit(page_size)
+            )
+            return doctors.dump_json(doctors.validate_python(result.scalars().all(), from_attributes=True))
+
+        async def doctors_projected():
+            page = await crud_doctor.get_available(db, 0, page_size, response_model=DoctorResponse)
+            return doctors.dump_json(doctors.validate_python(page.items, from_attributes=True))
+
+        async def appointments_orm():
+            page = await crud_appointment.get_page(db, 0, page_size)
+            return appointments.dump_json(appointments.validate_python(page.items, from_attributes=True))
+
+        async def appointments_projected():
+            page = await crud_appointment.get_page(db, 0, page_size, response_model=AppointmentResponse)
+            return appointments.dump_json(appointments.validate_python(page.items, from_attributes=True))
+
+        for endpoint, orm, projected in (
+            ("GET /doctors", doctors_orm, doctors_projected),
+            ("GET /appointments", appointments_orm, appointments_projected),
+        ):
+            print(f"\n{endpoint}, {page_size} rows per page, {iterations} requests\n")
+            orm_cpu, orm_kib = await measure(db, orm, iterations)
+            projected_cpu, projected_kib = await measure(db, projected, iterations)
+            print(f"  {'ORM objects':<22} {orm_cpu:>8.2f} ms CPU  {orm_kib:>9.1f} KiB peak")
+            print(f"  {'projected rows':<22} {projected_cpu:>8.2f} ms CPU  {projected_kib:>9.1f} KiB peak")
+            print(
+                f"\n  Saved {orm_cpu - projected_cpu:.2f} ms CPU ({(1 - projected_cpu / orm_cpu) * 100:.0f}%) "
+                f"and {orm_kib - projected_kib:.1f} KiB ({(1 - projected_kib / orm_kib) * 100:.0f}%) per request"
+            )
+
+    await engine.dispose()
+    print()
+
+
+def main():
+    """Main entry point"""
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    asyncio.run(run(page_size, iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark connection pool contention with and without release-after-read
+Simulates a burst of requests that each run a couple of reads separated by
+non-database work (token checks, hashing, serialization) against a small
+pool, and reports how long requests waited for a connection.
+
+Usage: python scripts/benchmark_pool_contention.py [requests] [pool_size] [work_ms]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.db.lazy_session import LazyAsyncSession
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool, PoolMetrics
+
+
+async def run(release_after_read: bool, requests: int, pool_size: int, work_ms: float) -> dict:
+    """Fire a burst of simulated requests and return pool wait statistics"""
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=120,
+    )
+    metrics = PoolMetrics()
+    metrics.attach(engine.sync_engine.pool)
+    session_factory = async_sessionmaker(engine, class_=LazyAsyncSession, expire_on_commit=False)
+
+    async def request() -> None:
+        async with session_factory(release_after_read=release_after_read) as session:
+            await session.execute(select(1))  # e.g. load the current user
+            await asyncio.sleep(work_ms / 1000)  # e.g. verify a password, call another service
+            await session.execute(select(2))  # e.g. load the page of results
+            await asyncio.sleep(work_ms / 1000)  # e.g. serialize the response
+
+    # Warm the pool so both runs start from the same state
+    await asyncio.gather(*(request() for _ in range(pool_size)))
+    metrics.reset()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    stats = metrics.snapshot(engine.sync_engine.pool)
+    await engine.dispose()
+    stats["elapsed_s"] = round(elapsed, 3)
+    return stats
+
+
+def main():
+    """Main entry point"""
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pool_size = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    work_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 20.0
+
+    print(f"\n{requests} concurrent requests, pool of {pool_size}, {work_ms:.0f} ms of non-DB work per step\n")
+    print(f"  {'mode':<22} {'elapsed s':>10} {'checkouts':>10} {'avg wait ms':>12} {'max wait ms':>12} {'max waiting':>12}")
+    for label, release in (("held until teardown", False), ("release after read", True)):
+        stats = asyncio.run(run(release, requests, pool_size, work_ms))
+        print(
+            f"  {label:<22} {stats['elapsed_s']:>10} {stats['checkouts']:>10} "
+            f"{stats['avg_wait_ms']:>12} {stats['max_wait_ms']:>12} {stats['max_waiting']:>12}"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-query overhead of rebuilt vs cached CRUD statements
+Measures the Python-side cost of building a select() and deriving its cache
+key on every call against reusing one bindparam statement, then the full
+round trip of CRUDBase.get against an in-memory SQLite database.
+
+Usage: python scripts/benchmark_statement_cache.py [iterations]
+"""
+
+import asyncio
+import sys
+import time
+import timeit
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.crud.department import department as crud_department
+from app.db.models import Base, Department
+
+
+def measure(label: str, func, number: int) -> float:
+    """Run func number times and print the cost per call"""
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    per_call_us = seconds / number * 1e6
+    print(f"  {label:<44} {per_call_us:>8.1f} us/call")
+    return per_call_us
+
+
+def rebuilt_get_statement(id: int):
+    """The previous CRUDBase.get: a new statement and cache key per call"""
+    statement = select(Department).where(Department.id == id)
+    statement._generate_cache_key()
+    return statement
+
+
+def cached_get_statement(id: int):
+    """CRUDBase.get now: one statement, memoized cache key"""
+    statement = crud_department._statement("get", lambda: select(Department).where(Department.id == bindparam("id")))
+    statement._generate_cache_key()
+    return statement
+
+
+async def round_trips(iterations: int) -> tuple[float, float]:
+    """Average microseconds per get() round trip, rebuilt vs cached"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        db.add(Department(name="Cardiology"))
+        await db.commit()
+
+        async def rebuilt():
+            result = await db.execute(select(Department).where(Department.id == 1))
+            return result.scalars().first()
+
+        async def cached():
+            return await crud_department.get(db, 1)
+
+        timings = []
+        for func in (rebuilt, cached):
+            for _ in range(100):
+                await func()
+            started = time.perf_counter()
+            for _ in range(iterations):
+                await func()
+            timings.append((time.perf_counter() - started) / iterations * 1e6)
+
+    await engine.dispose()
+    return timings[0], timings[1]
+
+
+def main():
+    """Main entry point"""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    print("\nStatement preparation (no database)\n")
+    rebuilt = measure("select() + cache key per call", lambda: rebuilt_get_statement(1), iterations)
+    cached = measure("cached bindparam statement", lambda: cached_get_statement(1), iterations)
+    print(f"\n  Saved {rebuilt - cached:.1f} us per query ({(1 - cached / rebuilt) * 100:.0f}%)")
+
+    print(f"\nFull get() round trip on in-memory SQLite ({iterations:,} calls)\n")
+    rebuilt_rt, cached_rt = asyncio.run(round_trips(iterations))
+    print(f"  {'rebuilt statement':<44} {rebuilt_rt:>8.1f} us/call")
+    print(f"  {'cached statement':<44} {cached_rt:>8.1f} us/call")
+    print(f"\n  Saved {rebuilt_rt - cached_rt:.1f} us per query ({(1 - cached_rt / rebuilt_rt) * 100:.0f}%)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-request cost of the token revocation check
+Compares it with the JWT decode every authenticated request already pays,
+and reports the file sync and compaction the background task runs with the
+configured intervals
+"""
+
+import os
+import sys
+import tempfile
+import time
+import timeit
+import uuid
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.core.revocation import TokenRevocationList
+from app.core.security import TokenUtils
+
+
+def measure(label: str, func, number: int) -> float:
+    """Run func number times and print the cost per call"""
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    per_call_ns = seconds / number * 1e9
+    print(f"  {label:<40} {per_call_ns:>10.0f} ns/call")
+    return per_call_ns
+
+
+def main():
+    """Main entry point"""
+    revoked_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    number = 200_000
+
+    # The configured intervals, with a real file of revoked_count entries, half of them expired
+    file_path = os.path.join(tempfile.mkdtemp(), "revoked.jsonl")
+    revocations = TokenRevocationList(
+        file_path=file_path,
+        sync_interval=settings.TOKEN_REVOCATION_SYNC_INTERVAL,
+        compact_interval=settings.TOKEN_REVOCATION_COMPACT_INTERVAL,
+    )
+    now = time.time()
+    for index in range(revoked_count):
+        revocations._append_file(uuid.uuid4().hex, now + 3600 if index % 2 else now - 1)
+    for jti, expires_at in revocations._read_file():
+        revocations._add(jti, expires_at)
+
+    revoked_jti = next(jti for jti, exp in revocations._revoked.items() if exp > now)
+    live_jti = uuid.uuid4().hex
+
+    token = TokenUtils.create_access_token({"sub": "1", "phone": "+10000000000"})
+    payload = TokenUtils.decode_token(token, use_cache=False)
+
+    print(f"\nToken revocation check with {revoked_count:,} revoked tokens\n")
+    miss = measure("is_revoked (live token)", lambda: revocations.is_revoked(live_jti), number)
+    measure("is_revoked (revoked token)", lambda: revocations.is_revoked(revoked_jti), number)
+    measure("is_revoked (token without jti)", lambda: revocations.is_revoked(payload.get("nojti")), number)
+    decode = measure("decode_token (uncached)", lambda: TokenUtils.decode_token(token, use_cache=False), number // 20)
+    measure("decode_token (cached)", lambda: TokenUtils.decode_token(token), number)
+
+    print(f"\nRevocation check adds {miss / decode * 100:.2f}% to an uncached token decode\n")
+
+    # Background work, in a thread off the event loop
+    print(f"Background file sync (every {settings.TOKEN_REVOCATION_SYNC_INTERVAL:g}s)\n")
+    measure("read new entries (none appended)", revocations._read_file, 1000)
+    revocations._file_offset = 0
+    start = time.perf_counter()
+    revocations._read_file()
+    print(f"  {'read the whole file (after a compaction)':<40} {(time.perf_counter() - start) * 1e3:>10.1f} ms")
+    start = time.perf_counter()
+    revocations._compact_file()
+    print(
+        f"  {f'compaction (every {settings.TOKEN_REVOCATION_COMPACT_INTERVAL:g}s)':<40} "
+        f"{(time.perf_counter() - start) * 1e3:>10.1f} ms\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
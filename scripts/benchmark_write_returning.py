@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark POST /appointments write latency: refresh, RETURNING, one statement
+Seeds an in-memory SQLite database with a department, a doctor and a
+patient, then times the data access behind POST /appointments: lookups,
+availability check and the insert with a refresh SELECT after the commit,
+the same with INSERT ... RETURNING, and CRUDAppointment.create's single
+INSERT ... ON CONFLICT DO NOTHING RETURNING without the checks.
+Each statement and commit is delayed by a simulated network round trip.
+
+Usage: python scripts/benchmark_write_returning.py [iterations] [round_trip_ms]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from datetime import date, time as time_of_day, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.crud.appointment import appointment as crud_appointment
+from app.crud.department import department as crud_department
+from app.crud.doctor import doctor as crud_doctor
+from app.db.models import Base, Appointment, Department, Doctor, User
+from app.schemas.appointment import AppointmentCreate, AppointmentResponse
+
+
+async def seed(db: AsyncSession) -> None:
+    """A department, a doctor and a patient"""
+    db.add(Department(name="Cardiology"))
+    db.add(User(phone="+8801700000001", hashed_password="x", full_name="Doctor"))
+    db.add(User(phone="+8801700000002", hashed_password="x", full_name="Patient"))
+    await db.flush()
+    db.add(Doctor(user_id=1, department_id=1, specialty="Cardiology"))
+    await db.commit()
+
+
+def appointment_in(index: int) -> AppointmentCreate:
+    """A request body for a free slot"""
+    return AppointmentCreate(
+        department_id=1,
+        doctor_id=1,
+        appointment_date=date(2027, 1, 1) + timedelta(days=index // 16),
+        appointment_time=time_of_day(9 + index % 16 // 2, 30 * (index % 2)),
+        notes="Follow-up",
+    )
+
+
+async def create_with_refresh(db: AsyncSession, obj_in: AppointmentCreate, patient_id: int) -> Appointment:
+    """The previous CRUDAppointment.create"""
+    db_obj = Appointment(**obj_in.dict(), patient_id=patient_id)
+    db.add(db_obj)
+    await db.commit()
+    await db.refresh(db_obj)
+    return db_obj
+
+
+async def create_with_returning(db: AsyncSession, obj_in: AppointmentCreate, patient_id: int) -> Appointment:
+    """A plain INSERT ... RETURNING, as before the partial unique index"""
+    return await crud_appointment._insert(db, {**obj_in.dict(), "patient_id": patient_id})
+
+
+def check_and_create(create):
+    """Existence and availability lookups ahead of the insert, as before"""
+    async def checked(db: AsyncSession, obj_in: AppointmentCreate, patient_id: int) -> Appointment:
+        await crud_department.get(db, obj_in.department_id)
+        await crud_doctor.get(db, obj_in.doctor_id)
+        await crud_appointment.check_availability(db, obj_in.doctor_id, obj_in.appointment_date, obj_in.appointment_time)
+        return await create(db, obj_in, patient_id=patient_id)
+    return checked
+
+
+async def post_appointment(db: AsyncSession, obj_in: AppointmentCreate, create) -> dict:
+    """The data access and serialization of POST /appointments"""
+    appointment = await create(db, obj_in, patient_id=2)
+    return AppointmentResponse.from_orm(appointment).dict()
+
+
+async def run(iterations: int, round_trip_ms: float) -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    statements = 0
+
+    def round_trip(*args):
+        nonlocal statements
+        statements += 1
+        time.sleep(round_trip_ms / 1000)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        await seed(db)
+        event.listen(engine.sync_engine, "before_cursor_execute", round_trip)
+        event.listen(engine.sync_engine, "commit", round_trip)
+
+        print(f"\nPOST /appointments, {iterations} requests, {round_trip_ms} ms per round trip\n")
+        results = {}
+        offset = 0
+        for label, create in (
+            ("commit + refresh", check_and_create(create_with_refresh)),
+            ("INSERT ... RETURNING", check_and_create(create_with_returning)),
+            ("single statement", crud_appointment.create),
+        ):
+            statements = 0
+            latencies = []
+            for index in range(offset, offset + iterations):
+                started = time.perf_counter()
+                await post_appointment(db, appointment_in(index), create)
+                latencies.append((time.perf_counter() - started) * 1000)
+                # A new session per request: drop the identity map between calls
+                db.expunge_all()
+            offset += iterations
+            mean = statistics.mean(latencies)
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            results[label] = mean
+            print(
+                f"  {label:<22} {mean:>7.2f} ms mean  {p95:>7.2f} ms p95  "
+                f"{statements / iterations:.1f} round trips per request"
+            )
+
+        before, *_, after = results.values()
+        print(f"\n  Saved {before - after:.2f} ms ({(1 - after / before) * 100:.0f}%) per request")
+
+    await engine.dispose()
+    print()
+
+
+def main():
+    """Main entry point"""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    round_trip_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    asyncio.run(run(iterations, round_trip_ms))
+
+
+if __name__ == "__main__":
+    main()
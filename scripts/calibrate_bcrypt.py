@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Calibrate the bcrypt cost factor for this host
+Benchmarks hash time per cost and recommends the highest cost that fits a
+latency target. Set the result as BCRYPT_ROUNDS; existing hashes are
+upgraded to it on each user's next successful login.
+
+Usage: python scripts/calibrate_bcrypt.py [target_ms] [samples]
+"""
+
+import statistics
+import sys
+import time
+
+import bcrypt
+
+MIN_ROUNDS = 10  # Anything cheaper is too weak for stored passwords
+MAX_ROUNDS = 16
+
+
+def measure_rounds(rounds: int, samples: int) -> float:
+    """Median hash time in milliseconds for a cost factor"""
+    password = b"Calibration-Password-123"
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    """Main entry point"""
+    target_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 250.0
+    samples = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print(f"\nCalibrating bcrypt cost for a {target_ms:.0f} ms target ({samples} samples per cost)\n")
+
+    chosen = None
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        median_ms = measure_rounds(rounds, samples)
+        fits = median_ms <= target_ms
+        print(f"  rounds={rounds:<3} {median_ms:>9.1f} ms  {'✓' if fits else '✗'}")
+        if not fits:
+            break
+        chosen = rounds
+
+    if chosen is None:
+        print(f"\nEven the minimum cost ({MIN_ROUNDS}) exceeds the target on this host")
+        chosen = MIN_ROUNDS
+    print(f"\nRecommended setting: BCRYPT_ROUNDS={chosen}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from app.db.session import AsyncSessionLocal, init_db
 from app.db.models import User, Department, Doctor
@@ -29,26 +30,19 @@ async def create_test_users():
     
     async with AsyncSessionLocal() as session:
         try:
-            # Check if users already exist
-            admin_check = await session.execute(
-                select(User).where(User.phone == "+11234567890")
+            # Check if users already exist (one query for all three phones)
+            test_phones = {
+                "+11234567890": "Admin",
+                "+11234567891": "Doctor",
+                "+11234567892": "Patient",
+            }
+            existing_check = await session.execute(
+                select(User.phone).where(User.phone.in_(test_phones))
             )
-            if admin_check.scalars().first():
-                print("✗ Admin user already exists")
-                return
-            
-            doctor_check = await session.execute(
-                select(User).where(User.phone == "+11234567891")
-            )
-            if doctor_check.scalars().first():
-                print("✗ Doctor user already exists")
-                return
-            
-            patient_check = await session.execute(
-                select(User).where(User.phone == "+11234567892")
-            )
-            if patient_check.scalars().first():
-                print("✗ Patient user already exists")
+            existing_phones = existing_check.scalars().all()
+            if existing_phones:
+                for phone in existing_phones:
+                    print(f"✗ {test_phones[phone]} user already exists")
                 return
             
             # Create Admin User
@@ -174,6 +168,10 @@ async def create_test_users():
             print("You can now use these credentials to log in!")
             print("="*60 + "\n")
             
+        except IntegrityError:
+            # Another run created one of the users after the check above
+            await session.rollback()
+            print("✗ Test users already exist")
         except Exception as e:
             await session.rollback()
             print(f"\n❌ Error creating test users: {e}")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Measure time-to-first-request for a cold start
+Starts uvicorn with several workers, polls /health until it answers and
+reports the elapsed time, once with the old create_all-per-worker startup
+and once with the migrated-schema revision check.
+
+Usage: python scripts/measure_boot_time.py [workers] [runs]
+Run scripts/migrate_db.py against DATABASE_URL first.
+"""
+
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+
+def free_port() -> int:
+    """Pick an unused local TCP port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_request(workers: int, create_tables: bool, timeout: float = 120.0) -> float:
+    """Seconds from process start until /health returns 200"""
+    port = free_port()
+    env = {**os.environ, "DB_CREATE_TABLES_ON_STARTUP": str(create_tables).lower()}
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {process.returncode}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.02)
+        raise TimeoutError(f"Server did not answer within {timeout:.0f}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    """Main entry point"""
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print(f"\nTime to first request, {workers} workers, median of {runs} runs\n")
+    for label, create_tables in (("create_all in every worker", True), ("schema revision check", False)):
+        timings = [time_to_first_request(workers, create_tables) for _ in range(runs)]
+        print(f"  {label:<28} {statistics.median(timings):>6.2f} s  (min {min(timings):.2f}, max {max(timings):.2f})")
+    print()
+
+
+if __name__ == "__main__":
+    main()
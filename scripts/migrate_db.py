@@ -1,4 +1,9 @@
-"""Database migration script to create/update tables"""
+"""Database migration script: upgrade the schema to the latest Alembic revision
+
+Run once per deploy, before the server starts:
+    python scripts/migrate_db.py          # upgrade to head
+    python scripts/migrate_db.py reset    # drop everything and rebuild (deletes all data)
+"""
 
 import asyncio
 import sys
@@ -7,59 +12,106 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.db.session import init_db, drop_db, engine
+from alembic import command
+from sqlalchemy import inspect, text
+
+from app.db.session import engine
 from app.db.models import Base
+from app.db.migrations import alembic_config
+
+# Revision matching the schema create_all produced before migrations existed
+BASELINE_REVISION = "0001"
+
+# Tables in the baseline revision; tables added later come from their own migrations
+BASELINE_TABLES = (
+    "ambulance_services", "blood_banks", "contact_messages", "departments", "eye_products",
+    "services", "users", "audit_logs", "doctors", "appointments",
+)
+
+
+async def adopt_unversioned_schema() -> bool:
+    """Bring a database built by create_all up to the baseline so it can be stamped
+
+    Returns True if the database had tables but no alembic_version table.
+    Raises RuntimeError, changing nothing, if any baseline table is missing:
+    creating it now would give it the current models' columns and indexes,
+    which the later migrations would then fail on or add a second time.
+    """
+    try:
+        async with engine.begin() as conn:
+            tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+            if "alembic_version" in tables or "users" not in tables:
+                return False
 
+            print("Existing schema without migration history found; adopting it...")
+            missing = [name for name in BASELINE_TABLES if name not in tables]
+            if missing:
+                raise RuntimeError(
+                    f"Cannot adopt a partially created schema; missing baseline tables: {', '.join(missing)}. "
+                    "Restore them or rebuild with `python scripts/migrate_db.py reset`"
+                )
+            user_columns = await conn.run_sync(
+                lambda sync_conn: {column["name"] for column in inspect(sync_conn).get_columns("users")}
+            )
+            if "token_version" not in user_columns:
+                await conn.execute(text("ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"))
+            return True
+    finally:
+        await engine.dispose()
+
+
+async def drop_schema():
+    """Drop every table, including the migration history"""
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    finally:
+        await engine.dispose()
 
-async def migrate():
+
+def migrate():
     """Run database migration"""
     try:
         print("Starting database migration...")
-        
-        # Create all tables
-        async with engine.begin() as conn:
-            print("Creating/updating tables...")
-            await conn.run_sync(Base.metadata.create_all)
-        
+        config = alembic_config()
+
+        if asyncio.run(adopt_unversioned_schema()):
+            command.stamp(config, BASELINE_REVISION)
+
+        command.upgrade(config, "head")
         print("✓ Database migration completed successfully!")
-        print("✓ All tables have been created/updated")
-        
+
     except Exception as e:
         print(f"✗ Migration failed: {e}")
         raise
-    finally:
-        await engine.dispose()
 
 
-async def reset_db():
-    """Reset database (drop and recreate all tables)"""
+def reset_db():
+    """Reset database (drop all tables and migrate from scratch)"""
     try:
         print("WARNING: This will delete all data!")
         response = input("Are you sure you want to reset the database? (yes/no): ")
-        
+
         if response.lower() != "yes":
             print("Reset cancelled")
             return
-        
+
         print("Dropping all tables...")
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.drop_all)
-        
-        print("Creating all tables...")
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        
+        asyncio.run(drop_schema())
+
+        print("Running migrations...")
+        command.upgrade(alembic_config(), "head")
+
         print("✓ Database has been reset successfully!")
-        
+
     except Exception as e:
         print(f"✗ Reset failed: {e}")
         raise
-    finally:
-        await engine.dispose()
 
 
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "reset":
-        asyncio.run(reset_db())
+        reset_db()
     else:
-        asyncio.run(migrate())
+        migrate()
@@ -8,9 +8,12 @@ echo "Environment: $ENVIRONMENT"
 echo "Debug: $DEBUG"
 echo "Port: $PORT"
 
+# Apply schema migrations once, before any worker starts
+python scripts/migrate_db.py
+
 # Run the application with gunicorn and uvicorn workers
 exec gunicorn \
-  -w 4 \
+  -w "$(python -c 'from app.config import worker_count; print(worker_count())')" \
   -k uvicorn.workers.UvicornWorker \
   --bind 0.0.0.0:${PORT:-8000} \
   --timeout 120 \
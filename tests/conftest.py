@@ -0,0 +1,40 @@
+"""Test configuration: a throwaway SQLite database and an in-process client"""
+
+import os
+import tempfile
+
+# Settings are read on import, so the environment is set before the app is loaded
+_database_path = os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_database_path}"
+os.environ["DATABASE_REPLICA_URL"] = ""
+os.environ["REDIS_URL"] = ""
+os.environ["QUERY_STATS_ENABLED"] = "true"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+
+from app.db.base import Base
+from app.db.session import dispose_engines
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def sync_engine():
+    """Synchronous engine on the test database, with the schema created"""
+    engine = create_engine(f"sqlite:///{_database_path}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(sync_engine):
+    """HTTP client calling the app in-process"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    # Pooled connections belong to this test's event loop
+    await dispose_engines()
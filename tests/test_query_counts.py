@@ -0,0 +1,126 @@
+"""Statement counts of the detail endpoints
+
+Each detail endpoint loads its record, relationships and counts in one or
+two statements however many related rows there are; the counts are read
+from the Server-Timing header the query-stats middleware adds.
+"""
+
+import re
+from datetime import date, time
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.orm import Session
+
+from app.core.security import TokenUtils
+from app.db.models import Appointment, Department, Doctor, User
+
+
+def statement_count(response) -> int:
+    """Number of SQL statements reported in a response's Server-Timing header"""
+    match = re.search(r'desc="(\d+) queries"', response.headers["server-timing"])
+    assert match, response.headers["server-timing"]
+    return int(match.group(1))
+
+
+@pytest.fixture(scope="module")
+def records(sync_engine):
+    """An admin, a patient, a department with two doctors and some appointments"""
+    with Session(sync_engine) as session:
+        admin = User(phone="+8801700000001", hashed_password="x", full_name="Admin", is_admin=True)
+        patient = User(phone="+8801700000002", hashed_password="x", full_name="Patient")
+        doctor_users = [
+            User(phone=f"+88017000001{index:02d}", hashed_password="x", full_name=f"Dr {index}", is_doctor=True)
+            for index in range(2)
+        ]
+        department = Department(name="Cardiology", description="Heart")
+        session.add_all([admin, patient, *doctor_users, department])
+        session.flush()
+
+        doctors = [
+            Doctor(user_id=user.id, department_id=department.id, specialty="Cardiology", bio="Bio")
+            for user in doctor_users
+        ]
+        session.add_all(doctors)
+        session.flush()
+
+        appointments = [
+            Appointment(
+                patient_id=patient.id,
+                doctor_id=doctors[index % 2].id,
+                department_id=department.id,
+                appointment_date=date(2030, 1, 1 + index),
+                appointment_time=time(9, 0),
+            )
+            for index in range(5)
+        ]
+        session.add_all(appointments)
+        session.commit()
+        return {
+            "admin": (admin.id, admin.phone),
+            "department": department.id,
+            "doctor": doctors[0].id,
+            "appointment": appointments[0].id,
+        }
+
+
+@pytest_asyncio.fixture
+async def admin_headers(client, records):
+    """Authorization for the admin, with its principal already cached"""
+    user_id, phone = records["admin"]
+    token = TokenUtils.create_tokens(user_id, phone)["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    return headers
+
+
+@pytest.mark.asyncio
+async def test_department_detail(client, records):
+    response = await client.get(f"/api/v1/departments/{records['department']}")
+    assert response.status_code == 200
+    assert response.json()["doctors_count"] == 2
+    assert statement_count(response) == 1
+
+
+@pytest.mark.asyncio
+async def test_department_detail_not_found(client, records):
+    response = await client.get("/api/v1/departments/999999")
+    assert response.status_code == 404
+    assert statement_count(response) == 1
+
+
+@pytest.mark.asyncio
+async def test_doctor_detail(client, records):
+    response = await client.get(f"/api/v1/doctors/{records['doctor']}")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["user_name"] == "Dr 0"
+    assert body["department_name"] == "Cardiology"
+    assert body["appointments_count"] == 3
+    assert statement_count(response) == 1
+
+
+@pytest.mark.asyncio
+async def test_doctor_detail_not_found(client, records):
+    response = await client.get("/api/v1/doctors/999999")
+    assert response.status_code == 404
+    assert statement_count(response) == 1
+
+
+@pytest.mark.asyncio
+async def test_appointment_detail(client, admin_headers, records):
+    response = await client.get(f"/api/v1/appointments/{records['appointment']}", headers=admin_headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["patient_name"] == "Patient"
+    assert body["doctor_name"] == "Dr 0"
+    assert body["department_name"] == "Cardiology"
+    assert statement_count(response) <= 2
+
+
+@pytest.mark.asyncio
+async def test_appointment_detail_not_found(client, admin_headers, records):
+    response = await client.get("/api/v1/appointments/999999", headers=admin_headers)
+    assert response.status_code == 404
+    assert statement_count(response) <= 2